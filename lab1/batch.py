@@ -0,0 +1,277 @@
+import argparse
+import sys
+import time
+
+from rectangle import Rectangle, rectangle_from_string
+from set import set_from_string
+
+OUTPUT_BATCH_SIZE = 10000
+
+USAGE = """Operations, one per line ('#' outside quotes starts a comment):
+  rect new NAME X Y WIDTH HEIGHT      set new NAME {ELEMENTS}
+  rect union DEST A B                 set union DEST A B
+  rect intersect DEST A B             set intersect DEST A B
+  rect inc DEST A / rect dec DEST A   set diff DEST A B
+  rect move NAME DX DY                set add NAME ELEMENT
+  rect resize NAME WIDTH HEIGHT       set remove NAME ELEMENT
+  rect eq A B                         set contains NAME ELEMENT
+  rect show NAME                      set power DEST A
+                                      set size NAME / set show NAME"""
+
+
+def _strip_comment(line):
+    """Cutting a '#' comment off a line, keeping '#' inside quoted elements"""
+    if "#" not in line:
+        return line
+    quote = None
+    for position, char in enumerate(line):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#":
+            return line[:position]
+    return line
+
+
+class BatchSession:
+    """Executing rect/set operations on named rectangles and sets"""
+
+    def __init__(self):
+        self.rectangles = {}
+        self.sets = {}
+        self._operations = {
+            ("rect", "new"): self._rect_new,
+            ("rect", "union"): self._rect_union,
+            ("rect", "intersect"): self._rect_intersect,
+            ("rect", "inc"): self._rect_inc,
+            ("rect", "dec"): self._rect_dec,
+            ("rect", "move"): self._rect_move,
+            ("rect", "resize"): self._rect_resize,
+            ("rect", "eq"): self._rect_eq,
+            ("rect", "show"): self._rect_show,
+            ("set", "new"): self._set_new,
+            ("set", "union"): self._set_union,
+            ("set", "intersect"): self._set_intersect,
+            ("set", "diff"): self._set_diff,
+            ("set", "add"): self._set_add,
+            ("set", "remove"): self._set_remove,
+            ("set", "contains"): self._set_contains,
+            ("set", "power"): self._set_power,
+            ("set", "size"): self._set_size,
+            ("set", "show"): self._set_show,
+        }
+
+    def parse(self, line):
+        """Splitting a line into (operation key, handler, argument text), or None for blank lines"""
+        line = _strip_comment(line).strip()
+        if not line:
+            return None
+        parts = line.split(None, 2)
+        if len(parts) < 2:
+            raise ValueError(f"Incomplete operation: {line}")
+        key = (parts[0], parts[1])
+        handler = self._operations.get(key)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {parts[0]} {parts[1]}")
+        return key, handler, parts[2] if len(parts) > 2 else ""
+
+    def execute(self, line):
+        """Running one operation line and returning its output text or None"""
+        parsed = self.parse(line)
+        if parsed is None:
+            return None
+        _, handler, arguments = parsed
+        return handler(arguments)
+
+    def _names(self, arguments, count):
+        names = arguments.split()
+        if len(names) != count:
+            raise ValueError(f"Expected {count} arguments, got {len(names)}")
+        return names
+
+    def _rectangle(self, name):
+        rect = self.rectangles.get(name)
+        if rect is None:
+            raise KeyError(f"Unknown rectangle: {name}")
+        return rect
+
+    def _set(self, name):
+        found = self.sets.get(name)
+        if found is None:
+            raise KeyError(f"Unknown set: {name}")
+        return found
+
+    def _element(self, text):
+        text = text.strip()
+        if text.startswith("{"):
+            return set_from_string(text)
+        elements = list(set_from_string("{" + text + "}"))
+        if len(elements) != 1:
+            raise ValueError(f"Expected a single element: {text}")
+        return elements[0]
+
+    def _rect_new(self, arguments):
+        name, _, values = arguments.partition(" ")
+        if not name:
+            raise ValueError("Expected a rectangle name")
+        self.rectangles[name] = rectangle_from_string(values.strip())
+
+    def _rect_binary(self, arguments, operation):
+        dest, first, second = self._names(arguments, 3)
+        self.rectangles[dest] = operation(self._rectangle(first), self._rectangle(second))
+
+    def _rect_union(self, arguments):
+        self._rect_binary(arguments, Rectangle.__add__)
+
+    def _rect_intersect(self, arguments):
+        self._rect_binary(arguments, Rectangle.__sub__)
+
+    def _rect_inc(self, arguments):
+        dest, source = self._names(arguments, 2)
+        self.rectangles[dest] = +self._rectangle(source)
+
+    def _rect_dec(self, arguments):
+        dest, source = self._names(arguments, 2)
+        self.rectangles[dest] = -self._rectangle(source)
+
+    def _rect_move(self, arguments):
+        name, delta_x, delta_y = self._names(arguments, 3)
+        self._rectangle(name).move(int(delta_x), int(delta_y))
+
+    def _rect_resize(self, arguments):
+        name, width, height = self._names(arguments, 3)
+        self._rectangle(name).resize(int(width), int(height))
+
+    def _rect_eq(self, arguments):
+        first, second = self._names(arguments, 2)
+        return str(self._rectangle(first) == self._rectangle(second))
+
+    def _rect_show(self, arguments):
+        name, = self._names(arguments, 1)
+        return self._rectangle(name).to_string()
+
+    def _set_new(self, arguments):
+        name, _, text = arguments.partition(" ")
+        if not name:
+            raise ValueError("Expected a set name")
+        self.sets[name] = set_from_string(text.strip() or "{}")
+
+    def _set_binary(self, arguments, operation):
+        dest, first, second = self._names(arguments, 3)
+        self.sets[dest] = operation(self._set(first), self._set(second))
+
+    def _set_union(self, arguments):
+        self._set_binary(arguments, lambda first, second: first + second)
+
+    def _set_intersect(self, arguments):
+        self._set_binary(arguments, lambda first, second: first * second)
+
+    def _set_diff(self, arguments):
+        self._set_binary(arguments, lambda first, second: first - second)
+
+    def _set_add(self, arguments):
+        name, _, element = arguments.partition(" ")
+        self._set(name).add_element(self._element(element))
+
+    def _set_remove(self, arguments):
+        name, _, element = arguments.partition(" ")
+        self._set(name).remove_element(self._element(element))
+
+    def _set_contains(self, arguments):
+        name, _, element = arguments.partition(" ")
+        return str(self._element(element) in self._set(name))
+
+    def _set_power(self, arguments):
+        dest, source = self._names(arguments, 2)
+        self.sets[dest] = self._set(source).get_power_set()
+
+    def _set_size(self, arguments):
+        name, = self._names(arguments, 1)
+        return str(self._set(name).get_cardinality())
+
+    def _set_show(self, arguments):
+        name, = self._names(arguments, 1)
+        return str(self._set(name))
+
+
+def run_batch(lines, output, errors=None, stats=None, keep_going=True, session=None):
+    """Executing operation lines and writing their results to output in batches
+
+    Failing lines are reported to errors as 'line N: message'. When stats is
+    a dict it collects [count, seconds] per operation. Returns the number of
+    failed lines."""
+    if session is None:
+        session = BatchSession()
+    clock = time.perf_counter
+    pending = []
+    failures = 0
+    for number, line in enumerate(lines, 1):
+        try:
+            parsed = session.parse(line)
+            if parsed is None:
+                continue
+            key, handler, arguments = parsed
+            if stats is None:
+                result = handler(arguments)
+            else:
+                start = clock()
+                result = handler(arguments)
+                elapsed = clock() - start
+                entry = stats.get(key)
+                if entry is None:
+                    stats[key] = [1, elapsed]
+                else:
+                    entry[0] += 1
+                    entry[1] += elapsed
+        except (ValueError, KeyError, TypeError) as e:
+            failures += 1
+            if errors is not None:
+                message = e.args[0] if isinstance(e, KeyError) and e.args else e
+                errors.write(f"line {number}: {message}\n")
+            if not keep_going:
+                break
+            continue
+        if result is not None:
+            pending.append(result)
+            if len(pending) >= OUTPUT_BATCH_SIZE:
+                output.write("\n".join(pending) + "\n")
+                pending = []
+    if pending:
+        output.write("\n".join(pending) + "\n")
+    return failures
+
+
+def format_stats(stats):
+    """Per-operation throughput table for the --bench report"""
+    lines = [f"{'operation':>16} {'count':>10} {'total, s':>10} {'ops/sec':>14}"]
+    for (kind, name), (count, seconds) in sorted(stats.items()):
+        rate = count / seconds if seconds > 0 else float("inf")
+        lines.append(f"{kind + ' ' + name:>16} {count:>10} {seconds:>10.4f} {rate:>14,.0f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="main.py", description="Run lab1 Rectangle and Set operations in batch mode",
+        epilog=USAGE, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="operation files ('-' or nothing reads stdin)")
+    parser.add_argument("--bench", action="store_true", help="report per-operation throughput to stderr")
+    parser.add_argument("--stop-on-error", action="store_true", help="stop at the first failing line")
+    args = parser.parse_args(argv)
+    stats = {} if args.bench else None
+    session = BatchSession()
+    failures = 0
+    for path in args.files or ["-"]:
+        if path == "-":
+            failures += run_batch(sys.stdin, sys.stdout, sys.stderr, stats, not args.stop_on_error, session)
+        else:
+            with open(path, encoding="utf-8") as file:
+                failures += run_batch(file, sys.stdout, sys.stderr, stats, not args.stop_on_error, session)
+        if failures and args.stop_on_error:
+            break
+    sys.stdout.flush()
+    if stats is not None:
+        sys.stderr.write(format_stats(stats) + "\n")
+    return 1 if failures else 0
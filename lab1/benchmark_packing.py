@@ -0,0 +1,99 @@
+import math
+import random
+import sys
+import time
+
+from rectangle import Rectangle
+from rectangle_packing import pack_rectangles
+
+# Berkey and Wang style classes: (item side range, bin side)
+BERKEY_WANG_CLASSES = {
+    "I": ((1, 10), 10),
+    "II": ((1, 10), 30),
+    "III": ((1, 35), 40),
+    "IV": ((1, 35), 100),
+    "V": ((1, 100), 100),
+    "VI": ((1, 100), 300),
+}
+
+
+def measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def berkey_wang_dataset(name, count, seed=1):
+    (low, high), side = BERKEY_WANG_CLASSES[name]
+    rng = random.Random(seed)
+    return [Rectangle(0, 0, rng.randint(low, high), rng.randint(low, high)) for _ in range(count)], side, side
+
+
+def strip_dataset(count, wide, bin_side=1000, seed=1):
+    """Long thin items, lying flat when wide is True and standing otherwise"""
+    rng = random.Random(seed)
+    rectangles = []
+    for _ in range(count):
+        long_side = rng.randint(bin_side // 4, bin_side // 2)
+        short_side = rng.randint(1, bin_side // 20)
+        if wide:
+            rectangles.append(Rectangle(0, 0, long_side, short_side))
+        else:
+            rectangles.append(Rectangle(0, 0, short_side, long_side))
+    return rectangles, bin_side, bin_side
+
+
+def guillotine_dataset(count, bin_side=1000, seed=1):
+    """Items obtained by cutting whole bins, so a perfect packing is known to exist"""
+    rng = random.Random(seed)
+    pieces_per_bin = 256
+    bins = max(1, count // pieces_per_bin)
+    rectangles = []
+    for _ in range(bins):
+        pieces = [(0, 0, bin_side, bin_side)]
+        while len(pieces) < pieces_per_bin:
+            pieces.sort(key=lambda piece: piece[2] * piece[3])
+            x, y, width, height = pieces.pop()
+            if width >= height:
+                cut = rng.randint(1, width - 1)
+                pieces += [(x, y, cut, height), (x + cut, y, width - cut, height)]
+            else:
+                cut = rng.randint(1, height - 1)
+                pieces += [(x, y, width, cut), (x, y + cut, width, height - cut)]
+        rectangles += [Rectangle(0, 0, width, height) for _, _, width, height in pieces]
+    return rectangles, bin_side, bin_side
+
+
+def lower_bound(rectangles, bin_width, bin_height):
+    area = sum(rect.get_width() * rect.get_height() for rect in rectangles)
+    return math.ceil(area / (bin_width * bin_height))
+
+
+def datasets(count):
+    for name in BERKEY_WANG_CLASSES:
+        yield f"class {name}", berkey_wang_dataset(name, count)
+    yield "wide strips", strip_dataset(count, True)
+    yield "tall strips", strip_dataset(count, False)
+    yield "guillotine", guillotine_dataset(count)
+
+
+def benchmark_packing(count):
+    print("\n" + "=" * 50)
+    print(f" SKYLINE PACKING OF {count} ITEMS")
+    print("=" * 50)
+    print(f"{'dataset':>12} {'n':>7} {'bins':>6} {'bound':>6} {'util':>7} {'time, s':>9}")
+    for name, (rectangles, bin_width, bin_height) in datasets(count):
+        bound = lower_bound(rectangles, bin_width, bin_height)
+        pack_time, result = measure(lambda: pack_rectangles(rectangles, bin_width, bin_height))
+        print(f"{name:>12} {len(rectangles):>7} {result.get_bin_count():>6} {bound:>6} "
+              f"{result.get_utilization():>7.1%} {pack_time:>9.3f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    benchmark_packing(count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+from rectangle import Rectangle
+from rectangle_bounding_tree import BoundingTree
+from rectangle_cache import RectangleCache
+from rectangle_array import RectangleArray, np
+from rectangle_geometry import find_overlapping_pairs, union_area, coverage_decomposition
+from rectangle_index import RectangleIndex
+from rectangle_io import (read_rectangles, read_rectangle_array, write_rectangles,
+                          write_rectangles_binary, RectangleFile)
+
+
+def measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def random_rectangles(count, world=100000, max_size=100, seed=1):
+    rng = random.Random(seed)
+    return [Rectangle(rng.randint(0, world), rng.randint(0, world),
+                      rng.randint(1, max_size), rng.randint(1, max_size))
+            for _ in range(count)]
+
+
+def benchmark_index(count, query_count=1000):
+    print("\n" + "=" * 50)
+    print(f" RECTANGLE INDEX WITH {count} RECTANGLES")
+    print("=" * 50)
+    rectangles = random_rectangles(count)
+    queries = random_rectangles(query_count, max_size=1000, seed=2)
+    load_time, index = measure(lambda: RectangleIndex(rectangles))
+    overlap_time, found = measure(lambda: [len(index.query_overlap(query)) for query in queries])
+    point_time, _ = measure(lambda: [index.query_point(query.get_x(), query.get_y()) for query in queries])
+    naive_queries = queries[:10]
+    naive_time, _ = measure(lambda: [[rect for rect in rectangles if (rect - query) != Rectangle()]
+                                     for query in naive_queries])
+    extra = random_rectangles(query_count, seed=3)
+    insert_time, _ = measure(lambda: [index.insert(rect) for rect in extra])
+    move_time, _ = measure(lambda: [index.move(rect, 10, 10) for rect in extra])
+    remove_time, _ = measure(lambda: [index.remove(rect) for rect in extra])
+    print(f"bulk load:          {load_time:.3f} s")
+    print(f"overlap query:      {overlap_time / query_count * 1e6:.1f} us "
+          f"(avg {sum(found) / query_count:.1f} hits)")
+    print(f"naive overlap scan: {naive_time / len(naive_queries) * 1e6:.1f} us")
+    print(f"point query:        {point_time / query_count * 1e6:.1f} us")
+    print(f"insert:             {insert_time / query_count * 1e6:.1f} us")
+    print(f"move:               {move_time / query_count * 1e6:.1f} us")
+    print(f"remove:             {remove_time / query_count * 1e6:.1f} us")
+
+
+def benchmark_array(count):
+    print("\n" + "=" * 50)
+    print(f" OBJECTS VS RECTANGLEARRAY FOR {count} RECTANGLES")
+    print("=" * 50)
+    if np is None:
+        print("numpy is not installed, skipping")
+        return
+    rectangles = random_rectangles(count)
+    others = random_rectangles(count, seed=4)
+    convert_time, array = measure(lambda: RectangleArray.from_rectangles(rectangles))
+    other_array = RectangleArray.from_rectangles(others)
+    object_move, _ = measure(lambda: [rect.move(1, 1) for rect in rectangles])
+    array_move, _ = measure(lambda: array.move(1, 1))
+    object_union, _ = measure(lambda: [a + b for a, b in zip(rectangles, others)])
+    array_union, _ = measure(lambda: array + other_array)
+    object_intersection, _ = measure(lambda: [a - b for a, b in zip(rectangles, others)])
+    array_intersection, _ = measure(lambda: array - other_array)
+    print(f"{'operation':>14} {'objects, s':>12} {'array, s':>12}")
+    print(f"{'move':>14} {object_move:>12.4f} {array_move:>12.4f}")
+    print(f"{'union':>14} {object_union:>12.4f} {array_union:>12.4f}")
+    print(f"{'intersection':>14} {object_intersection:>12.4f} {array_intersection:>12.4f}")
+    print(f"from_rectangles: {convert_time:.4f} s")
+
+
+def naive_overlapping_pairs(rectangles):
+    pairs = []
+    empty = Rectangle()
+    for i in range(len(rectangles)):
+        for j in range(i + 1, len(rectangles)):
+            intersection = rectangles[i] - rectangles[j]
+            if intersection != empty:
+                pairs.append((i, j, intersection))
+    return pairs
+
+
+def benchmark_overlapping_pairs(sizes):
+    print("\n" + "=" * 50)
+    print(" ALL-PAIRS OVERLAP: NAIVE VS SWEEP LINE")
+    print("=" * 50)
+    print(f"{'n':>10} {'pairs':>10} {'naive, s':>12} {'sweep, s':>12}")
+    for n in sizes:
+        rectangles = random_rectangles(n, world=int(n ** 0.5 * 50))
+        sweep_time, pairs = measure(lambda: find_overlapping_pairs(rectangles))
+        if n <= 5000:
+            naive_time, _ = measure(lambda: naive_overlapping_pairs(rectangles))
+            naive = f"{naive_time:>12.4f}"
+        else:
+            naive = f"{'-':>12}"
+        print(f"{n:>10} {len(pairs):>10} {naive} {sweep_time:>12.4f}")
+
+
+def benchmark_union_area(sizes):
+    print("\n" + "=" * 50)
+    print(" UNION AREA AND COVERAGE DECOMPOSITION")
+    print("=" * 50)
+    print(f"{'n':>10} {'area, s':>10} {'decompose, s':>13} {'pieces':>10}")
+    for n in sizes:
+        rectangles = random_rectangles(n, world=int(n ** 0.5 * 50))
+        area_time, _ = measure(lambda: union_area(rectangles))
+        decompose_time, pieces = measure(lambda: coverage_decomposition(rectangles))
+        print(f"{n:>10} {area_time:>10.4f} {decompose_time:>13.4f} {len(pieces):>10}")
+
+
+def allocated_blocks_per_op(operation, number):
+    results = [None] * number
+    before = sys.getallocatedblocks()
+    for i in range(number):
+        results[i] = operation()
+    return (sys.getallocatedblocks() - before) / number
+
+
+def benchmark_operators(number=200000):
+    print("\n" + "=" * 50)
+    print(" RECTANGLE OPERATOR MICRO-BENCHMARKS")
+    print("=" * 50)
+    rect1 = Rectangle(0, 0, 4, 4)
+    rect2 = Rectangle(2, 2, 4, 4)
+    far = Rectangle(100, 100, 1, 1)
+    target = Rectangle(0, 0, 4, 4)
+
+    def in_place_union():
+        target.__iadd__(rect2)
+        return target
+
+    def in_place_intersection():
+        target.__isub__(rect1)
+        return target
+
+    operations = [
+        ("Rectangle()", lambda: Rectangle()),
+        ("a + b", lambda: rect1 + rect2),
+        ("a - b", lambda: rect1 - rect2),
+        ("a - b (empty)", lambda: rect1 - far),
+        ("a += b", in_place_union),
+        ("a -= b", in_place_intersection),
+        ("a.intersects(b)", lambda: rect1.intersects(far)),
+        ("+a", lambda: +rect1),
+        ("-a", lambda: -rect1),
+        ("a == b", lambda: rect1 == rect2),
+        ("a.move(0, 0)", lambda: rect1.move(0, 0)),
+        ("a.copy()", lambda: rect1.copy()),
+    ]
+    print(f"{'operation':>18} {'ops/sec':>14} {'blocks/op':>10}")
+    for name, operation in operations:
+        seconds = min(timeit.repeat(operation, number=number, repeat=3))
+        blocks = allocated_blocks_per_op(operation, number)
+        print(f"{name:>18} {number / seconds:>14,.0f} {blocks:>10.2f}")
+
+
+def benchmark_text_io(count):
+    print("\n" + "=" * 50)
+    print(f" TEXT I/O OF {count} RECTANGLES")
+    print("=" * 50)
+    rectangles = random_rectangles(count)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rectangles.txt")
+        write_time, _ = measure(lambda: write_rectangles(rectangles, path))
+        megabytes = os.path.getsize(path) / 1e6
+        read_time, _ = measure(lambda: read_rectangles(path))
+        print(f"write:            {megabytes / write_time:>8.1f} MB/s")
+        print(f"read to list:     {megabytes / read_time:>8.1f} MB/s")
+        if np is not None:
+            array_time, _ = measure(lambda: read_rectangle_array(path))
+            print(f"read to array:    {megabytes / array_time:>8.1f} MB/s")
+        with open(path) as file:
+            lines = file.readlines()
+        parser = Rectangle()
+        legacy_time, _ = measure(lambda: [parser.from_string(line.rstrip("\n")) for line in lines])
+        print(f"from_string loop: {megabytes / legacy_time:>8.1f} MB/s")
+
+
+def benchmark_binary_io(count):
+    print("\n" + "=" * 50)
+    print(f" BINARY SNAPSHOT OF {count} RECTANGLES")
+    print("=" * 50)
+    rectangles = random_rectangles(count)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rectangles.bin")
+        write_time, _ = measure(lambda: write_rectangles_binary(rectangles, path))
+        megabytes = os.path.getsize(path) / 1e6
+        open_time, rectangle_file = measure(lambda: RectangleFile(path))
+        access_time, _ = measure(lambda: [rectangle_file[i] for i in range(0, count, max(count // 1000, 1))])
+        print(f"write:            {megabytes / write_time:>8.1f} MB/s")
+        print(f"open (mmap):      {open_time * 1e3:>8.3f} ms")
+        print(f"random access:    {access_time * 1e6 / min(count, 1000):>8.2f} us/record")
+        if np is not None:
+            columns_time, columns = measure(rectangle_file.get_columns)
+            print(f"column views:     {columns_time * 1e3:>8.3f} ms")
+            del columns
+        rectangle_file.close()
+
+
+def benchmark_cache(count, distinct=1000):
+    print("\n" + "=" * 50)
+    print(f" INTERNED RECTANGLES ({count} UNIONS OF {distinct} DISTINCT PAIRS)")
+    print("=" * 50)
+    shapes = random_rectangles(distinct)
+    rng = random.Random(4)
+    distinct_pairs = [(shapes[rng.randrange(distinct)], shapes[rng.randrange(distinct)])
+                      for _ in range(distinct)]
+    pairs = [distinct_pairs[rng.randrange(distinct)] for _ in range(count)]
+    cache = RectangleCache()
+    plain_time, _ = measure(lambda: [a + b for a, b in pairs])
+    cached_time, unions = measure(lambda: [cache.union(a, b) for a, b in pairs])
+    stats = cache.get_stats()
+    print(f"a + b:             {plain_time / count * 1e9:>8.1f} ns/op")
+    print(f"cache.union(a, b): {cached_time / count * 1e9:>8.1f} ns/op")
+    print(f"memo hits/misses:  {stats['memo_hits']} / {stats['memo_misses']}")
+    print(f"shared instances:  {len(set(map(id, unions)))} for {count} results")
+
+
+def recompute_total(rectangles):
+    total = rectangles[0].copy()
+    for rect in rectangles:
+        total += rect
+    return total
+
+
+def benchmark_bounding_tree(count, update_count=1000):
+    print("\n" + "=" * 50)
+    print(f" BOUNDING BOX OF {count} RECTANGLES UNDER UPDATES")
+    print("=" * 50)
+    rectangles = random_rectangles(count)
+    build_time, tree = measure(lambda: BoundingTree(rectangles))
+    rng = random.Random(5)
+    movers = [rectangles[rng.randrange(count)] for _ in range(update_count)]
+    move_time, _ = measure(lambda: [tree.move(rect, 1, 1) for rect in movers])
+    victims = list({id(rect): rect for rect in movers}.values())
+    remove_time, _ = measure(lambda: [tree.remove(rect) for rect in victims])
+    insert_time, _ = measure(lambda: [tree.insert(rect) for rect in victims])
+    naive_updates = min(update_count, 10)
+    naive_time, _ = measure(lambda: [recompute_total(rectangles) for _ in range(naive_updates)])
+    print(f"build:               {build_time:.3f} s")
+    print(f"move:                {move_time / update_count * 1e6:.1f} us")
+    print(f"remove:              {remove_time / len(victims) * 1e6:.1f} us")
+    print(f"insert:              {insert_time / len(victims) * 1e6:.1f} us")
+    print(f"recompute with +=:   {naive_time / naive_updates * 1e6:.1f} us")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    benchmark_operators()
+    benchmark_index(count)
+    benchmark_array(count)
+    benchmark_text_io(count)
+    benchmark_binary_io(count)
+    benchmark_cache(count)
+    benchmark_bounding_tree(count)
+    sizes = sorted(set(size for size in (1000, 5000, 100000, count) if size <= count))
+    benchmark_overlapping_pairs(sizes)
+    benchmark_union_area(sizes)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import sys
+import time
+import tracemalloc
+
+from set import Set, BitSet
+
+
+def measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def benchmark_construction_and_membership(sizes):
+    print("\n" + "=" * 50)
+    print(" CONSTRUCTION AND MEMBERSHIP")
+    print("=" * 50)
+    print(f"{'n':>10} {'build, s':>12} {'in, s':>12} {'ns/elem':>10}")
+    for n in sizes:
+        build_time, test_set = measure(lambda: Set(range(n)))
+        probe_time, _ = measure(lambda: sum(1 for i in range(0, 2 * n, 2) if i in test_set))
+        per_element = (build_time + probe_time) / n * 1e9
+        print(f"{n:>10} {build_time:>12.4f} {probe_time:>12.4f} {per_element:>10.1f}")
+
+
+def benchmark_set_algebra(sizes):
+    print("\n" + "=" * 50)
+    print(" UNION / INTERSECTION / DIFFERENCE")
+    print("=" * 50)
+    print(f"{'n':>10} {'union, s':>12} {'inter, s':>12} {'diff, s':>12}")
+    for n in sizes:
+        set1 = Set(range(n))
+        set2 = Set(range(n // 2, n + n // 2))
+        union_time, _ = measure(lambda: set1 + set2)
+        intersection_time, _ = measure(lambda: set1 * set2)
+        difference_time, _ = measure(lambda: set1 - set2)
+        print(f"{n:>10} {union_time:>12.4f} {intersection_time:>12.4f} {difference_time:>12.4f}")
+
+
+def benchmark_n_ary(count, size):
+    print("\n" + "=" * 50)
+    print(f" N-ARY UNION OF {count} SETS OF {size}")
+    print("=" * 50)
+    sets = [Set(range(i, i + size)) for i in range(count)]
+
+    def reduce_union():
+        result = Set()
+        for other in sets:
+            result = result + other
+        return result
+
+    reduce_time, _ = measure(reduce_union)
+    union_all_time, _ = measure(lambda: Set.union_all(sets))
+    intersect_all_time, _ = measure(lambda: Set.intersect_all(sets))
+    print(f"reduce(+):      {reduce_time:.4f} s")
+    print(f"union_all:      {union_all_time:.4f} s")
+    print(f"intersect_all:  {intersect_all_time:.4f} s")
+
+
+def measure_memory(func):
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def benchmark_bitset(sizes):
+    print("\n" + "=" * 50)
+    print(" LIST-BACKED SET VS BITSET")
+    print("=" * 50)
+    print(f"{'n':>10} {'Set, MB':>10} {'BitSet, MB':>11} {'Set +*-, s':>11} {'BitSet +*-, s':>14}")
+    for n in sizes:
+        set_memory, set1 = measure_memory(lambda: Set(range(0, 2 * n, 2)))
+        bit_memory, bit1 = measure_memory(lambda: BitSet(range(0, 2 * n, 2)))
+        set2 = Set(range(0, 3 * n, 3))
+        bit2 = BitSet(range(0, 3 * n, 3))
+        set_time, _ = measure(lambda: (set1 + set2, set1 * set2, set1 - set2))
+        bit_time, _ = measure(lambda: (bit1 + bit2, bit1 * bit2, bit1 - bit2))
+        print(f"{n:>10} {set_memory / 1e6:>10.2f} {bit_memory / 1e6:>11.3f} "
+              f"{set_time:>11.4f} {bit_time:>14.5f}")
+
+
+def benchmark_allocation(count):
+    print("\n" + "=" * 50)
+    print(f" ALLOCATING {count} SMALL SETS")
+    print("=" * 50)
+    build_time, sets = measure(lambda: [Set([i, i + 1]) for i in range(count)])
+    release_time, _ = measure(lambda: sets.clear())
+    memory, sets = measure_memory(lambda: [Set([i, i + 1]) for i in range(count)])
+    print(f"build:    {build_time:.4f} s ({count / build_time:,.0f} sets/s)")
+    print(f"release:  {release_time:.4f} s")
+    print(f"memory:   {memory / count:.0f} bytes/set")
+
+
+def benchmark_removal(sizes):
+    print("\n" + "=" * 50)
+    print(" REMOVING 90% OF A SET")
+    print("=" * 50)
+    print(f"{'n':>10} {'remove_element, s':>18} {'remove_many, s':>15} {'discard_if, s':>14}")
+    for n in sizes:
+        doomed = [i for i in range(n) if i % 10]
+        test_set = Set(range(n))
+        single_time, _ = measure(lambda: [test_set.remove_element(i) for i in doomed])
+        test_set = Set(range(n))
+        many_time, _ = measure(lambda: test_set.remove_many(doomed))
+        test_set = Set(range(n))
+        predicate_time, _ = measure(lambda: test_set.discard_if(lambda i: i % 10))
+        print(f"{n:>10} {single_time:>18.4f} {many_time:>15.4f} {predicate_time:>14.4f}")
+
+
+class BaselineSet:
+    """List-backed storage and recursive parser of the baseline Set, reproduced
+    from it for comparison"""
+    MAX_NESTING_LEVEL = 100
+
+    def __init__(self):
+        self._elements = []
+
+    def _contains_element(self, element):
+        for elem in self._elements:
+            if self._elements_equal(elem, element):
+                return True
+        return False
+
+    def _elements_equal(self, elem1, elem2):
+        if isinstance(elem1, BaselineSet) and isinstance(elem2, BaselineSet):
+            return elem1 is elem2
+        else:
+            return elem1 == elem2
+
+    def add_element(self, element):
+        if not self._contains_element(element):
+            self._elements.append(element)
+
+    def from_string(self, string_repr):
+        return self._parse_from_string(string_repr.strip())
+
+    def _parse_from_string(self, string_repr, level=0):
+        if level > BaselineSet.MAX_NESTING_LEVEL:
+            raise ValueError("Maximum nesting level exceeded")
+        string_repr = string_repr.strip()
+        if not (string_repr.startswith('{') and string_repr.endswith('}')):
+            raise ValueError("Set must be enclosed in curly braces")
+        content = string_repr[1:-1].strip()
+        result = BaselineSet()
+        if not content:
+            return result
+        brace_count = 0
+        current_element = []
+        for char in content:
+            brace_count, current_element = self._process_char(
+                char, brace_count, current_element, result, level
+            )
+        self._process_element(current_element, result, level)
+        return result
+
+    def _process_char(self, char, brace_count, current_element, result_set, level):
+        if char == '{':
+            brace_count += 1
+            current_element.append(char)
+        elif char == '}':
+            brace_count -= 1
+            current_element.append(char)
+        elif char == ',' and brace_count == 0:
+            self._process_element(current_element, result_set, level)
+            current_element = []
+        else:
+            current_element.append(char)
+        return brace_count, current_element
+
+    def _process_element(self, element_chars, result_set, level):
+        element_str = ''.join(element_chars).strip()
+        if element_str:
+            result_set.add_element(self._create_element_from_string(element_str, level))
+
+    def _create_element_from_string(self, element_str, level):
+        if element_str.startswith('{'):
+            return self._parse_from_string(element_str, level + 1)
+        simple_element = element_str.strip()
+        if simple_element.isdigit() or (simple_element[0] == '-' and simple_element[1:].isdigit()):
+            return int(simple_element)
+        if (len(simple_element) >= 2 and
+                ((simple_element[0] == "'" and simple_element[-1] == "'") or
+                 (simple_element[0] == '"' and simple_element[-1] == '"'))):
+            return simple_element[1:-1]
+        return simple_element
+
+
+# The baseline parser is quadratic on flat input and refuses nesting beyond
+# MAX_NESTING_LEVEL, so it is only timed on inputs it can finish
+BASELINE_MAX_ELEMENTS = 10000
+
+
+def baseline_parse(text, elements, depth):
+    if elements > BASELINE_MAX_ELEMENTS or depth > BaselineSet.MAX_NESTING_LEVEL:
+        return None
+    return measure(lambda: BaselineSet().from_string(text))[0]
+
+
+def benchmark_parser(sizes):
+    print("\n" + "=" * 50)
+    print(" PARSING: BASELINE RECURSIVE VS SINGLE PASS")
+    print("=" * 50)
+    print(f"{'input':>20} {'baseline, s':>12} {'new, s':>12} {'MB/s':>8}")
+    inputs = []
+    for n in sizes:
+        inputs.append(("flat " + str(n), "{" + ", ".join(str(i) for i in range(n)) + "}", n, 1))
+    for depth in (100, 300, 900):
+        inputs.append(("depth " + str(depth), "{" * depth + "1" + "}" * depth, 1, depth))
+    for name, text, elements, depth in inputs:
+        baseline_time = baseline_parse(text, elements, depth)
+        baseline_column = f"{baseline_time:>12.4f}" if baseline_time is not None else f"{'-':>12}"
+        new_time, _ = measure(lambda: Set().from_string(text))
+        throughput = len(text) / new_time / 1e6 if new_time else 0
+        print(f"{name:>20} {baseline_column} {new_time:>12.4f} {throughput:>8.1f}")
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    sizes = []
+    n = 1000
+    while n <= max_size:
+        sizes.append(n)
+        n *= 10
+    benchmark_construction_and_membership(sizes)
+    benchmark_set_algebra(sizes)
+    benchmark_n_ary(1000, 100)
+    benchmark_parser(sizes)
+    benchmark_bitset(sizes)
+    benchmark_removal(sizes)
+    benchmark_allocation(max_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from set import Set, set_from_string, create_empty_set, create_set_from_elements
 import sys
 import os
 import subprocess
+import batch
 
 def display_menu():
     print("\n" + "="*50)
@@ -579,4 +580,6 @@ def main():
             print("❌ Invalid option. Please choose 1-7.")
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(batch.main(sys.argv[1:]))
     main()
\ No newline at end of file
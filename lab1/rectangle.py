@@ -1,4 +1,10 @@
+import re
+
+_INTEGER = re.compile(r"[+-]?[0-9]+")
+
+
 class Rectangle:
+    __slots__ = ("_x", "_y", "_width", "_height")
     DEFAULT_COORDINATE = 0
     DEFAULT_DIMENSION = 1
 
@@ -23,12 +29,6 @@ class Rectangle:
             self._y += self._height
             self._height = -self._height
 
-    def _min(self, a, b):
-        return a if a < b else b
-
-    def _max(self, a, b):
-        return a if a > b else b
-
     def get_x(self):
         return self._x
 
@@ -41,6 +41,9 @@ class Rectangle:
     def get_height(self):
         return self._height
 
+    def get_bounds(self):
+        return (self._x, self._y, self._x + self._width, self._y + self._height)
+
     def get_vertices(self):
         return [
             (self._x, self._y),
@@ -66,49 +69,63 @@ class Rectangle:
         new_height = self._height - 1 if self._height > 1 else 1
         return Rectangle(self._x, self._y, new_width, new_height)
 
+    def _union_bounds(self, other):
+        min_x = self._x if self._x < other._x else other._x
+        min_y = self._y if self._y < other._y else other._y
+        right = self._x + self._width
+        other_right = other._x + other._width
+        top = self._y + self._height
+        other_top = other._y + other._height
+        max_x = right if right > other_right else other_right
+        max_y = top if top > other_top else other_top
+        return min_x, min_y, max_x - min_x, max_y - min_y
+
+    def _intersection_bounds(self, other):
+        """Intersection as (x, y, width, height), or None if it has no area"""
+        left = self._x if self._x > other._x else other._x
+        bottom = self._y if self._y > other._y else other._y
+        right = self._x + self._width
+        other_right = other._x + other._width
+        if other_right < right:
+            right = other_right
+        top = self._y + self._height
+        other_top = other._y + other._height
+        if other_top < top:
+            top = other_top
+        if right <= left or top <= bottom:
+            return None
+        return left, bottom, right - left, top - bottom
+
+    def intersects(self, other):
+        """Checking whether the intersection has a positive area"""
+        return self._intersection_bounds(other) is not None
+
     def __add__(self, other):
         if not isinstance(other, Rectangle):
             return NotImplemented
-
-        min_x = self._min(self._x, other._x)
-        min_y = self._min(self._y, other._y)
-        max_x = self._max(self._x + self._width, other._x + other._width)
-        max_y = self._max(self._y + self._height, other._y + other._height)
-
-        return Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
+        return Rectangle(*self._union_bounds(other))
 
     def __iadd__(self, other):
         if not isinstance(other, Rectangle):
             return NotImplemented
-
-        result = self + other
-        self._x, self._y, self._width, self._height = (
-            result._x, result._y, result._width, result._height
-        )
+        self._x, self._y, self._width, self._height = self._union_bounds(other)
         return self
 
     def __sub__(self, other):
         if not isinstance(other, Rectangle):
             return NotImplemented
-
-        left = self._max(self._x, other._x)
-        bottom = self._max(self._y, other._y)
-        right = self._min(self._x + self._width, other._x + other._width)
-        top = self._min(self._y + self._height, other._y + other._height)
-
-        if right <= left or top <= bottom:
+        bounds = self._intersection_bounds(other)
+        if bounds is None:
             return Rectangle()
-
-        return Rectangle(left, bottom, right - left, top - bottom)
+        return Rectangle(*bounds)
 
     def __isub__(self, other):
         if not isinstance(other, Rectangle):
             return NotImplemented
-
-        result = self - other
-        self._x, self._y, self._width, self._height = (
-            result._x, result._y, result._width, result._height
-        )
+        bounds = self._intersection_bounds(other)
+        if bounds is None:
+            bounds = _EMPTY_BOUNDS
+        self._x, self._y, self._width, self._height = bounds
         return self
 
     def __eq__(self, other):
@@ -128,52 +145,12 @@ class Rectangle:
 
     def from_string(self, string_repr):
         """Creating a rectangle from a string"""
-        try:
-
-            parts = []
-            current = ""
-            for char in string_repr:
-                if char == ' ':
-                    if current:
-                        parts.append(current)
-                    current = ""
-                else:
-                    current += char
-            if current:
-                parts.append(current)
-
-            if len(parts) != 4:
-                raise ValueError("String must contain exactly 4 numbers")
-
-
-            def str_to_int(s):
-                result = 0
-                sign = 1
-                start = 0
-
-                if s and s[0] == '-':
-                    sign = -1
-                    start = 1
-                elif s and s[0] == '+':
-                    start = 1
-
-                for i in range(start, len(s)):
-                    digit = ord(s[i]) - ord('0')
-                    if 0 <= digit <= 9:
-                        result = result * 10 + digit
-                    else:
-                        raise ValueError(f"Invalid number: {s}")
-
-                return result * sign
-
-            x = str_to_int(parts[0])
-            y = str_to_int(parts[1])
-            width = str_to_int(parts[2])
-            height = str_to_int(parts[3])
-
-            return self.__class__(x, y, width, height)
-        except Exception as e:
-            raise ValueError(f"Invalid rectangle string: {string_repr}") from e
+        parts = string_repr.split(' ')
+        numbers = [part for part in parts if part]
+        if len(numbers) != 4 or not all(_INTEGER.fullmatch(number) for number in numbers):
+            raise ValueError(f"Invalid rectangle string: {string_repr}")
+        x, y, width, height = map(int, numbers)
+        return self.__class__(x, y, width, height)
 
     def create_from_string(self, string_repr):
         """Creating a new rectangle from a string"""
@@ -181,36 +158,74 @@ class Rectangle:
 
     def to_string(self):
         """Converting a rectangle to a string"""
-        def int_to_str(n):
-            if n == 0:
-                return "0"
-
-            result = ""
-            negative = n < 0
-            n = abs(n)
-
-            while n > 0:
-                digit = n % 10
-                result = chr(ord('0') + digit) + result
-                n = n // 10
-
-            return "-" + result if negative else result
-
-        return f"{int_to_str(self._x)} {int_to_str(self._y)} {int_to_str(self._width)} {int_to_str(self._height)}"
+        return f"{self._x} {self._y} {self._width} {self._height}"
 
     def copy(self):
         return Rectangle(self._x, self._y, self._width, self._height)
 
+    def freeze(self):
+        """Immutable hashable copy of the rectangle"""
+        return FrozenRectangle(self._x, self._y, self._width, self._height)
+
     def __copy__(self):
         return self.copy()
 
     def __deepcopy__(self, memo):
         return self.copy()
 
-    def rectangle_from_string(string_repr):
-        """Creating a rectangle from a string (external function)"""
-        return Rectangle().from_string(string_repr)
 
-    def create_rectangle_default():
-        """Create a rectangle with default settings"""
-        return Rectangle()
+def rectangle_from_string(string_repr):
+    """Creating a rectangle from a string (external function)"""
+    return Rectangle().from_string(string_repr)
+
+
+def create_rectangle_default():
+    """Create a rectangle with default settings"""
+    return Rectangle()
+
+
+class FrozenRectangle(Rectangle):
+    """Immutable hashable rectangle that can be shared between owners"""
+    __slots__ = ("__weakref__",)
+
+    def __hash__(self):
+        return hash((self._x, self._y, self._width, self._height))
+
+    def _immutable(self, *args):
+        raise TypeError("FrozenRectangle is immutable")
+
+    move = _immutable
+    resize = _immutable
+
+    def __pos__(self):
+        return super().__pos__().freeze()
+
+    def __neg__(self):
+        return super().__neg__().freeze()
+
+    def __add__(self, other):
+        result = super().__add__(other)
+        return result if result is NotImplemented else result.freeze()
+
+    def __sub__(self, other):
+        result = super().__sub__(other)
+        return result if result is NotImplemented else result.freeze()
+
+    def __iadd__(self, other):
+        return self + other
+
+    def __isub__(self, other):
+        return self - other
+
+    def __repr__(self):
+        return f"FrozenRectangle({self._x}, {self._y}, {self._width}, {self._height})"
+
+    def freeze(self):
+        return self
+
+    def copy(self):
+        return self
+
+
+_EMPTY_BOUNDS = (Rectangle.DEFAULT_COORDINATE, Rectangle.DEFAULT_COORDINATE,
+                 Rectangle.DEFAULT_DIMENSION, Rectangle.DEFAULT_DIMENSION)
@@ -0,0 +1,158 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from rectangle import Rectangle
+
+
+class RectangleArray:
+    """Rectangles stored column-wise in NumPy arrays for vectorized geometry"""
+
+    def __init__(self, x, y, width, height):
+        if np is None:
+            raise ImportError("RectangleArray requires numpy: pip install numpy")
+        x, y, width, height = np.broadcast_arrays(
+            np.asarray(x), np.asarray(y), np.asarray(width), np.asarray(height))
+        dtype = np.result_type(x, y, width, height)
+        self._x = np.array(x, dtype=dtype)
+        self._y = np.array(y, dtype=dtype)
+        self._width = np.array(width, dtype=dtype)
+        self._height = np.array(height, dtype=dtype)
+        self.normalize()
+
+    @classmethod
+    def from_rectangles(cls, rectangles):
+        """Building an array from a list of Rectangle objects"""
+        bounds = [(rect.get_x(), rect.get_y(), rect.get_width(), rect.get_height())
+                  for rect in rectangles]
+        if not bounds:
+            return cls([], [], [], [])
+        columns = np.array(bounds)
+        return cls(columns[:, 0], columns[:, 1], columns[:, 2], columns[:, 3])
+
+    def to_rectangles(self):
+        """Converting the array back to a list of Rectangle objects"""
+        return [Rectangle(x, y, width, height) for x, y, width, height in zip(
+            self._x.tolist(), self._y.tolist(), self._width.tolist(), self._height.tolist())]
+
+    def get_x(self):
+        return self._x
+
+    def get_y(self):
+        return self._y
+
+    def get_width(self):
+        return self._width
+
+    def get_height(self):
+        return self._height
+
+    def __len__(self):
+        return len(self._x)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Rectangle(self._x[index].item(), self._y[index].item(),
+                             self._width[index].item(), self._height[index].item())
+        return RectangleArray(self._x[index], self._y[index],
+                              self._width[index], self._height[index])
+
+    def __iter__(self):
+        return iter(self.to_rectangles())
+
+    def normalize(self):
+        negative = self._width < 0
+        self._x[negative] += self._width[negative]
+        self._width[negative] = -self._width[negative]
+        negative = self._height < 0
+        self._y[negative] += self._height[negative]
+        self._height[negative] = -self._height[negative]
+
+    def _upcast(self, *values):
+        """Widening the columns' dtype so that values fit, e.g. float deltas on int columns"""
+        dtype = np.result_type(self._x, *(value if np.isscalar(value) else np.asarray(value)
+                                          for value in values))
+        if dtype != self._x.dtype:
+            self._x = self._x.astype(dtype)
+            self._y = self._y.astype(dtype)
+            self._width = self._width.astype(dtype)
+            self._height = self._height.astype(dtype)
+
+    def move(self, delta_x, delta_y):
+        self._upcast(delta_x, delta_y)
+        self._x += delta_x
+        self._y += delta_y
+
+    def resize(self, new_width, new_height):
+        self._upcast(new_width, new_height)
+        self._width[...] = new_width
+        self._height[...] = new_height
+        self.normalize()
+
+    def areas(self):
+        return self._width * self._height
+
+    def get_vertices(self):
+        """Vertices of every rectangle as an (n, 4, 2) array"""
+        right = self._x + self._width
+        top = self._y + self._height
+        return np.stack([
+            np.stack([self._x, self._y], axis=-1),
+            np.stack([right, self._y], axis=-1),
+            np.stack([right, top], axis=-1),
+            np.stack([self._x, top], axis=-1),
+        ], axis=1)
+
+    def _columns(self, other):
+        """Bounds of other (RectangleArray or Rectangle) ready for broadcasting"""
+        if isinstance(other, RectangleArray):
+            return other._x, other._y, other._x + other._width, other._y + other._height
+        if isinstance(other, Rectangle):
+            return other.get_bounds()
+        raise TypeError("Expected a RectangleArray or a Rectangle")
+
+    def union(self, other):
+        """Pairwise or broadcast bounding boxes, as Rectangle.__add__"""
+        x1, y1, x2, y2 = self._columns(other)
+        min_x = np.minimum(self._x, x1)
+        min_y = np.minimum(self._y, y1)
+        max_x = np.maximum(self._x + self._width, x2)
+        max_y = np.maximum(self._y + self._height, y2)
+        return RectangleArray(min_x, min_y, max_x - min_x, max_y - min_y)
+
+    def intersection(self, other):
+        """Pairwise or broadcast intersections, as Rectangle.__sub__"""
+        x1, y1, x2, y2 = self._columns(other)
+        left = np.maximum(self._x, x1)
+        bottom = np.maximum(self._y, y1)
+        right = np.minimum(self._x + self._width, x2)
+        top = np.minimum(self._y + self._height, y2)
+        empty = (right <= left) | (top <= bottom)
+        return RectangleArray(
+            np.where(empty, Rectangle.DEFAULT_COORDINATE, left),
+            np.where(empty, Rectangle.DEFAULT_COORDINATE, bottom),
+            np.where(empty, Rectangle.DEFAULT_DIMENSION, right - left),
+            np.where(empty, Rectangle.DEFAULT_DIMENSION, top - bottom))
+
+    def overlaps(self, other):
+        """Boolean mask of pairs whose intersection has a positive area"""
+        x1, y1, x2, y2 = self._columns(other)
+        return ((np.minimum(self._x + self._width, x2) > np.maximum(self._x, x1)) &
+                (np.minimum(self._y + self._height, y2) > np.maximum(self._y, y1)))
+
+    def __add__(self, other):
+        if not isinstance(other, (RectangleArray, Rectangle)):
+            return NotImplemented
+        return self.union(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, (RectangleArray, Rectangle)):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __repr__(self):
+        return f"RectangleArray(rectangles={len(self)})"
+
+    def copy(self):
+        return RectangleArray(self._x, self._y, self._width, self._height)
@@ -0,0 +1,158 @@
+from rectangle import Rectangle
+
+
+def _merge(bounds1, bounds2):
+    if bounds1 is None:
+        return bounds2
+    if bounds2 is None:
+        return bounds1
+    return (bounds1[0] if bounds1[0] < bounds2[0] else bounds2[0],
+            bounds1[1] if bounds1[1] < bounds2[1] else bounds2[1],
+            bounds1[2] if bounds1[2] > bounds2[2] else bounds2[2],
+            bounds1[3] if bounds1[3] > bounds2[3] else bounds2[3])
+
+
+class BoundingTree:
+    """Bounding box of a dynamic collection of Rectangles maintained in O(log n)
+
+    The tree is a complete binary tree stored in a flat list: node i has the
+    children 2i and 2i + 1, the root is node 1 and the rectangles sit in the
+    leaves. Every node holds the (x1, y1, x2, y2) bounds of its subtree, or
+    None when the subtree is empty."""
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, rectangles=None):
+        self._slots = {}
+        self._free = []
+        self._rectangles = []
+        self._capacity = 0
+        self._nodes = []
+        rectangles = list(rectangles) if rectangles is not None else []
+        self._rebuild(max(self.INITIAL_CAPACITY, len(rectangles)), rectangles)
+
+    def _rebuild(self, capacity, rectangles):
+        """Laying the rectangles out in the leaves and filling the inner nodes bottom-up"""
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._capacity = size
+        self._nodes = [None] * (2 * size)
+        self._rectangles = [None] * size
+        self._slots = {}
+        for slot, rect in enumerate(rectangles):
+            if id(rect) in self._slots:
+                raise ValueError("Rectangle is already in the tree")
+            self._slots[id(rect)] = slot
+            self._rectangles[slot] = rect
+            self._nodes[size + slot] = rect.get_bounds()
+        self._free = list(range(size - 1, len(rectangles) - 1, -1))
+        nodes = self._nodes
+        for node in range(size - 1, 0, -1):
+            nodes[node] = _merge(nodes[2 * node], nodes[2 * node + 1])
+
+    def _refresh(self, slot):
+        """Recomputing the bounds on the path from a leaf to the root"""
+        nodes = self._nodes
+        node = (self._capacity + slot) >> 1
+        while node:
+            bounds = _merge(nodes[2 * node], nodes[2 * node + 1])
+            if bounds == nodes[node]:
+                return
+            nodes[node] = bounds
+            node >>= 1
+
+    def insert(self, rect):
+        """Adding a rectangle to the tree"""
+        if id(rect) in self._slots:
+            raise ValueError("Rectangle is already in the tree")
+        if not self._free:
+            self._rebuild(2 * self._capacity, list(self))
+        slot = self._free.pop()
+        self._slots[id(rect)] = slot
+        self._rectangles[slot] = rect
+        self._nodes[self._capacity + slot] = rect.get_bounds()
+        self._refresh(slot)
+
+    def remove(self, rect):
+        """Removing a rectangle from the tree"""
+        slot = self._slots.pop(id(rect), None)
+        if slot is None:
+            raise KeyError("Rectangle is not in the tree")
+        self._rectangles[slot] = None
+        self._nodes[self._capacity + slot] = None
+        self._free.append(slot)
+        self._refresh(slot)
+
+    def update(self, rect):
+        """Refreshing the bounds of a rectangle whose coordinates were changed"""
+        slot = self._slots.get(id(rect))
+        if slot is None:
+            raise KeyError("Rectangle is not in the tree")
+        self._nodes[self._capacity + slot] = rect.get_bounds()
+        self._refresh(slot)
+
+    def move(self, rect, delta_x, delta_y):
+        """Moving a rectangle of the tree and updating the bounds"""
+        if id(rect) not in self._slots:
+            raise KeyError("Rectangle is not in the tree")
+        rect.move(delta_x, delta_y)
+        self.update(rect)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, rect):
+        return id(rect) in self._slots
+
+    def __iter__(self):
+        for rect in self._rectangles:
+            if rect is not None:
+                yield rect
+
+    def get_bounds(self):
+        """Enclosing (x1, y1, x2, y2) of all rectangles, or None if the tree is empty"""
+        return self._nodes[1]
+
+    def get_rectangle(self):
+        """Enclosing rectangle of all rectangles, or None if the tree is empty"""
+        bounds = self._nodes[1]
+        if bounds is None:
+            return None
+        x1, y1, x2, y2 = bounds
+        return Rectangle(x1, y1, x2 - x1, y2 - y1)
+
+    def get_subtree_bounds(self, depth):
+        """Bounds of the non-empty subtrees at the given depth (the root is depth 0)"""
+        if depth < 0:
+            raise ValueError("depth must be non-negative")
+        first = 1 << depth
+        if first > self._capacity:
+            first = self._capacity
+        return [bounds for bounds in self._nodes[first:2 * first] if bounds is not None]
+
+    def query_overlap(self, rect):
+        """Rectangles whose intersection with rect has a positive area
+
+        Subtrees whose bounds miss rect are culled without visiting them."""
+        qx1, qy1, qx2, qy2 = rect.get_bounds()
+        result = []
+        if qx1 >= qx2 or qy1 >= qy2:
+            return result
+        nodes = self._nodes
+        capacity = self._capacity
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            bounds = nodes[node]
+            if bounds is None:
+                continue
+            x1, y1, x2, y2 = bounds
+            if not (x1 < qx2 and qx1 < x2 and y1 < qy2 and qy1 < y2):
+                continue
+            if node >= capacity:
+                if x1 < x2 and y1 < y2:
+                    result.append(self._rectangles[node - capacity])
+            else:
+                stack.append(2 * node + 1)
+                stack.append(2 * node)
+        return result
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+from rectangle import FrozenRectangle, Rectangle
+
+_UNION = "+"
+_INTERSECTION = "-"
+
+
+class RectangleCache:
+    """Interning factory for FrozenRectangles with an LRU memo of unions and intersections
+
+    Identical (x, y, width, height) values share one FrozenRectangle while any
+    owner still holds it, so repeated geometry costs a dictionary lookup
+    instead of an allocation."""
+    DEFAULT_MEMO_SIZE = 4096
+
+    def __init__(self, memo_size=DEFAULT_MEMO_SIZE):
+        if memo_size < 0:
+            raise ValueError("memo_size must be non-negative")
+        self._interned = WeakValueDictionary()
+        self._memo = OrderedDict()
+        self._memo_size = memo_size
+        self.intern_hits = 0
+        self.intern_misses = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def get(self, x=None, y=None, width=None, height=None):
+        """Shared FrozenRectangle with the given values (defaults like Rectangle())"""
+        if x is None or y is None or width is None or height is None:
+            x = y = Rectangle.DEFAULT_COORDINATE
+            width = height = Rectangle.DEFAULT_DIMENSION
+        if width < 0:
+            x += width
+            width = -width
+        if height < 0:
+            y += height
+            height = -height
+        return self._intern((x, y, width, height))
+
+    def _intern(self, key):
+        rect = self._interned.get(key)
+        if rect is not None:
+            self.intern_hits += 1
+            return rect
+        self.intern_misses += 1
+        rect = FrozenRectangle(*key)
+        self._interned[key] = rect
+        return rect
+
+    def intern(self, rect):
+        """Shared FrozenRectangle equal to rect"""
+        return self._intern((rect._x, rect._y, rect._width, rect._height))
+
+    def default(self):
+        """Shared equivalent of Rectangle.create_rectangle_default()"""
+        return self.get()
+
+    def union(self, rect1, rect2):
+        """Memoized rect1 + rect2"""
+        return self._memoized(_UNION, rect1, rect2)
+
+    def intersection(self, rect1, rect2):
+        """Memoized rect1 - rect2"""
+        return self._memoized(_INTERSECTION, rect1, rect2)
+
+    def _memoized(self, operation, rect1, rect2):
+        if not isinstance(rect1, Rectangle) or not isinstance(rect2, Rectangle):
+            raise TypeError("RectangleCache operands must be Rectangles")
+        key = (operation, rect1._x, rect1._y, rect1._width, rect1._height,
+               rect2._x, rect2._y, rect2._width, rect2._height)
+        result = self._memo.get(key)
+        if result is not None:
+            self.memo_hits += 1
+            self._memo.move_to_end(key)
+            return result
+        self.memo_misses += 1
+        result = Rectangle.__add__(rect1, rect2) if operation == _UNION else Rectangle.__sub__(rect1, rect2)
+        result = self.intern(result)
+        if self._memo_size:
+            self._memo[key] = result
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+        return result
+
+    def get_stats(self):
+        """Hit and miss counters together with the current table sizes"""
+        return {
+            "intern_hits": self.intern_hits,
+            "intern_misses": self.intern_misses,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "interned": len(self._interned),
+            "memoized": len(self._memo),
+        }
+
+    def clear(self):
+        self._interned.clear()
+        self._memo.clear()
+
+    def __len__(self):
+        return len(self._interned)
@@ -0,0 +1,235 @@
+from bisect import bisect_left
+
+from rectangle import Rectangle
+
+
+class _StabbingTree:
+    """Segment tree over elementary y-intervals holding the active rectangles covering them"""
+
+    def __init__(self, size):
+        self._size = 1
+        while self._size < size:
+            self._size <<= 1
+        self._cover = {}
+
+    def _update(self, low, high, item, add):
+        low += self._size
+        high += self._size
+        while low < high:
+            if low & 1:
+                self._change(low, item, add)
+                low += 1
+            if high & 1:
+                high -= 1
+                self._change(high, item, add)
+            low >>= 1
+            high >>= 1
+
+    def _change(self, node, item, add):
+        if add:
+            self._cover.setdefault(node, set()).add(item)
+        else:
+            items = self._cover[node]
+            items.discard(item)
+            if not items:
+                del self._cover[node]
+
+    def insert(self, low, high, item):
+        self._update(low, high, item, True)
+
+    def remove(self, low, high, item):
+        self._update(low, high, item, False)
+
+    def stab(self, position):
+        node = position + self._size
+        while node:
+            items = self._cover.get(node)
+            if items:
+                yield from items
+            node >>= 1
+
+
+class _StartTree:
+    """Counting segment tree over y positions reporting active rectangles by their start"""
+
+    def __init__(self, size):
+        self._size = 1
+        while self._size < size:
+            self._size <<= 1
+        self._counts = [0] * (2 * self._size)
+        self._starts = {}
+
+    def _change(self, position, item, delta):
+        if delta > 0:
+            self._starts.setdefault(position, set()).add(item)
+        else:
+            items = self._starts[position]
+            items.discard(item)
+            if not items:
+                del self._starts[position]
+        node = position + self._size
+        while node:
+            self._counts[node] += delta
+            node >>= 1
+
+    def insert(self, position, item):
+        self._change(position, item, 1)
+
+    def remove(self, position, item):
+        self._change(position, item, -1)
+
+    def report(self, low, high):
+        """Items starting at positions in [low, high)"""
+        if low >= high:
+            return
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, node_low, node_high = stack.pop()
+            if not self._counts[node] or node_high <= low or high <= node_low:
+                continue
+            if node_high - node_low == 1:
+                yield from self._starts[node_low]
+                continue
+            middle = (node_low + node_high) // 2
+            stack.append((2 * node, node_low, middle))
+            stack.append((2 * node + 1, middle, node_high))
+
+
+class _CoverageTree:
+    """Segment tree over compressed y-coordinates tracking the covered length"""
+
+    def __init__(self, ys):
+        self._ys = ys
+        size = max(len(ys) - 1, 1)
+        self._counts = [0] * (4 * size)
+        self._covered = [0] * (4 * size)
+
+    def update(self, low, high, delta, node=1, node_low=0, node_high=None):
+        """Adding delta to the cover count of elementary intervals [low, high)"""
+        if node_high is None:
+            node_high = len(self._ys) - 1
+        if high <= node_low or node_high <= low:
+            return
+        if low <= node_low and node_high <= high:
+            self._counts[node] += delta
+        else:
+            middle = (node_low + node_high) // 2
+            self.update(low, high, delta, 2 * node, node_low, middle)
+            self.update(low, high, delta, 2 * node + 1, middle, node_high)
+        if self._counts[node]:
+            self._covered[node] = self._ys[node_high] - self._ys[node_low]
+        elif node_high - node_low == 1:
+            self._covered[node] = 0
+        else:
+            self._covered[node] = self._covered[2 * node] + self._covered[2 * node + 1]
+
+    def covered_length(self):
+        return self._covered[1]
+
+    def covered_intervals(self):
+        """Maximal covered y-intervals in ascending order"""
+        intervals = []
+        stack = [(1, 0, len(self._ys) - 1)]
+        while stack:
+            node, node_low, node_high = stack.pop()
+            if not self._covered[node]:
+                continue
+            if self._counts[node] or self._covered[node] == self._ys[node_high] - self._ys[node_low]:
+                if intervals and intervals[-1][1] == self._ys[node_low]:
+                    intervals[-1] = (intervals[-1][0], self._ys[node_high])
+                else:
+                    intervals.append((self._ys[node_low], self._ys[node_high]))
+                continue
+            middle = (node_low + node_high) // 2
+            stack.append((2 * node + 1, middle, node_high))
+            stack.append((2 * node, node_low, middle))
+        return intervals
+
+
+def _sweep(rectangles):
+    """Yielding (x, next_x, tree) for every slab between consecutive sweep events"""
+    events = []
+    ys = set()
+    for rect in rectangles:
+        x1, y1, x2, y2 = rect.get_bounds()
+        if x1 < x2 and y1 < y2:
+            events.append((x1, 1, y1, y2))
+            events.append((x2, -1, y1, y2))
+            ys.add(y1)
+            ys.add(y2)
+    if not events:
+        return
+    events.sort()
+    ys = sorted(ys)
+    tree = _CoverageTree(ys)
+    for position, (x, delta, y1, y2) in enumerate(events):
+        tree.update(bisect_left(ys, y1), bisect_left(ys, y2), delta)
+        next_x = events[position + 1][0] if position + 1 < len(events) else x
+        if next_x != x or position + 1 == len(events):
+            yield x, next_x, tree
+
+
+def union_area(rectangles):
+    """Area covered by the union of the rectangles"""
+    area = 0
+    for x, next_x, tree in _sweep(rectangles):
+        area += tree.covered_length() * (next_x - x)
+    return area
+
+
+def coverage_decomposition(rectangles):
+    """Disjoint rectangles whose union is exactly the area covered by the input"""
+    result = []
+    open_intervals = {}
+    for x, next_x, tree in _sweep(rectangles):
+        intervals = tree.covered_intervals() if next_x != x else []
+        current = set(intervals)
+        for interval, start_x in list(open_intervals.items()):
+            if interval not in current:
+                result.append(Rectangle(start_x, interval[0], x - start_x, interval[1] - interval[0]))
+                del open_intervals[interval]
+        for interval in intervals:
+            if interval not in open_intervals:
+                open_intervals[interval] = x
+    return result
+
+
+def iter_overlapping_pairs(rectangles):
+    """Lazily yielding (i, j, intersection) for every pair of rectangles whose
+    intersection has a positive area, with i < j"""
+    rectangles = list(rectangles)
+    bounds = [rect.get_bounds() for rect in rectangles]
+    events = []
+    for index, (x1, y1, x2, y2) in enumerate(bounds):
+        if x1 < x2 and y1 < y2:
+            events.append((x1, 1, index))
+            events.append((x2, 0, index))
+    events.sort()
+    ys = sorted(set(y for _, y1, _, y2 in bounds for y in (y1, y2)))
+    stabbing = _StabbingTree(len(ys))
+    starts = _StartTree(len(ys))
+    for _, is_start, index in events:
+        x1, y1, x2, y2 = bounds[index]
+        low = bisect_left(ys, y1)
+        high = bisect_left(ys, y2)
+        if not is_start:
+            stabbing.remove(low, high, index)
+            starts.remove(low, index)
+            continue
+        for other in stabbing.stab(low):
+            yield _pair(rectangles, index, other)
+        for other in starts.report(low + 1, high):
+            yield _pair(rectangles, index, other)
+        stabbing.insert(low, high, index)
+        starts.insert(low, index)
+
+
+def _pair(rectangles, first, second):
+    if first > second:
+        first, second = second, first
+    return first, second, rectangles[first] - rectangles[second]
+
+
+def find_overlapping_pairs(rectangles):
+    """List of (i, j, intersection) for all overlapping pairs, see iter_overlapping_pairs"""
+    return list(iter_overlapping_pairs(rectangles))
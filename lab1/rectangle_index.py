@@ -0,0 +1,229 @@
+from math import ceil, sqrt
+
+
+class _Node:
+    __slots__ = ("bounds", "entries", "is_leaf", "parent")
+
+    def __init__(self, is_leaf, entries=None):
+        self.is_leaf = is_leaf
+        self.entries = entries if entries is not None else []
+        self.parent = None
+        self.bounds = None
+
+
+class RectangleIndex:
+    """R-tree over Rectangle objects for overlap, containment and point queries"""
+    MAX_ENTRIES = 16
+
+    def __init__(self, rectangles=None):
+        self._root = _Node(True)
+        self._leaves = {}
+        if rectangles is not None:
+            self._bulk_load(list(rectangles))
+
+    def _bulk_load(self, rectangles):
+        """Building the tree bottom-up with Sort-Tile-Recursive packing"""
+        if not rectangles:
+            return
+        level = self._pack([(rect.get_bounds(), rect) for rect in rectangles], True)
+        while len(level) > 1:
+            level = self._pack([(node.bounds, node) for node in level], False)
+        self._root = level[0]
+
+    def _pack(self, items, is_leaf):
+        capacity = self.MAX_ENTRIES
+        slice_count = ceil(sqrt(ceil(len(items) / capacity)))
+        slice_size = slice_count * capacity
+        items.sort(key=lambda item: item[0][0] + item[0][2])
+        nodes = []
+        for start in range(0, len(items), slice_size):
+            strip = items[start:start + slice_size]
+            strip.sort(key=lambda item: item[0][1] + item[0][3])
+            for group_start in range(0, len(strip), capacity):
+                group = strip[group_start:group_start + capacity]
+                if is_leaf:
+                    node = _Node(True, group)
+                    for _, rect in group:
+                        self._leaves[id(rect)] = node
+                else:
+                    node = _Node(False, [child for _, child in group])
+                    for child in node.entries:
+                        child.parent = node
+                node.bounds = self._union_bounds([bounds for bounds, _ in group])
+                nodes.append(node)
+        return nodes
+
+    def _union_bounds(self, bounds_list):
+        min_x, min_y, max_x, max_y = bounds_list[0]
+        for x1, y1, x2, y2 in bounds_list:
+            if x1 < min_x:
+                min_x = x1
+            if y1 < min_y:
+                min_y = y1
+            if x2 > max_x:
+                max_x = x2
+            if y2 > max_y:
+                max_y = y2
+        return (min_x, min_y, max_x, max_y)
+
+    def _node_bounds(self, node):
+        if not node.entries:
+            return None
+        if node.is_leaf:
+            return self._union_bounds([bounds for bounds, _ in node.entries])
+        return self._union_bounds([child.bounds for child in node.entries])
+
+    def _enlargement(self, bounds, added):
+        x1, y1, x2, y2 = bounds
+        ax1, ay1, ax2, ay2 = added
+        width = (x2 if x2 > ax2 else ax2) - (x1 if x1 < ax1 else ax1)
+        height = (y2 if y2 > ay2 else ay2) - (y1 if y1 < ay1 else ay1)
+        return width * height - (x2 - x1) * (y2 - y1)
+
+    def insert(self, rect):
+        """Adding a rectangle to the index"""
+        if id(rect) in self._leaves:
+            raise ValueError("Rectangle is already indexed")
+        bounds = rect.get_bounds()
+        node = self._root
+        while not node.is_leaf:
+            node = min(node.entries,
+                       key=lambda child: self._enlargement(child.bounds, bounds))
+        node.entries.append((bounds, rect))
+        self._leaves[id(rect)] = node
+        self._adjust_upwards(node)
+
+    def _adjust_upwards(self, node):
+        """Splitting overflowing nodes and refreshing bounds up to the root"""
+        while node is not None:
+            if len(node.entries) > self.MAX_ENTRIES:
+                sibling = self._split(node)
+                if node.parent is None:
+                    self._root = _Node(False, [node, sibling])
+                    node.parent = sibling.parent = self._root
+                else:
+                    node.parent.entries.append(sibling)
+                    sibling.parent = node.parent
+            node.bounds = self._node_bounds(node)
+            node = node.parent
+
+    def _split(self, node):
+        """Moving the upper half of a node's entries, along its longer axis, to a new node"""
+        x1, y1, x2, y2 = node.bounds
+        axis = 0 if x2 - x1 >= y2 - y1 else 1
+        if node.is_leaf:
+            node.entries.sort(key=lambda entry: entry[0][axis] + entry[0][axis + 2])
+        else:
+            node.entries.sort(key=lambda child: child.bounds[axis] + child.bounds[axis + 2])
+        half = len(node.entries) // 2
+        sibling = _Node(node.is_leaf, node.entries[half:])
+        del node.entries[half:]
+        if node.is_leaf:
+            for _, rect in sibling.entries:
+                self._leaves[id(rect)] = sibling
+        else:
+            for child in sibling.entries:
+                child.parent = sibling
+        sibling.bounds = self._node_bounds(sibling)
+        return sibling
+
+    def remove(self, rect):
+        """Removing a rectangle from the index"""
+        leaf = self._leaves.pop(id(rect), None)
+        if leaf is None:
+            raise KeyError("Rectangle is not indexed")
+        for position, (_, item) in enumerate(leaf.entries):
+            if item is rect:
+                del leaf.entries[position]
+                break
+        node = leaf
+        while node.parent is not None and not node.entries:
+            parent = node.parent
+            parent.entries.remove(node)
+            node = parent
+        while node is not None:
+            node.bounds = self._node_bounds(node)
+            node = node.parent
+        while not self._root.is_leaf and len(self._root.entries) == 1:
+            self._root = self._root.entries[0]
+            self._root.parent = None
+        if not self._root.entries:
+            self._root = _Node(True)
+
+    def update(self, rect):
+        """Re-indexing a rectangle whose coordinates were changed"""
+        self.remove(rect)
+        self.insert(rect)
+
+    def move(self, rect, delta_x, delta_y):
+        """Moving an indexed rectangle and updating the index
+
+        The rectangle is moved first, so it stays indexed if move raises."""
+        if id(rect) not in self._leaves:
+            raise KeyError("Rectangle is not indexed")
+        rect.move(delta_x, delta_y)
+        self.update(rect)
+
+    def __len__(self):
+        return len(self._leaves)
+
+    def __contains__(self, rect):
+        return id(rect) in self._leaves
+
+    def __iter__(self):
+        for leaf in set(self._leaves.values()):
+            for _, rect in leaf.entries:
+                yield rect
+
+    def get_bounds(self):
+        return self._root.bounds
+
+    def query_overlap(self, rect):
+        """Rectangles whose intersection with rect has a positive area"""
+        qx1, qy1, qx2, qy2 = rect.get_bounds()
+        if qx1 >= qx2 or qy1 >= qy2:
+            return []
+
+        def node_test(x1, y1, x2, y2):
+            return x1 < qx2 and qx1 < x2 and y1 < qy2 and qy1 < y2
+
+        def entry_test(x1, y1, x2, y2):
+            return x1 < x2 and y1 < y2 and x1 < qx2 and qx1 < x2 and y1 < qy2 and qy1 < y2
+
+        return self._search(node_test, entry_test)
+
+    def query_contained(self, rect):
+        """Rectangles lying entirely inside rect"""
+        qx1, qy1, qx2, qy2 = rect.get_bounds()
+
+        def node_test(x1, y1, x2, y2):
+            return x1 <= qx2 and qx1 <= x2 and y1 <= qy2 and qy1 <= y2
+
+        def entry_test(x1, y1, x2, y2):
+            return qx1 <= x1 and x2 <= qx2 and qy1 <= y1 and y2 <= qy2
+
+        return self._search(node_test, entry_test)
+
+    def query_point(self, x, y):
+        """Rectangles containing the point (edges included)"""
+        def test(x1, y1, x2, y2):
+            return x1 <= x <= x2 and y1 <= y <= y2
+
+        return self._search(test, test)
+
+    def _search(self, node_test, entry_test):
+        result = []
+        if self._root.bounds is None:
+            return result
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                for bounds, rect in node.entries:
+                    if entry_test(*bounds):
+                        result.append(rect)
+            else:
+                for child in node.entries:
+                    if node_test(*child.bounds):
+                        stack.append(child)
+        return result
@@ -0,0 +1,226 @@
+import mmap
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+
+from rectangle import Rectangle
+from rectangle_array import RectangleArray, np
+
+CHUNK_SIZE_HINT = 1 << 20
+WRITE_BATCH_SIZE = 10000
+
+BINARY_MAGIC = b"RECT"
+BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sBcxxQ")
+_RECORD_FORMATS = {b"q": "<4q", b"d": "<4d"}
+_NUMPY_DTYPES = {b"q": "<i8", b"d": "<f8"}
+
+
+@contextmanager
+def _open(source, mode, encoding=None):
+    """Opening a path, or passing through an already open file object"""
+    if hasattr(source, "read") or hasattr(source, "write"):
+        yield source
+    else:
+        with open(source, mode, encoding=encoding) as file:
+            yield file
+
+
+def _iter_chunks(file):
+    """Yielding lists of lines read in chunks of about CHUNK_SIZE_HINT bytes"""
+    while True:
+        lines = file.readlines(CHUNK_SIZE_HINT)
+        if not lines:
+            return
+        yield lines
+
+
+def _parse_lines(lines, first_line_number, numbers):
+    """Appending the four numbers of every non-blank line to numbers"""
+    for offset, line in enumerate(lines):
+        parts = line.split()
+        if len(parts) == 4:
+            numbers.extend(parts)
+        elif parts:
+            raise ValueError(f"Line {first_line_number + offset}: expected 'x y width height'")
+
+
+def _check_integers(lines, first_line_number):
+    """Raising ValueError for the first line holding a value that is not an integer"""
+    for offset, line in enumerate(lines):
+        for part in line.split():
+            try:
+                int(part)
+            except ValueError as error:
+                raise ValueError(f"Line {first_line_number + offset}: invalid rectangle data: {error}") from error
+
+
+def _read_numbers(file):
+    """Yielding flat lists of parsed integers, one list per chunk"""
+    line_number = 1
+    for lines in _iter_chunks(file):
+        numbers = []
+        _parse_lines(lines, line_number, numbers)
+        try:
+            values = list(map(int, numbers))
+        except ValueError:
+            _check_integers(lines, line_number)
+            raise
+        line_number += len(lines)
+        yield values
+
+
+def iter_rectangles(source):
+    """Lazily reading Rectangles from a path or file with one 'x y w h' per line"""
+    with _open(source, "r", "ascii") as file:
+        for numbers in _read_numbers(file):
+            for i in range(0, len(numbers), 4):
+                yield Rectangle(numbers[i], numbers[i + 1], numbers[i + 2], numbers[i + 3])
+
+
+def read_rectangles(source):
+    """Reading all Rectangles of a text file into a list"""
+    return list(iter_rectangles(source))
+
+
+def read_rectangle_array(source):
+    """Reading a text file of rectangles straight into a RectangleArray"""
+    columns = ([], [], [], [])
+    with _open(source, "r", "ascii") as file:
+        for numbers in _read_numbers(file):
+            for column, position in zip(columns, range(4)):
+                column.extend(numbers[position::4])
+    return RectangleArray(*columns)
+
+
+def write_rectangles(rectangles, target):
+    """Writing Rectangles (or a RectangleArray) one 'x y w h' per line in batches
+
+    The text format holds integers only, like Rectangle.to_string, so a
+    non-integer value raises ValueError; use write_rectangles_binary for floats."""
+    if isinstance(rectangles, RectangleArray):
+        for column in (rectangles.get_x(), rectangles.get_y(),
+                       rectangles.get_width(), rectangles.get_height()):
+            if column.dtype.kind not in "iu":
+                raise ValueError("The text rectangle format only holds integers")
+        rows = zip(rectangles.get_x().tolist(), rectangles.get_y().tolist(),
+                   rectangles.get_width().tolist(), rectangles.get_height().tolist())
+    else:
+        rows = ((rect.get_x(), rect.get_y(), rect.get_width(), rect.get_height())
+                for rect in rectangles)
+    with _open(target, "w", "ascii") as file:
+        batch = []
+        for row in rows:
+            x, y, width, height = row
+            if not (type(x) is int and type(y) is int and type(width) is int and type(height) is int):
+                raise ValueError(f"The text rectangle format only holds integers, got {row}")
+            batch.append("%s %s %s %s\n" % row)
+            if len(batch) >= WRITE_BATCH_SIZE:
+                file.write("".join(batch))
+                batch = []
+        file.write("".join(batch))
+
+
+def write_rectangles_binary(rectangles, target):
+    """Writing Rectangles (or a RectangleArray) as a header plus packed x, y, w, h records
+
+    Records are little-endian int64 when every value is an int, float64 otherwise."""
+    if isinstance(rectangles, RectangleArray):
+        columns = [rectangles.get_x(), rectangles.get_y(),
+                   rectangles.get_width(), rectangles.get_height()]
+        code = b"q" if all(column.dtype.kind in "iub" for column in columns) else b"d"
+        records = np.stack(columns, axis=1).astype(_NUMPY_DTYPES[code])
+        count = len(records)
+        payload = records.tobytes()
+    else:
+        values = []
+        for rect in rectangles:
+            values.extend((rect.get_x(), rect.get_y(), rect.get_width(), rect.get_height()))
+        code = b"q" if all(type(value) is int for value in values) else b"d"
+        packed = array(code.decode(), values)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        count = len(values) // 4
+        payload = packed.tobytes()
+    with _open(target, "wb") as file:
+        file.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, code, count))
+        file.write(payload)
+
+
+class RectangleFile:
+    """Memory-mapped read-only view of a binary rectangle file
+
+    Records are decoded into Rectangle objects only when accessed. Column
+    views from get_columns stay valid after close(); the mapping is released
+    once the last of them is gone."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError("File is too short for a rectangle file header")
+        magic, version, code, count = _HEADER.unpack_from(self._mmap)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION or code not in _RECORD_FORMATS:
+            self.close()
+            raise ValueError("Not a rectangle file")
+        self._code = code
+        self._record = struct.Struct(_RECORD_FORMATS[code])
+        self._count = count
+        if len(self._mmap) < _HEADER.size + count * self._record.size:
+            self.close()
+            raise ValueError("Rectangle file is truncated")
+
+    def __len__(self):
+        return self._count
+
+    def _mapping(self):
+        if self._mmap is None:
+            raise ValueError("I/O operation on a closed RectangleFile")
+        return self._mmap
+
+    def get_record(self, index):
+        """Raw (x, y, width, height) tuple of a record"""
+        mapping = self._mapping()
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Rectangle index out of range")
+        return self._record.unpack_from(mapping, _HEADER.size + index * self._record.size)
+
+    def __getitem__(self, index):
+        return Rectangle(*self.get_record(index))
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def get_columns(self):
+        """Zero-copy NumPy views of the x, y, width and height columns"""
+        if np is None:
+            raise ImportError("get_columns requires numpy: pip install numpy")
+        records = np.frombuffer(self._mapping(), dtype=_NUMPY_DTYPES[self._code],
+                                count=self._count * 4, offset=_HEADER.size).reshape(-1, 4)
+        return records[:, 0], records[:, 1], records[:, 2], records[:, 3]
+
+    def to_rectangle_array(self):
+        """Copying the records into a RectangleArray"""
+        return RectangleArray(*self.get_columns())
+
+    def close(self):
+        if self._mmap is None:
+            return
+        mapping, self._mmap = self._mmap, None
+        try:
+            mapping.close()
+        except BufferError:
+            # get_columns views still export the buffer and keep the mapping alive
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
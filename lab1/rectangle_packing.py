@@ -0,0 +1,272 @@
+from bisect import bisect_right
+
+
+class SkylineBin:
+    """Single bin packed with the skyline bottom-left heuristic
+
+    The skyline is the upper contour of the placed rectangles, kept as a list
+    of [x, y, width] segments ordered by x."""
+
+    def __init__(self, width, height):
+        if width <= 0 or height <= 0:
+            raise ValueError("Bin dimensions must be positive")
+        self._width = width
+        self._height = height
+        self._skyline = [[0, 0, width]]
+        self._rectangles = []
+        self._used_area = 0
+        self._free_spaces = None
+
+    def get_width(self):
+        return self._width
+
+    def get_height(self):
+        return self._height
+
+    def get_rectangles(self):
+        return list(self._rectangles)
+
+    def get_used_area(self):
+        return self._used_area
+
+    def get_utilization(self):
+        return self._used_area / (self._width * self._height)
+
+    def get_free_spaces(self):
+        """Maximal (width, height) boxes that still fit on top of the skyline
+
+        A box fits in the bin exactly when one of these dominates it."""
+        if self._free_spaces is None:
+            skyline = self._skyline
+            count = len(skyline)
+            left = [0] * count
+            stack = []
+            for index in range(count):
+                while stack and skyline[stack[-1]][1] <= skyline[index][1]:
+                    stack.pop()
+                left[index] = skyline[stack[-1]][0] + skyline[stack[-1]][2] if stack else 0
+                stack.append(index)
+            spaces = []
+            stack = []
+            for index in range(count - 1, -1, -1):
+                while stack and skyline[stack[-1]][1] <= skyline[index][1]:
+                    stack.pop()
+                right = skyline[stack[-1]][0] if stack else self._width
+                stack.append(index)
+                height = self._height - skyline[index][1]
+                if height > 0:
+                    spaces.append((right - left[index], height))
+            self._free_spaces = spaces
+        return self._free_spaces
+
+    def fits(self, width, height):
+        if height == 0:
+            return width <= self._width
+        for free_width, free_height in self.get_free_spaces():
+            if width <= free_width and height <= free_height:
+                return True
+        return False
+
+    def _fit(self, index, width, height):
+        """Lowest y at which a width x height box fits starting at segment index, or None"""
+        skyline = self._skyline
+        x = skyline[index][0]
+        if x + width > self._width:
+            return None
+        y = 0
+        remaining = width
+        while True:
+            segment_y = skyline[index][1]
+            if segment_y > y:
+                y = segment_y
+                if y + height > self._height:
+                    return None
+            remaining -= skyline[index][2]
+            index += 1
+            if remaining <= 0 or index == len(skyline):
+                break
+        if y + height > self._height:
+            return None
+        return y
+
+    def find_position(self, width, height):
+        """Bottom-left (x, y, segment index) for a box, or None if it does not fit"""
+        best = None
+        best_y = best_x = None
+        for index, (x, _, _) in enumerate(self._skyline):
+            y = self._fit(index, width, height)
+            if y is not None and (best is None or y < best_y or (y == best_y and x < best_x)):
+                best = (x, y, index)
+                best_y, best_x = y, x
+        return best
+
+    def place(self, rect, position):
+        """Moving rect to a position returned by find_position and raising the skyline"""
+        x, y, index = position
+        width = rect.get_width()
+        rect.move(x - rect.get_x(), y - rect.get_y())
+        self._rectangles.append(rect)
+        self._used_area += width * rect.get_height()
+        self._free_spaces = None
+        if width == 0:
+            return
+        skyline = self._skyline
+        top = y + rect.get_height()
+        end = x + width
+        last = index
+        while last < len(skyline) and skyline[last][0] + skyline[last][2] <= end:
+            last += 1
+        if last < len(skyline) and skyline[last][0] < end:
+            segment = skyline[last]
+            segment[2] -= end - segment[0]
+            segment[0] = end
+        skyline[index:last] = [[x, top, width]]
+        if index + 1 < len(skyline) and skyline[index + 1][1] == top:
+            skyline[index][2] += skyline[index + 1][2]
+            del skyline[index + 1]
+        if index > 0 and skyline[index - 1][1] == top:
+            skyline[index - 1][2] += skyline[index][2]
+            del skyline[index]
+
+    def insert(self, rect):
+        """Placing rect in the bin if it fits"""
+        position = self.find_position(rect.get_width(), rect.get_height())
+        if position is None:
+            return False
+        self.place(rect, position)
+        return True
+
+
+class _BinTree:
+    """Max tree over the bins' free space for finding the first bin that fits a box
+
+    Bin widths are split into BUCKETS thresholds and every node stores, per
+    threshold, the tallest free space at least that wide among the bins below
+    it, so bins that cannot take an item are skipped a subtree at a time."""
+    BUCKETS = 16
+
+    def __init__(self, bin_width):
+        self._thresholds = [bin_width * bucket / self.BUCKETS for bucket in range(self.BUCKETS)]
+        self._empty = (-1,) * self.BUCKETS
+        self._size = 1
+        self._nodes = [self._empty] * 2
+        self.bins = []
+
+    def append(self, packed_bin):
+        self.bins.append(packed_bin)
+        if len(self.bins) > self._size:
+            old_size = self._size
+            self._size *= 2
+            nodes = [self._empty] * (2 * self._size)
+            nodes[self._size:self._size + old_size] = self._nodes[old_size:]
+            self._nodes = nodes
+            for node in range(self._size - 1, 0, -1):
+                nodes[node] = tuple(map(max, nodes[2 * node], nodes[2 * node + 1]))
+        self.update(len(self.bins) - 1)
+
+    def update(self, index):
+        heights = [-1] * self.BUCKETS
+        thresholds = self._thresholds
+        for width, height in self.bins[index].get_free_spaces():
+            bucket = 0
+            while bucket < self.BUCKETS and thresholds[bucket] <= width:
+                if height > heights[bucket]:
+                    heights[bucket] = height
+                bucket += 1
+        nodes = self._nodes
+        node = self._size + index
+        nodes[node] = tuple(heights)
+        node >>= 1
+        while node:
+            summary = tuple(map(max, nodes[2 * node], nodes[2 * node + 1]))
+            if summary == nodes[node]:
+                return
+            nodes[node] = summary
+            node >>= 1
+
+    def find(self, width, height):
+        """Index of the first bin that fits a width x height box, or None"""
+        bucket = bisect_right(self._thresholds, width) - 1
+        nodes = self._nodes
+        size = self._size
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if nodes[node][bucket] < height:
+                continue
+            if node >= size:
+                index = node - size
+                if self.bins[index].fits(width, height):
+                    return index
+            else:
+                stack.append(2 * node + 1)
+                stack.append(2 * node)
+        return None
+
+
+class PackingResult:
+    """Bins produced by pack_rectangles together with the rectangles that did not fit"""
+
+    def __init__(self, bins, unplaced):
+        self.bins = bins
+        self.unplaced = unplaced
+
+    def get_bin_count(self):
+        return len(self.bins)
+
+    def get_placed_count(self):
+        return sum(len(packed_bin.get_rectangles()) for packed_bin in self.bins)
+
+    def get_utilization(self):
+        """Used area divided by the total area of all bins"""
+        if not self.bins:
+            return 0.0
+        total = sum(packed_bin.get_width() * packed_bin.get_height() for packed_bin in self.bins)
+        return sum(packed_bin.get_used_area() for packed_bin in self.bins) / total
+
+    def get_stats(self):
+        return {
+            "bins": self.get_bin_count(),
+            "placed": self.get_placed_count(),
+            "unplaced": len(self.unplaced),
+            "utilization": self.get_utilization(),
+            "bin_utilization": [packed_bin.get_utilization() for packed_bin in self.bins],
+        }
+
+
+def pack_rectangles(rectangles, bin_width, bin_height, max_bins=None, sort=True):
+    """Packing rectangles into bin_width x bin_height bins with the skyline heuristic
+
+    The rectangles are moved in place (their sizes are kept) and every rectangle
+    goes to the first open bin that can take it, a new bin is opened otherwise.
+    Rectangles larger than a bin, or left over once max_bins bins are full, end
+    up in PackingResult.unplaced."""
+    if bin_width <= 0 or bin_height <= 0:
+        raise ValueError("Bin dimensions must be positive")
+    if max_bins is not None and max_bins < 0:
+        raise ValueError("max_bins must be non-negative")
+    items = list(rectangles)
+    if sort:
+        items.sort(key=lambda rect: (rect.get_height(), rect.get_width()), reverse=True)
+    tree = _BinTree(bin_width)
+    unplaced = []
+    for rect in items:
+        width = rect.get_width()
+        height = rect.get_height()
+        if width > bin_width or height > bin_height:
+            unplaced.append(rect)
+            continue
+        if height == 0 and tree.bins:
+            index = 0
+        else:
+            index = tree.find(width, height)
+        if index is None:
+            if max_bins is not None and len(tree.bins) >= max_bins:
+                unplaced.append(rect)
+                continue
+            tree.append(SkylineBin(bin_width, bin_height))
+            index = len(tree.bins) - 1
+        tree.bins[index].insert(rect)
+        tree.update(index)
+    return PackingResult(tree.bins, unplaced)
+
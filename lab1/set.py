@@ -1,43 +1,134 @@
+import copy
+import re
+from itertools import combinations, count
+
+_SET_KEY = object()
+_SHAPE_KEY = object()
+_REMOVED = object()
+_set_ids = count(1)
+_CALLER_ID = object()
+_DELIMITERS = re.compile(r"[{},]")
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def _new_set_id(unique_id):
+    """Fresh int id, or a caller-supplied id tagged so it never matches an automatic one"""
+    return (_CALLER_ID, unique_id) if unique_id else next(_set_ids)
+
+
 class Set:
-    MAX_NESTING_LEVEL = 100
-    _set_counter = 0
+    __slots__ = ("_items", "_removed", "_index", "_unhashable", "_id", "_shared")
+    MAX_POWER_SET_ELEMENTS = 20
 
     def __init__(self, elements=None, unique_id=None):
-        Set._set_counter += 1
-        self._elements = []
-        self._id = unique_id or Set._set_counter
+        self._items = []
+        self._removed = 0
+        self._index = {}
+        self._unhashable = []
+        self._shared = False
+        self._id = _new_set_id(unique_id)
         if elements is not None:
             for element in elements:
-                self.add_element(element)
+                self._add(element)
+
+    @property
+    def _elements(self):
+        """Elements in insertion order, without tombstones left by removals"""
+        if self._removed:
+            self._compact()
+        return self._items
+
+    def _element_key(self, element):
+        """Canonical hash key of an element (nested sets are keyed by id)"""
+        if isinstance(element, Set):
+            return element if isinstance(element, FrozenSet) else (_SET_KEY, element._id)
+        return element
 
     def _contains_element(self, element):
-        for elem in self._elements:
-            if self._elements_equal(elem, element):
-                return True
-        return False
+        try:
+            return self._element_key(element) in self._index
+        except TypeError:
+            for elem in self._unhashable:
+                if self._elements_equal(elem, element):
+                    return True
+            return False
+
+    def _append_element(self, element):
+        """Appending an element known to be absent"""
+        if self._shared:
+            self._unshare()
+        try:
+            self._index[self._element_key(element)] = len(self._items)
+        except TypeError:
+            self._unhashable.append(element)
+        self._items.append(element)
 
     def _elements_equal(self, elem1, elem2):
-        if isinstance(elem1, Set) and isinstance(elem2, Set):
-            return elem1._id == elem2._id
-        else:
-            return elem1 == elem2
+        return self._element_key(elem1) == self._element_key(elem2)
 
     def is_empty(self):
-        return len(self._elements) == 0
+        return len(self._items) == self._removed
 
     def add_element(self, element):
-        if not self._contains_element(element):
-            self._elements.append(element)
+        self._add(element)
+
+    def _add(self, element):
+        if self._shared:
+            self._unshare()
+        try:
+            key = self._element_key(element)
+            if key in self._index:
+                return
+            self._index[key] = len(self._items)
+        except TypeError:
+            if self._contains_element(element):
+                return
+            self._unhashable.append(element)
+        self._items.append(element)
 
     def remove_element(self, element):
-        new_elements = []
-        for elem in self._elements:
-            if not self._elements_equal(elem, element):
-                new_elements.append(elem)
-        self._elements = new_elements
+        if self._discard(element):
+            self._compact_if_sparse()
+
+    def remove_many(self, elements):
+        """Removing every given element, compacting at most once"""
+        for element in elements:
+            self._discard(element)
+        self._compact_if_sparse()
+
+    def discard_if(self, predicate):
+        """Removing the elements matching predicate in a single pass"""
+        self._retain_elements(lambda element: not predicate(element))
+
+    def _discard(self, element):
+        """Replacing an element with a tombstone, returns whether it was present"""
+        if self._shared:
+            self._unshare()
+        try:
+            position = self._index.pop(self._element_key(element), None)
+        except TypeError:
+            position = None
+            for i, elem in enumerate(self._items):
+                if elem is not _REMOVED and self._elements_equal(elem, element):
+                    position = i
+                    self._forget_element(elem)
+                    break
+        if position is None:
+            return False
+        self._items[position] = _REMOVED
+        self._removed += 1
+        return True
+
+    def _compact_if_sparse(self):
+        if self._removed * 2 > len(self._items):
+            self._compact()
+
+    def _compact(self):
+        """Dropping tombstones and renumbering the index"""
+        self._retain_elements(lambda element: True)
 
     def get_cardinality(self):
-        return len(self._elements)
+        return len(self._items) - self._removed
 
     def __contains__(self, element):
         return self._contains_element(element)
@@ -48,38 +139,39 @@ class Set:
     def __add__(self, other):
         if not isinstance(other, Set):
             return NotImplemented
-
         result = Set()
-        for elem in self._elements:
-            result.add_element(elem)
+        result._copy_storage(self)
         for elem in other._elements:
-            result.add_element(elem)
+            if not result._contains_element(elem):
+                result._append_element(elem)
         return result
 
     def __iadd__(self, other):
         if not isinstance(other, Set):
             return NotImplemented
         for elem in other._elements:
-            self.add_element(elem)
+            if not self._contains_element(elem):
+                self._append_element(elem)
         return self
 
     def __mul__(self, other):
         if not isinstance(other, Set):
             return NotImplemented
         result = Set()
-        for elem in self._elements:
-            if elem in other:
-                result.add_element(elem)
+        elements = self._elements
+        if len(other) < len(elements) and not other._unhashable:
+            for position in self._positions_of(other._elements):
+                result._append_element(elements[position])
+        else:
+            for elem in self._elements:
+                if other._contains_element(elem):
+                    result._append_element(elem)
         return result
 
     def __imul__(self, other):
         if not isinstance(other, Set):
             return NotImplemented
-        new_elements = []
-        for elem in self._elements:
-            if elem in other:
-                new_elements.append(elem)
-        self._elements = new_elements
+        self._retain_elements(other._contains_element)
         return self
 
     def __sub__(self, other):
@@ -87,41 +179,166 @@ class Set:
             return NotImplemented
         result = Set()
         for elem in self._elements:
-            if elem not in other:
-                result.add_element(elem)
+            if not other._contains_element(elem):
+                result._append_element(elem)
         return result
 
     def __isub__(self, other):
         if not isinstance(other, Set):
             return NotImplemented
-        new_elements = []
-        for elem in self._elements:
-            if elem not in other:
-                new_elements.append(elem)
-        self._elements = new_elements
+        self._retain_elements(lambda elem: not other._contains_element(elem))
         return self
 
-    def get_power_set(self):
-        elements_list = self._elements
-        n = len(elements_list)
-        total_subsets = 1 << n
-        all_subsets = []
-        for i in range(total_subsets):
-            subset = Set(unique_id=f"subset_{i}")
-            for j in range(n):
-                if i & (1 << j):
-                    subset.add_element(elements_list[j])
-            all_subsets.append(subset)
-        power_set = Set(unique_id="power_set")
-        for subset in all_subsets:
-            power_set.add_element(subset)
+    @classmethod
+    def from_elements(cls, elements, bound=None):
+        """Set of the elements, stored as a bitmap if they are small non-negative ints in ascending order"""
+        elements = list(elements)
+        bound = BitSet._check_bound(bound)
+        previous = -1
+        for element in elements:
+            if not BitSet._is_storable(element, bound) or element < previous:
+                return cls(elements)
+            previous = element
+        return BitSet(elements, bound=bound)
+
+    @classmethod
+    def union_all(cls, sets):
+        """Union of any number of sets in a single pass"""
+        result = cls()
+        for other in sets:
+            for elem in other._elements:
+                if not result._contains_element(elem):
+                    result._append_element(elem)
+        return result
+
+    @classmethod
+    def intersect_all(cls, sets):
+        """Intersection of any number of sets, probing from the smallest one"""
+        operands = sorted(sets, key=len)
+        result = cls()
+        if not operands:
+            return result
+        result._copy_storage(operands[0])
+        for other in operands[1:]:
+            if result.is_empty():
+                break
+            result._retain_elements(other._contains_element)
+        return result
 
+    def _copy_storage(self, other):
+        """Taking over a copy of another set's elements without duplicate checks"""
+        self._items = list(other._elements)
+        self._removed = 0
+        self._index = dict(other._index)
+        self._unhashable = list(other._unhashable)
+        self._shared = False
+
+    def _share_storage(self, other):
+        """Sharing another set's storage until one of them is mutated"""
+        self._items = other._items
+        self._removed = other._removed
+        self._index = other._index
+        self._unhashable = other._unhashable
+        self._shared = other._shared = True
+
+    def _unshare(self):
+        """Taking a private copy of storage shared with a snapshot"""
+        self._items = list(self._items)
+        self._index = dict(self._index)
+        self._unhashable = list(self._unhashable)
+        self._shared = False
+
+    def _positions_of(self, elements):
+        """Sorted positions of the given hashable elements present in this set"""
+        positions = []
+        for elem in elements:
+            position = self._index.get(self._element_key(elem))
+            if position is not None:
+                positions.append(position)
+        positions.sort()
+        return positions
+
+    def _retain_elements(self, keep):
+        """Compacting the storage in place, keeping elements accepted by keep"""
+        if self._shared:
+            self._unshare()
+        elements = self._items
+        write = 0
+        for elem in elements:
+            if elem is _REMOVED:
+                continue
+            if keep(elem):
+                try:
+                    self._index[self._element_key(elem)] = write
+                except TypeError:
+                    pass
+                elements[write] = elem
+                write += 1
+            else:
+                self._forget_element(elem)
+        del elements[write:]
+        self._removed = 0
+
+    def _forget_element(self, element):
+        """Dropping an element from the index"""
+        if self._shared:
+            self._unshare()
+        try:
+            del self._index[self._element_key(element)]
+        except TypeError:
+            for i, elem in enumerate(self._unhashable):
+                if self._elements_equal(elem, element):
+                    del self._unhashable[i]
+                    break
+
+    def get_power_set(self, frozen=False):
+        n = len(self)
+        if n > Set.MAX_POWER_SET_ELEMENTS:
+            raise ValueError(
+                f"Power set of {n} elements is too large to build, use iter_power_set"
+            )
+        power_set = Set()
+        for i in range(1 << n):
+            power_set._append_element(self._build_subset(i, frozen=frozen))
         return power_set
 
+    def iter_power_set(self, k=None, order="bitmask", frozen=False):
+        """Lazily yielding subsets (only k-sized ones if k is given)"""
+        if order not in ("bitmask", "gray"):
+            raise ValueError(f"Unknown power set order: {order}")
+        n = len(self)
+        if k is not None:
+            if 0 <= k <= n:
+                elements = self._elements
+                for positions in combinations(range(n), k):
+                    subset = FrozenSet() if frozen else Set()
+                    for position in positions:
+                        subset._append_element(elements[position])
+                    yield subset
+            return
+        for i in range(1 << n):
+            yield self._build_subset(i ^ (i >> 1) if order == "gray" else i, frozen=frozen)
+
+    def get_subset(self, index, frozen=False):
+        """Subset number index of the power set in bitmask order"""
+        if not 0 <= index < (1 << len(self)):
+            raise IndexError("Subset index out of range")
+        return self._build_subset(index, frozen=frozen)
+
+    def _build_subset(self, mask, frozen=False):
+        """Building the subset whose elements are selected by the bits of mask"""
+        subset = FrozenSet() if frozen else Set()
+        elements = self._elements
+        while mask:
+            low_bit = mask & -mask
+            subset._append_element(elements[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return subset
+
     def __eq__(self, other):
         if not isinstance(other, Set):
             return NotImplemented
-        if len(self._elements) != len(other._elements):
+        if len(self) != len(other):
             return False
         for elem in self._elements:
             if not other._contains_element(elem):
@@ -132,167 +349,136 @@ class Set:
         return not self == other
 
     def __str__(self):
-        if self.is_empty():
-            return "{}"
-        elements_str = []
-        for elem in self._elements:
+        """String form built with an explicit stack, so any nesting depth works"""
+        parts = ["{"]
+        stack = [iter(self._elements)]
+        first = True
+        while stack:
+            elem = next(stack[-1], _REMOVED)
+            if elem is _REMOVED:
+                stack.pop()
+                parts.append("}")
+                first = False
+                continue
+            if not first:
+                parts.append(", ")
+            first = False
             if isinstance(elem, Set):
-                elements_str.append(str(elem))
+                parts.append("{")
+                stack.append(iter(elem._elements))
+                first = True
             else:
-                elements_str.append(repr(elem))
-        return "{" + ", ".join(elements_str) + "}"
+                parts.append(repr(elem))
+        return "".join(parts)
 
     def __repr__(self):
-        return f"Set(elements={len(self._elements)})"
+        return f"Set(elements={len(self)})"
 
     def __iter__(self):
-        return self.SetIterator(self._elements)
+        """Iterating over a snapshot: the next mutation copies the storage
+        instead of tombstoning or compacting the list being read"""
+        elements = self._elements
+        self._shared = True
+        return self.SetIterator(elements)
 
     def __len__(self):
-        return len(self._elements)
-
-    def from_string(self, string_repr):
-        """Creating a set from a string"""
-        return self._parse_from_string(string_repr.strip())
-
-    def _parse_from_string(self, string_repr, level=0):
-        """Parsing a string into a set"""
-        if self._check_nesting_level(level):
-            raise ValueError("Maximum nesting level exceeded")
-        
-        string_repr = string_repr.strip()
-        if not self._validate_string_format(string_repr):
+        return len(self._items) - self._removed
+
+    def from_string(self, string_repr, frozen=False):
+        """Creating a set from a string, bytes or a file object"""
+        return self._parse_from_string(string_repr, frozen)
+
+    def _parse_from_string(self, string_repr, frozen=False):
+        """Parsing a string into a set in a single pass"""
+        set_class = FrozenSet if frozen else Set
+        text = self._read_source(string_repr)
+        stack = []
+        closed_set = None
+        result = None
+        start = 0
+        for match in _DELIMITERS.finditer(text):
+            char = match.group()
+            chunk = text[start:match.start()].strip()
+            start = match.end()
+            if result is not None:
+                raise ValueError("Unexpected characters after the closing brace")
+            if char == '{':
+                if chunk or closed_set is not None:
+                    raise ValueError("Nested set must be a separate element")
+                stack.append(set_class())
+                continue
+            if not stack:
+                raise ValueError("Set must be enclosed in curly braces")
+            current = stack[-1]
+            if closed_set is not None:
+                if chunk:
+                    raise ValueError("Nested set must be a separate element")
+                current._add(closed_set)
+                closed_set = None
+            elif chunk:
+                current._add(self._create_simple_element(chunk))
+            if char == '}':
+                if len(stack) == 1:
+                    result = stack.pop()
+                else:
+                    closed_set = stack.pop()
+        if result is None or text[start:].strip():
             raise ValueError("Set must be enclosed in curly braces")
-        
-        return self._parse_set_content(string_repr, level)
-
-    def _check_nesting_level(self, level):
-        """Checking the nesting level"""
-        return level > Set.MAX_NESTING_LEVEL
-
-    def _validate_string_format(self, string_repr):
-        """Checking string format"""
-        return string_repr.startswith('{') and string_repr.endswith('}')
-
-    def _parse_set_content(self, string_repr, level):
-        """Parsing the contents of a set"""
-        content = string_repr[1:-1].strip()
-        if not content:
-            return Set()
-        
-        return self._process_content_elements(content, level)
-
-    def _process_content_elements(self, content, level):
-        """Processing content elements"""
-        result = Set()
-        brace_count = 0
-        current_element = []
-        
-        for char in content:
-            brace_count, current_element = self._process_char(
-                char, brace_count, current_element, result, level
-            )
-        
-
-        self._process_final_element(current_element, result, level)
-        
         return result
 
-    def _process_char(self, char, brace_count, current_element, result_set, level):
-        """Processing a single character"""
-        if char == '{':
-            brace_count += 1
-            current_element.append(char)
-        elif char == '}':
-            brace_count -= 1
-            current_element.append(char)
-        elif char == ',' and brace_count == 0:
-            self._process_element(current_element, result_set, level)
-            current_element = []
-        else:
-            current_element.append(char)
-        
-        return brace_count, current_element
-
-    def _process_element(self, element_chars, result_set, level):
-        """Processing a completed item"""
-        element_str = self._chars_to_string(element_chars).strip()
-        if element_str:
-            element = self._create_element_from_string(element_str, level)
-            result_set.add_element(element)
-
-    def _process_final_element(self, element_chars, result_set, level):
-        """Processing the last element"""
-        element_str = self._chars_to_string(element_chars).strip()
-        if element_str:
-            element = self._create_element_from_string(element_str, level)
-            result_set.add_element(element)
-
-    def _create_element_from_string(self, element_str, level):
-        """Creating an element from a string"""
-        if element_str.startswith('{'):
-            return self._parse_from_string(element_str, level + 1)
-        else:
-
-            simple_element = element_str.strip()
-      
-            try:
-            
-                if simple_element.isdigit() or (simple_element[0] == '-' and simple_element[1:].isdigit()):
-                    return int(simple_element)
-            
-                if (len(simple_element) >= 2 and 
-                    ((simple_element[0] == "'" and simple_element[-1] == "'") or
-                     (simple_element[0] == '"' and simple_element[-1] == '"'))):
-                    return simple_element[1:-1]
-            except:
-                pass
-            return simple_element
-
-    def _chars_to_string(self, chars):
-        """Converting a list of characters to a string"""
-        return ''.join(chars)
-
-    def parse_string(self, string_repr):
+    def _read_source(self, source):
+        """Getting the text of a str, bytes or file object source"""
+        if hasattr(source, "read"):
+            source = source.read()
+        if isinstance(source, (bytes, bytearray)):
+            source = source.decode("utf-8")
+        return source.strip()
+
+    def _create_simple_element(self, element_str):
+        """Creating a number or string element from a string"""
+        try:
+            if element_str.isdigit() or (element_str[0] == '-' and element_str[1:].isdigit()):
+                return int(element_str)
+        except ValueError:
+            pass
+        if (len(element_str) >= 2 and
+            ((element_str[0] == "'" and element_str[-1] == "'") or
+             (element_str[0] == '"' and element_str[-1] == '"'))):
+            return element_str[1:-1]
+        return element_str
+
+    def parse_string(self, string_repr, frozen=False):
         """Parsing a string as a regular instance method"""
-        return self._parse_from_string(string_repr)
+        return self._parse_from_string(string_repr, frozen)
 
     def copy(self):
+        """Copy-on-write snapshot sharing storage with this set"""
         new_set = Set()
-        for element in self._elements:
-            if isinstance(element, Set):
-                copied_element = Set(unique_id=element._id)
-                for sub_elem in element._elements:
-                    copied_element.add_element(sub_elem)
-                new_set.add_element(copied_element)
-            else:
-                new_set.add_element(element)
+        new_set._share_storage(self)
         return new_set
 
+    def freeze(self):
+        """Immutable hashable copy of the set"""
+        frozen = FrozenSet()
+        frozen._id = self._id
+        frozen._share_storage(self)
+        return frozen
+
     def __copy__(self):
         return self.copy()
 
     def __deepcopy__(self, memo):
-        return self.copy()
-
-    def __del__(self):
-        Set._set_counter -= 1
-
-    def set_from_string(string_repr):
-        """Creating a set from a string (external function)"""
-        return Set().from_string(string_repr)
-
-
-    def create_empty_set():
-        """Creating an empty set"""
-        return Set()
-
-
-    def create_set_from_elements(elements):
-        """Creating a set from a list of elements"""
-        return Set(elements)
+        """Copy with nested sets and other elements deep-copied, keeping set ids"""
+        new_set = type(self)()
+        new_set._id = self._id
+        memo[id(self)] = new_set
+        for elem in self._elements:
+            new_set._append_element(copy.deepcopy(elem, memo))
+        return new_set
 
     class SetIterator:
+        __slots__ = ("_elements", "_index")
+
         def __init__(self, elements):
             self._elements = elements
             self._index = 0
@@ -301,8 +487,424 @@ class Set:
             return self
 
         def __next__(self):
-            if self._index < len(self._elements):
+            while self._index < len(self._elements):
                 result = self._elements[self._index]
                 self._index += 1
-                return result
+                if result is not _REMOVED:
+                    return result
             raise StopIteration
+
+
+def set_from_string(string_repr):
+    """Creating a set from a string (external function)"""
+    return Set().from_string(string_repr)
+
+
+def create_empty_set():
+    """Creating an empty set"""
+    return Set()
+
+
+def create_set_from_elements(elements):
+    """Creating a set from a list of elements"""
+    return Set(elements)
+
+
+class FrozenSet(Set):
+    """Immutable set with structural equality and a cached hash"""
+    __slots__ = ("_hash",)
+
+    def __init__(self, elements=None, unique_id=None):
+        self._hash = None
+        super().__init__(elements, unique_id)
+
+    def __hash__(self):
+        if self._hash is None:
+            if self._unhashable:
+                raise TypeError("FrozenSet with unhashable elements is not hashable")
+            self._hash = hash(frozenset(self._index))
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenSet) and not (self._unhashable or other._unhashable):
+            if hash(self) != hash(other):
+                return False
+            shapes = {}
+            return self._shape_id(shapes) == other._shape_id(shapes)
+        return super().__eq__(other)
+
+    def _shape_id(self, shapes):
+        """Number identifying the structure of this set among the sets numbered in shapes
+
+        Nested frozen sets are numbered bottom-up with an explicit stack, so
+        comparing deeply nested sets does not recurse."""
+        numbers = {}
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in numbers:
+                continue
+            if not expanded:
+                stack.append((node, True))
+                for elem in node._elements:
+                    if isinstance(elem, FrozenSet) and id(elem) not in numbers:
+                        stack.append((elem, False))
+                continue
+            shape = frozenset((_SHAPE_KEY, numbers[id(elem)]) if isinstance(elem, FrozenSet)
+                              else node._element_key(elem) for elem in node._elements)
+            numbers[id(node)] = shapes.setdefault(shape, len(shapes))
+        return numbers[id(self)]
+
+    def _immutable(self, *args):
+        raise TypeError("FrozenSet is immutable")
+
+    add_element = _immutable
+    remove_element = _immutable
+    remove_many = _immutable
+    discard_if = _immutable
+
+    def __add__(self, other):
+        return self._frozen_result(super().__add__(other))
+
+    def __mul__(self, other):
+        return self._frozen_result(super().__mul__(other))
+
+    def __sub__(self, other):
+        return self._frozen_result(super().__sub__(other))
+
+    def __iadd__(self, other):
+        return self + other
+
+    def __imul__(self, other):
+        return self * other
+
+    def __isub__(self, other):
+        return self - other
+
+    def _frozen_result(self, result):
+        """Wrapping the storage of a fresh operator result without copying"""
+        if result is NotImplemented:
+            return result
+        frozen = FrozenSet()
+        frozen._items = result._elements
+        frozen._index = result._index
+        frozen._unhashable = result._unhashable
+        return frozen
+
+    def __repr__(self):
+        return f"FrozenSet(elements={len(self)})"
+
+    def freeze(self):
+        return self
+
+    def copy(self):
+        return self
+
+
+class BitSet(Set):
+    """Set of non-negative integers below a bound stored as a bitmap
+
+    A bitmap lists its elements in ascending order, which is also their
+    insertion order as long as every new element is larger than the current
+    ones. Adding a smaller element, or one the bitmap cannot hold, moves the
+    set to regular list-backed storage, so a BitSet can stand in for a Set."""
+    __slots__ = ("_bound", "_bitmap", "_count", "_list")
+    DEFAULT_BOUND = 1 << 26
+
+    def __init__(self, elements=None, unique_id=None, bound=None):
+        self._id = _new_set_id(unique_id)
+        self._bound = BitSet._check_bound(bound)
+        self._bitmap = bytearray()
+        self._count = 0
+        self._shared = False
+        self._list = None
+        if elements is not None:
+            for element in elements:
+                self._add(element)
+
+    @staticmethod
+    def _check_bound(bound):
+        if bound is None:
+            return BitSet.DEFAULT_BOUND
+        if type(bound) is not int or bound <= 0:
+            raise ValueError(f"BitSet bound must be a positive integer, got {bound!r}")
+        return bound
+
+    @staticmethod
+    def _is_storable(element, bound):
+        return type(element) is int and 0 <= element < bound
+
+    @staticmethod
+    def _bit_index(element):
+        """Bit of an element equal to an int (e.g. True or 1.0), or -1"""
+        if isinstance(element, int):
+            return element
+        try:
+            index = int(element)
+        except (TypeError, ValueError, OverflowError):
+            return -1
+        return index if index == element else -1
+
+    @property
+    def _elements(self):
+        if self._list is not None:
+            return self._list._elements
+        return list(self._iter_bits())
+
+    @property
+    def _index(self):
+        if self._list is not None:
+            return self._list._index
+        return {element: position for position, element in enumerate(self._iter_bits())}
+
+    @property
+    def _unhashable(self):
+        if self._list is not None:
+            return self._list._unhashable
+        return ()
+
+    def _iter_bits(self):
+        return self._iter_bitmap(self._bitmap)
+
+    @staticmethod
+    def _iter_bitmap(bitmap):
+        for byte_index, byte in enumerate(bitmap):
+            if byte:
+                base = byte_index << 3
+                for bit in _BYTE_BITS[byte]:
+                    yield base + bit
+
+    def _bits(self):
+        return int.from_bytes(self._bitmap, "little")
+
+    def _set_bits(self, bits):
+        self._bitmap = bytearray(bits.to_bytes((bits.bit_length() + 7) >> 3, "little"))
+        self._count = bits.bit_count()
+        self._shared = False
+
+    def _keeps_order(self, bits, new_bits):
+        """Whether appending new_bits to bits keeps insertion order ascending"""
+        return not new_bits or (new_bits & -new_bits).bit_length() > bits.bit_length()
+
+    def _to_list(self):
+        """Moving the elements to list-backed storage, keeping their order"""
+        storage = Set()
+        for element in self._iter_bits():
+            storage._append_element(element)
+        self._list = storage
+        self._bitmap = bytearray()
+        self._count = 0
+        self._shared = False
+
+    def _unshare(self):
+        self._bitmap = bytearray(self._bitmap)
+        self._shared = False
+
+    def _from_bits(self, bits, bound):
+        result = BitSet(bound=bound)
+        result._set_bits(bits)
+        return result
+
+    def _contains_element(self, element):
+        if self._list is not None:
+            return self._list._contains_element(element)
+        index = self._bit_index(element)
+        if index < 0:
+            return False
+        byte_index = index >> 3
+        return byte_index < len(self._bitmap) and bool(self._bitmap[byte_index] >> (index & 7) & 1)
+
+    def _highest(self):
+        """Largest element of the bitmap, or -1 (the bitmap has no trailing zero bytes)"""
+        if not self._bitmap:
+            return -1
+        return ((len(self._bitmap) - 1) << 3) + self._bitmap[-1].bit_length() - 1
+
+    def _add(self, element):
+        if self._list is None and self._is_storable(element, self._bound):
+            if self._contains_element(element):
+                return
+            if element > self._highest():
+                if self._shared:
+                    self._unshare()
+                byte_index = element >> 3
+                if byte_index >= len(self._bitmap):
+                    self._bitmap.extend(bytes(byte_index + 1 - len(self._bitmap)))
+                self._bitmap[byte_index] |= 1 << (element & 7)
+                self._count += 1
+                return
+        if self._list is None:
+            if self._contains_element(element):
+                return
+            self._to_list()
+        self._list._add(element)
+
+    _append_element = _add
+
+    def add_element(self, element):
+        self._add(element)
+
+    def _discard(self, element):
+        if self._list is not None:
+            return self._list._discard(element)
+        if not self._contains_element(element):
+            return False
+        if self._shared:
+            self._unshare()
+        index = self._bit_index(element)
+        self._bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        self._count -= 1
+        while self._bitmap and not self._bitmap[-1]:
+            self._bitmap.pop()
+        return True
+
+    def _forget_element(self, element):
+        if self._list is not None:
+            self._list._forget_element(element)
+        else:
+            self._discard(element)
+
+    def _compact_if_sparse(self):
+        if self._list is not None:
+            self._list._compact_if_sparse()
+
+    def _retain_elements(self, keep):
+        if self._list is not None:
+            self._list._retain_elements(keep)
+            return
+        for element in list(self._iter_bits()):
+            if not keep(element):
+                self._forget_element(element)
+
+    def _copy_storage(self, other):
+        self._bitmap = bytearray()
+        self._count = 0
+        self._shared = False
+        self._list = None
+        for element in other._elements:
+            self._add(element)
+
+    def is_empty(self):
+        return len(self) == 0
+
+    def get_cardinality(self):
+        return len(self)
+
+    def __len__(self):
+        if self._list is not None:
+            return len(self._list)
+        return self._count
+
+    def __iter__(self):
+        if self._list is not None:
+            return iter(self._list)
+        self._shared = True
+        return self._iter_bitmap(self._bitmap)
+
+    def _both_bitmaps(self, other):
+        return self._list is None and isinstance(other, BitSet) and other._list is None
+
+    def __add__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        if self._both_bitmaps(other):
+            bits = self._bits()
+            new_bits = other._bits() & ~bits
+            if self._keeps_order(bits, new_bits):
+                return self._from_bits(bits | new_bits, max(self._bound, other._bound))
+            result = Set()
+            result._copy_storage(self)
+            new_bytes = new_bits.to_bytes((new_bits.bit_length() + 7) >> 3, "little")
+            for element in self._iter_bitmap(new_bytes):
+                result._append_element(element)
+            return result
+        result = self.copy()
+        result += other
+        return result
+
+    def __iadd__(self, other):
+        if self._both_bitmaps(other):
+            bits = self._bits()
+            new_bits = other._bits() & ~bits
+            if self._keeps_order(bits, new_bits) and new_bits.bit_length() <= self._bound:
+                self._set_bits(bits | new_bits)
+                return self
+        return super().__iadd__(other)
+
+    def __mul__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        if self._list is not None:
+            return super().__mul__(other)
+        if self._both_bitmaps(other):
+            return self._from_bits(self._bits() & other._bits(), self._bound)
+        result = BitSet(bound=self._bound)
+        if len(self) <= len(other):
+            for element in self._iter_bits():
+                if other._contains_element(element):
+                    result._add(element)
+        else:
+            common = [element for element in other._elements if self._contains_element(element)]
+            for element in sorted(common):
+                result._add(element)
+        return result
+
+    def __imul__(self, other):
+        if self._both_bitmaps(other):
+            self._set_bits(self._bits() & other._bits())
+            return self
+        return super().__imul__(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        if self._list is not None:
+            return super().__sub__(other)
+        if self._both_bitmaps(other):
+            return self._from_bits(self._bits() & ~other._bits(), self._bound)
+        result = BitSet(bound=self._bound)
+        for element in self._iter_bits():
+            if not other._contains_element(element):
+                result._add(element)
+        return result
+
+    def __isub__(self, other):
+        if self._both_bitmaps(other):
+            self._set_bits(self._bits() & ~other._bits())
+            return self
+        return super().__isub__(other)
+
+    def __eq__(self, other):
+        if self._both_bitmaps(other):
+            return self._count == other._count and self._bits() == other._bits()
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f"BitSet(elements={len(self)})"
+
+    def copy(self):
+        result = BitSet(bound=self._bound)
+        if self._list is not None:
+            result._list = self._list.copy()
+            return result
+        result._bitmap = self._bitmap
+        result._count = self._count
+        result._shared = self._shared = True
+        return result
+
+    def freeze(self):
+        frozen = FrozenSet()
+        frozen._id = self._id
+        frozen._copy_storage(self)
+        return frozen
+
+    def __deepcopy__(self, memo):
+        result = BitSet(bound=self._bound)
+        result._id = self._id
+        memo[id(self)] = result
+        if self._list is not None:
+            result._list = copy.deepcopy(self._list, memo)
+        else:
+            result._bitmap = bytearray(self._bitmap)
+            result._count = self._count
+        return result
@@ -0,0 +1,118 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch
+from batch import BatchSession, format_stats, run_batch
+from rectangle import Rectangle
+
+
+class TestBatchMode(unittest.TestCase):
+
+    def run_lines(self, text, **kwargs):
+        output = io.StringIO()
+        errors = io.StringIO()
+        failures = run_batch(io.StringIO(text), output, errors, **kwargs)
+        return failures, output.getvalue(), errors.getvalue()
+
+    def test_rectangle_operations(self):
+        failures, output, errors = self.run_lines(
+            "rect new a 0 0 4 4\n"
+            "rect new b 2 2 4 4  # second\n"
+            "\n"
+            "rect union u a b\n"
+            "rect intersect i a b\n"
+            "rect inc big a\n"
+            "rect dec small b\n"
+            "rect show u\nrect show i\nrect show big\nrect show small\n"
+            "rect move a 1 1\nrect resize a 2 2\nrect show a\n"
+            "rect eq a b\n")
+        self.assertEqual(failures, 0)
+        self.assertEqual(errors, "")
+        self.assertEqual(output.splitlines(),
+                         ["0 0 6 6", "2 2 2 2", "0 0 5 5", "2 2 3 3", "1 1 2 2", "False"])
+
+    def test_hash_inside_quotes_is_not_a_comment(self):
+        failures, output, errors = self.run_lines(
+            "set new s {1}  # start\n"
+            "set add s 'a#b'  # quoted\n"
+            "set add s \"c # d\"\n"
+            "set contains s 'a#b'\n"
+            "set size s\n")
+        self.assertEqual(failures, 0, errors)
+        self.assertEqual(output.splitlines(), ["True", "3"])
+
+    def test_set_operations(self):
+        failures, output, _ = self.run_lines(
+            "set new s {1, 2, 3}\n"
+            "set new t {2, 3, x}\n"
+            "set union u s t\nset intersect i s t\nset diff d s t\n"
+            "set show u\nset show i\nset show d\n"
+            "set add d 'a b'\nset remove d 1\nset show d\n"
+            "set contains t x\nset contains t 1\n"
+            "set power p i\nset size p\n"
+            "set new e\nset size e\n")
+        self.assertEqual(failures, 0)
+        self.assertEqual(output.splitlines(),
+                         ["{1, 2, 3, 'x'}", "{2, 3}", "{1}", "{'a b'}",
+                          "True", "False", "4", "0"])
+
+    def test_deeply_nested_set(self):
+        text = "{" * 2000 + "}" * 2000
+        failures, output, _ = self.run_lines(f"set new s {text}\nset show s\nset size s\n")
+        self.assertEqual(failures, 0)
+        self.assertEqual(output.splitlines(), [text, "1"])
+
+    def test_errors_are_reported_and_skipped(self):
+        failures, output, errors = self.run_lines(
+            "rect show missing\nrect new a 1 2\nbogus op\nrect\nrect new a 1 2 3 4\nrect show a\n")
+        self.assertEqual(failures, 4)
+        self.assertEqual(output, "1 2 3 4\n")
+        self.assertEqual([line.split(":")[0] for line in errors.splitlines()],
+                         ["line 1", "line 2", "line 3", "line 4"])
+        failures, output, _ = self.run_lines("bogus op\nrect new a 1 2 3 4\nrect show a\n", keep_going=False)
+        self.assertEqual((failures, output), (1, ""))
+
+    def test_output_is_written_in_batches(self):
+        session = BatchSession()
+        session.execute("rect new a 0 0 1 1")
+        original = batch.OUTPUT_BATCH_SIZE
+        batch.OUTPUT_BATCH_SIZE = 3
+        try:
+            _, output, _ = self.run_lines("rect show a\n" * 7, session=session)
+        finally:
+            batch.OUTPUT_BATCH_SIZE = original
+        self.assertEqual(output, "0 0 1 1\n" * 7)
+        self.assertEqual(session.rectangles["a"], Rectangle(0, 0, 1, 1))
+
+    def test_bench_stats(self):
+        stats = {}
+        self.run_lines("rect new a 0 0 1 1\nrect show a\nrect show a\n", stats=stats)
+        self.assertEqual(stats[("rect", "show")][0], 2)
+        self.assertEqual(stats[("rect", "new")][0], 1)
+        report = format_stats(stats)
+        self.assertIn("rect show", report)
+        self.assertIn("ops/sec", report)
+
+    def test_main_reads_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = os.path.join(directory, "first.txt")
+            second = os.path.join(directory, "second.txt")
+            with open(first, "w") as file:
+                file.write("rect new a 0 0 2 2\n")
+            with open(second, "w") as file:
+                file.write("rect show a\n")
+            output = io.StringIO()
+            errors = io.StringIO()
+            with redirect_stdout(output), redirect_stderr(errors):
+                code = batch.main([first, second, "--bench"])
+        self.assertEqual(code, 0)
+        self.assertEqual(output.getvalue(), "0 0 2 2\n")
+        self.assertIn("ops/sec", errors.getvalue())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
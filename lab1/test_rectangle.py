@@ -180,5 +180,47 @@ class TestRectangleAdvanced(unittest.TestCase):
         union2 = rect1 + (rect2 + rect3)
         self.assertEqual(union1, union2)
 
+class TestRectangleInPlace(unittest.TestCase):
+
+    def test_in_place_union_keeps_object(self):
+        rect1 = Rectangle(0, 0, 2, 2)
+        original = rect1
+        rect1 += Rectangle(-1, 3, 1, 1)
+        self.assertIs(rect1, original)
+        self.assertEqual(rect1, Rectangle(-1, 0, 3, 4))
+
+    def test_in_place_intersection_keeps_object(self):
+        rect1 = Rectangle(0, 0, 3, 3)
+        original = rect1
+        rect1 -= Rectangle(1, 1, 5, 5)
+        self.assertIs(rect1, original)
+        self.assertEqual(rect1, Rectangle(1, 1, 2, 2))
+
+    def test_in_place_empty_intersection(self):
+        rect1 = Rectangle(0, 0, 1, 1)
+        rect1.move(5, 5)
+        rect1 -= Rectangle(0, 0, 2, 2)
+        self.assertEqual(rect1, Rectangle())
+
+    def test_empty_intersection_results_are_independent(self):
+        empty1 = Rectangle(0, 0, 1, 1) - Rectangle(5, 5, 1, 1)
+        empty2 = Rectangle(0, 0, 1, 1) - Rectangle(5, 5, 1, 1)
+        empty1.move(3, 3)
+        self.assertEqual(empty2, Rectangle())
+
+    def test_intersects(self):
+        self.assertTrue(Rectangle(0, 0, 2, 2).intersects(Rectangle(1, 1, 2, 2)))
+        self.assertFalse(Rectangle(0, 0, 2, 2).intersects(Rectangle(2, 0, 2, 2)))
+
+    def test_in_place_invalid_operand(self):
+        rect = Rectangle()
+        with self.assertRaises(TypeError):
+            rect += 1
+        with self.assertRaises(TypeError):
+            rect -= 1
+
+    def test_slots(self):
+        self.assertFalse(hasattr(Rectangle(), "__dict__"))
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,76 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import Rectangle
+from rectangle_array import RectangleArray, np
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestRectangleArray(unittest.TestCase):
+
+    def setUp(self):
+        self.rectangles = [Rectangle(0, 0, 2, 2), Rectangle(5, 5, -3, -2), Rectangle(1, 1, 3, 3)]
+        self.array = RectangleArray.from_rectangles(self.rectangles)
+
+    def test_round_trip(self):
+        self.assertEqual(self.array.to_rectangles(), self.rectangles)
+        self.assertEqual(len(self.array), 3)
+        self.assertEqual(self.array[1], Rectangle(2, 3, 3, 2))
+        self.assertEqual(list(self.array[1:]), self.rectangles[1:])
+        self.assertEqual(len(RectangleArray.from_rectangles([])), 0)
+
+    def test_normalize_on_construction(self):
+        array = RectangleArray([5], [5], [-3], [-2])
+        self.assertEqual(array[0], Rectangle(5, 5, -3, -2))
+
+    def test_move_and_resize(self):
+        self.array.move(1, [0, 1, 2])
+        self.array.resize(-2, 4)
+        expected = []
+        for rect, dy in zip(self.rectangles, [0, 1, 2]):
+            rect.move(1, dy)
+            rect.resize(-2, 4)
+            expected.append(rect)
+        self.assertEqual(self.array.to_rectangles(), expected)
+
+    def test_float_move_and_resize_upcast(self):
+        self.array.move(0.5, 0)
+        self.array.resize([1, 2, 3], 1.5)
+        expected = []
+        for rect, width in zip(self.rectangles, [1, 2, 3]):
+            rect.move(0.5, 0)
+            rect.resize(width, 1.5)
+            expected.append(rect)
+        self.assertEqual(self.array.to_rectangles(), expected)
+        self.assertEqual(self.array.get_x().dtype, np.float64)
+
+    def test_areas_and_vertices(self):
+        self.assertEqual(self.array.areas().tolist(), [4, 6, 9])
+        vertices = self.array.get_vertices()
+        self.assertEqual(vertices.shape, (3, 4, 2))
+        self.assertEqual(vertices[2].tolist(), [list(v) for v in self.rectangles[2].get_vertices()])
+
+    def test_pairwise_operations_match_rectangle(self):
+        others = [Rectangle(1, 1, 2, 2), Rectangle(10, 10, 1, 1), Rectangle(0, 0, 2, 2)]
+        other_array = RectangleArray.from_rectangles(others)
+        self.assertEqual((self.array + other_array).to_rectangles(),
+                         [a + b for a, b in zip(self.rectangles, others)])
+        self.assertEqual((self.array - other_array).to_rectangles(),
+                         [a - b for a, b in zip(self.rectangles, others)])
+        self.assertEqual(self.array.overlaps(other_array).tolist(), [True, False, True])
+
+    def test_broadcast_operations(self):
+        query = Rectangle(1, 1, 1, 1)
+        self.assertEqual((self.array + query).to_rectangles(),
+                         [rect + query for rect in self.rectangles])
+        self.assertEqual((self.array - query).to_rectangles(),
+                         [rect - query for rect in self.rectangles])
+
+    def test_invalid_operand(self):
+        with self.assertRaises(TypeError):
+            self.array + 1
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
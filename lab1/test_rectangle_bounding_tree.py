@@ -0,0 +1,101 @@
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import Rectangle
+from rectangle_bounding_tree import BoundingTree
+
+
+def random_rectangle(rng):
+    return Rectangle(rng.randint(-500, 500), rng.randint(-500, 500),
+                     rng.randint(0, 40), rng.randint(0, 40))
+
+
+def total_bounds(rectangles):
+    total = None
+    for rect in rectangles:
+        if total is None:
+            total = rect.copy()
+        else:
+            total += rect
+    return total.get_bounds() if total is not None else None
+
+
+class TestBoundingTree(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(7)
+        self.rectangles = [random_rectangle(self.rng) for _ in range(300)]
+
+    def test_empty_tree(self):
+        tree = BoundingTree()
+        self.assertEqual(len(tree), 0)
+        self.assertIsNone(tree.get_bounds())
+        self.assertIsNone(tree.get_rectangle())
+        self.assertEqual(tree.get_subtree_bounds(2), [])
+        self.assertEqual(tree.query_overlap(Rectangle(0, 0, 10, 10)), [])
+
+    def test_bounds_match_running_union(self):
+        tree = BoundingTree(self.rectangles[:50])
+        for rect in self.rectangles[50:]:
+            tree.insert(rect)
+        self.assertEqual(len(tree), 300)
+        self.assertEqual(tree.get_bounds(), total_bounds(self.rectangles))
+        x1, y1, x2, y2 = tree.get_bounds()
+        self.assertEqual(tree.get_rectangle(), Rectangle(x1, y1, x2 - x1, y2 - y1))
+
+    def test_removal_shrinks_bounds(self):
+        tree = BoundingTree(self.rectangles)
+        remaining = list(self.rectangles)
+        self.rng.shuffle(remaining)
+        while len(remaining) > 1:
+            tree.remove(remaining.pop())
+            self.assertEqual(tree.get_bounds(), total_bounds(remaining))
+        tree.remove(remaining.pop())
+        self.assertIsNone(tree.get_bounds())
+        self.assertEqual(list(tree), [])
+
+    def test_move_and_update(self):
+        rect = Rectangle(0, 0, 2, 2)
+        tree = BoundingTree(self.rectangles + [rect])
+        tree.move(rect, 10000, 10000)
+        self.assertEqual(tree.get_bounds()[2:], (10002, 10002))
+        tree.move(rect, -10000, -10000)
+        self.assertEqual(tree.get_bounds(), total_bounds(self.rectangles + [rect]))
+        rect.resize(-2000, 5)
+        tree.update(rect)
+        self.assertEqual(tree.get_bounds()[0], -2000)
+
+    def test_subtree_bounds_and_overlap_query(self):
+        tree = BoundingTree(self.rectangles)
+        for depth in range(4):
+            subtrees = tree.get_subtree_bounds(depth)
+            self.assertTrue(subtrees)
+            merged = (min(b[0] for b in subtrees), min(b[1] for b in subtrees),
+                      max(b[2] for b in subtrees), max(b[3] for b in subtrees))
+            self.assertEqual(merged, tree.get_bounds())
+        self.assertEqual(len(tree.get_subtree_bounds(30)), len(self.rectangles))
+        query = Rectangle(-100, -100, 200, 200)
+        expected = [rect for rect in self.rectangles if rect.intersects(query)]
+        self.assertEqual(sorted(map(id, tree.query_overlap(query))), sorted(map(id, expected)))
+
+    def test_errors(self):
+        rect = Rectangle(0, 0, 1, 1)
+        tree = BoundingTree([rect])
+        self.assertIn(rect, tree)
+        with self.assertRaises(ValueError):
+            tree.insert(rect)
+        with self.assertRaises(ValueError):
+            BoundingTree([rect, rect])
+        tree.remove(rect)
+        with self.assertRaises(KeyError):
+            tree.remove(rect)
+        with self.assertRaises(KeyError):
+            tree.move(rect, 1, 1)
+        with self.assertRaises(ValueError):
+            tree.get_subtree_bounds(-1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+import gc
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import FrozenRectangle, Rectangle
+from rectangle_cache import RectangleCache
+
+
+class TestFrozenRectangle(unittest.TestCase):
+
+    def test_immutable_and_hashable(self):
+        frozen = Rectangle(1, 2, 3, 4).freeze()
+        self.assertIsInstance(frozen, FrozenRectangle)
+        self.assertEqual(frozen, Rectangle(1, 2, 3, 4))
+        self.assertEqual({frozen: 1}[FrozenRectangle(1, 2, 3, 4)], 1)
+        with self.assertRaises(TypeError):
+            frozen.move(1, 1)
+        with self.assertRaises(TypeError):
+            frozen.resize(1, 1)
+        self.assertIs(frozen.copy(), frozen)
+
+    def test_operators_return_frozen(self):
+        frozen = FrozenRectangle(0, 0, 2, 2)
+        original = frozen
+        frozen += Rectangle(1, 1, 2, 2)
+        self.assertEqual(original, Rectangle(0, 0, 2, 2))
+        self.assertEqual(frozen, Rectangle(0, 0, 3, 3))
+        self.assertIsInstance(frozen, FrozenRectangle)
+        self.assertIsInstance(original - Rectangle(10, 10, 1, 1), FrozenRectangle)
+        self.assertIsInstance(-original, FrozenRectangle)
+        self.assertIsInstance(+original, FrozenRectangle)
+
+
+class TestRectangleCache(unittest.TestCase):
+
+    def test_interning(self):
+        cache = RectangleCache()
+        rect = cache.get(1, 2, 3, 4)
+        self.assertIs(cache.get(1, 2, 3, 4), rect)
+        self.assertIs(cache.get(4, 6, -3, -4), rect)
+        self.assertIs(cache.intern(Rectangle(1, 2, 3, 4)), rect)
+        default = cache.default()
+        self.assertIs(cache.get(), default)
+        self.assertEqual(default, Rectangle())
+        stats = cache.get_stats()
+        self.assertEqual((stats["intern_hits"], stats["intern_misses"]), (4, 2))
+
+    def test_unused_rectangles_are_released(self):
+        cache = RectangleCache()
+        cache.get(1, 2, 3, 4)
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+
+    def test_memoized_operations(self):
+        cache = RectangleCache()
+        rect1, rect2 = Rectangle(0, 0, 4, 4), Rectangle(2, 2, 4, 4)
+        union = cache.union(rect1, rect2)
+        self.assertEqual(union, rect1 + rect2)
+        self.assertIs(cache.union(Rectangle(0, 0, 4, 4), Rectangle(2, 2, 4, 4)), union)
+        self.assertEqual(cache.intersection(rect1, rect2), rect1 - rect2)
+        self.assertIs(cache.intersection(rect1, Rectangle(10, 10, 1, 1)), cache.default())
+        stats = cache.get_stats()
+        self.assertEqual((stats["memo_hits"], stats["memo_misses"]), (1, 3))
+        with self.assertRaises(TypeError):
+            cache.union(rect1, "rect")
+
+    def test_memo_is_bounded_lru(self):
+        cache = RectangleCache(memo_size=2)
+        base = Rectangle(0, 0, 1, 1)
+        cache.union(base, Rectangle(1, 0, 1, 1))
+        cache.union(base, Rectangle(2, 0, 1, 1))
+        cache.union(base, Rectangle(1, 0, 1, 1))
+        cache.union(base, Rectangle(3, 0, 1, 1))
+        self.assertEqual(cache.get_stats()["memoized"], 2)
+        cache.union(base, Rectangle(1, 0, 1, 1))
+        self.assertEqual(cache.memo_hits, 2)
+        cache.union(base, Rectangle(2, 0, 1, 1))
+        self.assertEqual(cache.memo_misses, 4)
+        with self.assertRaises(ValueError):
+            RectangleCache(memo_size=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import Rectangle
+from rectangle_geometry import (find_overlapping_pairs, iter_overlapping_pairs,
+                                union_area, coverage_decomposition)
+
+
+def covered_cells(rectangles):
+    cells = set()
+    for rect in rectangles:
+        x1, y1, x2, y2 = rect.get_bounds()
+        for x in range(x1, x2):
+            for y in range(y1, y2):
+                cells.add((x, y))
+    return cells
+
+
+def naive_overlapping_pairs(rectangles):
+    pairs = []
+    for i in range(len(rectangles)):
+        for j in range(i + 1, len(rectangles)):
+            x1, y1, x2, y2 = rectangles[i].get_bounds()
+            qx1, qy1, qx2, qy2 = rectangles[j].get_bounds()
+            if max(x1, qx1) < min(x2, qx2) and max(y1, qy1) < min(y2, qy2):
+                pairs.append((i, j))
+    return pairs
+
+
+class TestOverlappingPairs(unittest.TestCase):
+
+    def test_no_rectangles(self):
+        self.assertEqual(find_overlapping_pairs([]), [])
+
+    def test_simple_overlap(self):
+        rect1 = Rectangle(0, 0, 2, 2)
+        rect2 = Rectangle(1, 1, 2, 2)
+        pairs = find_overlapping_pairs([rect1, rect2])
+        self.assertEqual(pairs, [(0, 1, Rectangle(1, 1, 1, 1))])
+
+    def test_touching_and_degenerate_rectangles(self):
+        rectangles = [Rectangle(0, 0, 2, 2), Rectangle(2, 0, 2, 2),
+                      Rectangle(0, 2, 2, 2), Rectangle(1, 0, 0, 5)]
+        self.assertEqual(find_overlapping_pairs(rectangles), [])
+
+    def test_identical_rectangles(self):
+        rectangles = [Rectangle(0, 0, 1, 1) for _ in range(4)]
+        self.assertEqual(len(find_overlapping_pairs(rectangles)), 6)
+
+    def test_matches_naive_double_loop(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            rectangles = [Rectangle(rng.randint(0, 50), rng.randint(0, 50),
+                                    rng.randint(-10, 10), rng.randint(-10, 10))
+                          for _ in range(80)]
+            pairs = find_overlapping_pairs(rectangles)
+            self.assertEqual(sorted((i, j) for i, j, _ in pairs),
+                             naive_overlapping_pairs(rectangles))
+            for i, j, intersection in pairs:
+                self.assertEqual(intersection, rectangles[i] - rectangles[j])
+
+    def test_generator_is_lazy(self):
+        rectangles = [Rectangle(0, 0, 10, 10) for _ in range(1000)]
+        pairs = iter_overlapping_pairs(rectangles)
+        first = next(pairs)
+        self.assertEqual(first[2], Rectangle(0, 0, 10, 10))
+
+class TestUnionArea(unittest.TestCase):
+
+    def test_empty_and_degenerate(self):
+        self.assertEqual(union_area([]), 0)
+        self.assertEqual(union_area([Rectangle(0, 0, 0, 5)]), 0)
+        self.assertEqual(coverage_decomposition([Rectangle(0, 0, 5, 0)]), [])
+
+    def test_overlapping_rectangles(self):
+        rectangles = [Rectangle(0, 0, 2, 2), Rectangle(1, 1, 2, 2)]
+        self.assertEqual(union_area(rectangles), 7)
+
+    def test_nested_rectangles(self):
+        rectangles = [Rectangle(0, 0, 10, 10), Rectangle(2, 2, 3, 3)]
+        self.assertEqual(union_area(rectangles), 100)
+        self.assertEqual(coverage_decomposition(rectangles), [Rectangle(0, 0, 10, 10)])
+
+    def test_matches_rasterization(self):
+        rng = random.Random(11)
+        for _ in range(30):
+            rectangles = [Rectangle(rng.randint(0, 20), rng.randint(0, 20),
+                                    rng.randint(-6, 6), rng.randint(-6, 6))
+                          for _ in range(15)]
+            cells = covered_cells(rectangles)
+            self.assertEqual(union_area(rectangles), len(cells))
+            pieces = coverage_decomposition(rectangles)
+            self.assertEqual(sum(piece.get_width() * piece.get_height() for piece in pieces),
+                             len(cells))
+            self.assertEqual(covered_cells(pieces), cells)
+
+    def test_float_coordinates(self):
+        rectangles = [Rectangle(0.0, 0.0, 1.5, 1.0), Rectangle(1.0, 0.0, 1.0, 2.0)]
+        self.assertAlmostEqual(union_area(rectangles), 3.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
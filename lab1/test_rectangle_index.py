@@ -0,0 +1,108 @@
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import Rectangle, FrozenRectangle
+from rectangle_index import RectangleIndex
+
+
+def random_rectangle(rng):
+    return Rectangle(rng.randint(0, 500), rng.randint(0, 500),
+                     rng.randint(0, 40), rng.randint(0, 40))
+
+
+def overlaps(rect1, rect2):
+    x1, y1, x2, y2 = rect1.get_bounds()
+    qx1, qy1, qx2, qy2 = rect2.get_bounds()
+    return max(x1, qx1) < min(x2, qx2) and max(y1, qy1) < min(y2, qy2)
+
+
+class TestRectangleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(42)
+        self.rectangles = [random_rectangle(self.rng) for _ in range(500)]
+
+    def assertSameRectangles(self, found, expected):
+        self.assertEqual(sorted(map(id, found)), sorted(map(id, expected)))
+
+    def test_empty_index(self):
+        index = RectangleIndex()
+        self.assertEqual(len(index), 0)
+        self.assertIsNone(index.get_bounds())
+        self.assertEqual(index.query_overlap(Rectangle(0, 0, 10, 10)), [])
+        self.assertEqual(index.query_point(0, 0), [])
+
+    def test_overlap_query_matches_intersection(self):
+        index = RectangleIndex(self.rectangles)
+        for _ in range(50):
+            query = random_rectangle(self.rng)
+            expected = [rect for rect in self.rectangles if overlaps(rect, query)]
+            self.assertSameRectangles(index.query_overlap(query), expected)
+
+    def test_touching_rectangles_do_not_overlap(self):
+        index = RectangleIndex([Rectangle(0, 0, 2, 2)])
+        self.assertEqual(index.query_overlap(Rectangle(2, 0, 2, 2)), [])
+        self.assertEqual(len(index.query_overlap(Rectangle(1, 1, 2, 2))), 1)
+
+    def test_containment_and_point_queries(self):
+        inner = Rectangle(2, 2, 2, 2)
+        outer = Rectangle(0, 0, 10, 10)
+        index = RectangleIndex([inner, outer])
+        self.assertSameRectangles(index.query_contained(Rectangle(1, 1, 4, 4)), [inner])
+        self.assertSameRectangles(index.query_point(4, 4), [inner, outer])
+        self.assertSameRectangles(index.query_point(9, 9), [outer])
+        self.assertEqual(index.query_point(11, 0), [])
+
+    def test_incremental_insert_and_remove(self):
+        index = RectangleIndex(self.rectangles[:100])
+        for rect in self.rectangles[100:]:
+            index.insert(rect)
+        self.assertEqual(len(index), 500)
+        for rect in self.rectangles[:400]:
+            index.remove(rect)
+        self.assertEqual(len(index), 100)
+        self.assertNotIn(self.rectangles[0], index)
+        query = Rectangle(0, 0, 1000, 1000)
+        self.assertSameRectangles(index.query_overlap(query),
+                                  [rect for rect in self.rectangles[400:] if overlaps(rect, query)])
+        self.assertSameRectangles(list(index), self.rectangles[400:])
+
+    def test_remove_errors(self):
+        index = RectangleIndex()
+        rect = Rectangle(0, 0, 1, 1)
+        with self.assertRaises(KeyError):
+            index.remove(rect)
+        index.insert(rect)
+        with self.assertRaises(ValueError):
+            index.insert(rect)
+
+    def test_move(self):
+        rect = Rectangle(0, 0, 2, 2)
+        index = RectangleIndex(self.rectangles + [rect])
+        index.move(rect, 1000, 1000)
+        self.assertEqual(rect.get_x(), 1000)
+        self.assertSameRectangles(index.query_point(1001, 1001), [rect])
+        self.assertEqual(index.get_bounds()[2], 1002)
+
+    def test_failed_move_keeps_rectangle(self):
+        frozen = FrozenRectangle(5, 5, 2, 2)
+        index = RectangleIndex([frozen])
+        with self.assertRaises(TypeError):
+            index.move(frozen, 10, 10)
+        self.assertIn(frozen, index)
+        self.assertSameRectangles(index.query_point(6, 6), [frozen])
+        with self.assertRaises(KeyError):
+            index.move(Rectangle(0, 0, 1, 1), 1, 1)
+
+    def test_update_after_external_change(self):
+        rect = Rectangle(0, 0, 2, 2)
+        index = RectangleIndex([rect])
+        rect.resize(50, 50)
+        index.update(rect)
+        self.assertSameRectangles(index.query_point(40, 40), [rect])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
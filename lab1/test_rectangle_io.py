@@ -0,0 +1,155 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import Rectangle
+from rectangle_array import RectangleArray, np
+from rectangle_io import (iter_rectangles, read_rectangles, read_rectangle_array,
+                          write_rectangles, write_rectangles_binary, RectangleFile)
+
+
+class TestRectangleTextIO(unittest.TestCase):
+
+    def setUp(self):
+        self.rectangles = [Rectangle(1, 2, 3, 4), Rectangle(-5, 5, -2, 7), Rectangle(0, 0, 0, 0)]
+
+    def test_round_trip_file_object(self):
+        buffer = io.StringIO()
+        write_rectangles(self.rectangles, buffer)
+        self.assertEqual(buffer.getvalue(), "1 2 3 4\n-7 5 2 7\n0 0 0 0\n")
+        buffer.seek(0)
+        self.assertEqual(read_rectangles(buffer), self.rectangles)
+
+    def test_round_trip_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rectangles.txt")
+            rectangles = [Rectangle(i, -i, i % 7, i % 5) for i in range(25000)]
+            write_rectangles(rectangles, path)
+            self.assertEqual(read_rectangles(path), rectangles)
+
+    def test_lines_match_to_string(self):
+        buffer = io.StringIO()
+        write_rectangles(self.rectangles, buffer)
+        lines = buffer.getvalue().splitlines()
+        self.assertEqual(lines, [rect.to_string() for rect in self.rectangles])
+        self.assertEqual([Rectangle().from_string(line) for line in lines], self.rectangles)
+
+    def test_blank_lines_and_extra_spaces(self):
+        source = io.StringIO("\n 1  2 3 4 \n\n\t5 6 7 8\n")
+        self.assertEqual(read_rectangles(source), [Rectangle(1, 2, 3, 4), Rectangle(5, 6, 7, 8)])
+
+    def test_iter_rectangles_is_lazy(self):
+        iterator = iter_rectangles(io.StringIO("1 2 3 4\n"))
+        self.assertEqual(next(iterator), Rectangle(1, 2, 3, 4))
+        with self.assertRaises(StopIteration):
+            next(iterator)
+
+    def test_invalid_lines(self):
+        with self.assertRaises(ValueError):
+            read_rectangles(io.StringIO("1 2 3 4\n1 2 3\n"))
+        with self.assertRaisesRegex(ValueError, "^Line 3: "):
+            read_rectangles(io.StringIO("1 2 3 4\n\n5 6 7 x\n"))
+
+    def test_writer_refuses_floats(self):
+        with self.assertRaises(ValueError):
+            write_rectangles([Rectangle(1, 2, 3, 4), Rectangle(0.5, 0, 1, 1)], io.StringIO())
+        if np is not None:
+            with self.assertRaises(ValueError):
+                write_rectangles(RectangleArray([0.5], [0], [1], [1]), io.StringIO())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_rectangle_array(self):
+        buffer = io.StringIO()
+        write_rectangles(self.rectangles, buffer)
+        buffer.seek(0)
+        array = read_rectangle_array(buffer)
+        self.assertEqual(array.to_rectangles(), self.rectangles)
+        output = io.StringIO()
+        write_rectangles(array, output)
+        self.assertEqual(output.getvalue(), buffer.getvalue())
+
+
+class TestRectangleBinaryIO(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "rectangles.bin")
+        self.rectangles = [Rectangle(1, 2, 3, 4), Rectangle(-5, 5, -2, 7), Rectangle(2 ** 40, 0, 1, 1)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_integers(self):
+        write_rectangles_binary(self.rectangles, self.path)
+        self.assertEqual(os.path.getsize(self.path), 16 + 3 * 32)
+        with RectangleFile(self.path) as rectangle_file:
+            self.assertEqual(len(rectangle_file), 3)
+            self.assertEqual(list(rectangle_file), self.rectangles)
+            self.assertEqual(rectangle_file[-1], self.rectangles[-1])
+            self.assertEqual(rectangle_file.get_record(1), (-7, 5, 2, 7))
+            with self.assertRaises(IndexError):
+                rectangle_file[3]
+
+    def test_round_trip_floats(self):
+        rectangles = [Rectangle(0.5, 1, 2, 3.25)]
+        write_rectangles_binary(rectangles, self.path)
+        with RectangleFile(self.path) as rectangle_file:
+            self.assertEqual(list(rectangle_file), rectangles)
+
+    def test_empty_file(self):
+        write_rectangles_binary([], self.path)
+        with RectangleFile(self.path) as rectangle_file:
+            self.assertEqual(len(rectangle_file), 0)
+            self.assertEqual(list(rectangle_file), [])
+
+    def test_invalid_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"NOT A RECTANGLE FILE")
+        with self.assertRaises(ValueError):
+            RectangleFile(self.path)
+        write_rectangles_binary(self.rectangles, self.path)
+        with open(self.path, "r+b") as file:
+            file.truncate(40)
+        with self.assertRaises(ValueError):
+            RectangleFile(self.path)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_columns_and_array(self):
+        write_rectangles_binary(RectangleArray.from_rectangles(self.rectangles), self.path)
+        with RectangleFile(self.path) as rectangle_file:
+            x, y, width, height = rectangle_file.get_columns()
+            self.assertEqual(x.tolist(), [1, -7, 2 ** 40])
+            self.assertEqual(height.tolist(), [4, 7, 1])
+            array = rectangle_file.to_rectangle_array()
+        self.assertEqual(array.to_rectangles(), self.rectangles)
+        self.assertEqual(x.tolist(), [1, -7, 2 ** 40])
+        self.assertEqual(width.tolist(), [3, 2, 1])
+
+    def test_close_with_exported_buffer(self):
+        write_rectangles_binary(self.rectangles, self.path)
+        with RectangleFile(self.path) as rectangle_file:
+            view = memoryview(rectangle_file._mmap)
+        self.assertEqual(bytes(view[:4]), b"RECT")
+        view.release()
+        rectangle_file.close()
+        with self.assertRaises(ValueError):
+            rectangle_file[0]
+
+
+class TestRectangleStringConversion(unittest.TestCase):
+
+    def test_from_string_validation(self):
+        rect = Rectangle()
+        self.assertEqual(rect.from_string("  -1  +2 3 4 "), Rectangle(-1, 2, 3, 4))
+        for string_repr in ["1 2 3", "1 2 3 x", "1.5 2 3 4", "1 2 3 4 5"]:
+            with self.assertRaises(ValueError):
+                rect.from_string(string_repr)
+
+    def test_to_string_negative_values(self):
+        self.assertEqual(Rectangle(-15, 0, 30, 0).to_string(), "-15 0 30 0")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
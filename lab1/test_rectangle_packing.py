@@ -0,0 +1,82 @@
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rectangle import Rectangle
+from rectangle_geometry import find_overlapping_pairs
+from rectangle_packing import SkylineBin, pack_rectangles
+
+
+class TestRectanglePacking(unittest.TestCase):
+
+    def assertValidBin(self, packed_bin):
+        rectangles = packed_bin.get_rectangles()
+        self.assertEqual(find_overlapping_pairs(rectangles), [])
+        for rect in rectangles:
+            x1, y1, x2, y2 = rect.get_bounds()
+            self.assertTrue(0 <= x1 and x2 <= packed_bin.get_width())
+            self.assertTrue(0 <= y1 and y2 <= packed_bin.get_height())
+
+    def test_random_items_are_packed_without_overlap(self):
+        rng = random.Random(3)
+        rectangles = [Rectangle(rng.randint(-50, 50), rng.randint(-50, 50),
+                                rng.randint(1, 60), rng.randint(1, 60)) for _ in range(500)]
+        sizes = sorted((rect.get_width(), rect.get_height()) for rect in rectangles)
+        result = pack_rectangles(rectangles, 200, 200)
+        self.assertEqual(result.get_placed_count(), 500)
+        self.assertEqual(result.unplaced, [])
+        for packed_bin in result.bins:
+            self.assertValidBin(packed_bin)
+        self.assertEqual(sorted((rect.get_width(), rect.get_height()) for rect in rectangles), sizes)
+        total_area = sum(width * height for width, height in sizes)
+        self.assertAlmostEqual(result.get_utilization(), total_area / (result.get_bin_count() * 200 * 200))
+        self.assertGreater(result.get_utilization(), 0.8)
+
+    def test_matches_plain_first_fit(self):
+        rng = random.Random(5)
+        sizes = [(rng.randint(1, 100), rng.randint(0, 100)) for _ in range(800)]
+        sizes.sort(key=lambda size: (size[1], size[0]), reverse=True)
+        bins = []
+        for width, height in sizes:
+            if not any(packed_bin.insert(Rectangle(0, 0, width, height)) for packed_bin in bins):
+                bins.append(SkylineBin(100, 100))
+                bins[-1].insert(Rectangle(0, 0, width, height))
+        result = pack_rectangles([Rectangle(0, 0, width, height) for width, height in sizes], 100, 100)
+        self.assertEqual([[rect.get_bounds() for rect in packed_bin.get_rectangles()] for packed_bin in result.bins],
+                         [[rect.get_bounds() for rect in packed_bin.get_rectangles()] for packed_bin in bins])
+
+    def test_perfect_fit(self):
+        rectangles = [Rectangle(0, 0, 5, 5) for _ in range(16)]
+        result = pack_rectangles(rectangles, 20, 20)
+        self.assertEqual(result.get_bin_count(), 1)
+        self.assertEqual(result.get_utilization(), 1.0)
+        self.assertEqual(result.get_stats()["bin_utilization"], [1.0])
+
+    def test_oversized_and_max_bins(self):
+        big = Rectangle(0, 0, 30, 5)
+        items = [Rectangle(0, 0, 10, 10) for _ in range(5)]
+        result = pack_rectangles(items + [big], 20, 20, max_bins=1)
+        self.assertEqual(result.get_bin_count(), 1)
+        self.assertEqual(len(result.unplaced), 2)
+        self.assertIn(big, result.unplaced)
+        self.assertEqual(result.get_stats()["unplaced"], 2)
+        with self.assertRaises(ValueError):
+            pack_rectangles(items, 0, 10)
+        with self.assertRaises(ValueError):
+            pack_rectangles(items, 10, 10, max_bins=-1)
+
+    def test_skyline_bin_insert(self):
+        packed_bin = SkylineBin(10, 4)
+        self.assertTrue(packed_bin.insert(Rectangle(7, 7, 6, 2)))
+        self.assertTrue(packed_bin.insert(Rectangle(0, 0, 4, 4)))
+        self.assertTrue(packed_bin.insert(Rectangle(0, 0, 6, 2)))
+        self.assertFalse(packed_bin.insert(Rectangle(0, 0, 1, 1)))
+        self.assertEqual([rect.get_bounds()[:2] for rect in packed_bin.get_rectangles()],
+                         [(0, 0), (6, 0), (0, 2)])
+        self.assertValidBin(packed_bin)
+        self.assertEqual(packed_bin.get_utilization(), 1.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
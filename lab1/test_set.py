@@ -1,9 +1,11 @@
+import copy
+import io
 import unittest
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from set import Set, set_from_string, create_empty_set, create_set_from_elements
+from set import Set, FrozenSet, BitSet, set_from_string, create_empty_set, create_set_from_elements
 
 def create_unique_set():
     return Set()
@@ -321,5 +323,494 @@ class TestSetEdgeCases(unittest.TestCase):
         self.assertEqual(empty1 * non_empty, empty1)
         self.assertEqual(non_empty - empty1, non_empty)
 
+class TestSetIndex(unittest.TestCase):
+
+    def test_large_set_membership(self):
+        test_set = Set(range(10000))
+        self.assertEqual(test_set.get_cardinality(), 10000)
+        self.assertIn(9999, test_set)
+        self.assertNotIn(10000, test_set)
+
+    def test_insertion_order_preserved(self):
+        test_set = Set([3, 1, 2, 1, 3])
+        self.assertEqual(list(test_set), [3, 1, 2])
+        self.assertEqual(str(test_set), "{3, 1, 2}")
+
+    def test_nested_sets_keyed_by_id(self):
+        inner = Set([1], unique_id="inner")
+        same_id = Set([2], unique_id="inner")
+        outer = Set([inner])
+        self.assertIn(same_id, outer)
+        self.assertNotIn(Set([1]), outer)
+        self.assertNotIn(inner._id, outer)
+        automatic = Set([3])
+        self.assertNotIn(Set(unique_id=automatic._id), Set([automatic]))
+
+    def test_unhashable_elements(self):
+        test_set = Set([[1, 2], [1, 2], 3])
+        self.assertEqual(test_set.get_cardinality(), 2)
+        self.assertIn([1, 2], test_set)
+        test_set.remove_element([1, 2])
+        self.assertEqual(list(test_set), [3])
+
+    def test_index_after_in_place_operations(self):
+        test_set = Set([1, 2, 3, 4])
+        test_set -= Set([1, 2])
+        self.assertNotIn(1, test_set)
+        test_set.add_element(1)
+        self.assertEqual(list(test_set), [3, 4, 1])
+
+class TestSetBulkOperations(unittest.TestCase):
+
+    def test_intersection_keeps_left_order(self):
+        set1 = Set([5, 4, 3, 2, 1])
+        set2 = Set([1, 3])
+        self.assertEqual(list(set1 * set2), [3, 1])
+        self.assertEqual(list(set2 * set1), [1, 3])
+
+    def test_union_and_difference_order(self):
+        set1 = Set([1, 2, 3])
+        set2 = Set([3, 4])
+        self.assertEqual(list(set1 + set2), [1, 2, 3, 4])
+        self.assertEqual(list(set1 - set2), [1, 2])
+
+    def test_in_place_operations_keep_object(self):
+        set1 = Set([1, 2, 3, 4])
+        original = set1
+        set1 *= Set([2, 3, 4, 5])
+        set1 -= Set([3])
+        set1 += Set([6])
+        self.assertIs(set1, original)
+        self.assertEqual(list(set1), [2, 4, 6])
+        self.assertIn(6, set1)
+        self.assertNotIn(3, set1)
+
+    def test_in_place_operations_with_self(self):
+        set1 = Set([1, 2])
+        set1 *= set1
+        self.assertEqual(list(set1), [1, 2])
+        set1 -= set1
+        self.assertTrue(set1.is_empty())
+
+    def test_union_all(self):
+        sets = [Set([i, i + 1]) for i in range(100)]
+        result = Set.union_all(sets)
+        self.assertEqual(result.get_cardinality(), 101)
+        self.assertTrue(Set.union_all([]).is_empty())
+
+    def test_intersect_all(self):
+        sets = [Set(range(i, 50)) for i in range(10)]
+        result = Set.intersect_all(sets)
+        self.assertEqual(result, Set(range(9, 50)))
+        self.assertTrue(Set.intersect_all([]).is_empty())
+        self.assertTrue(Set.intersect_all([Set([1]), Set([2]), Set([1])]).is_empty())
+
+class TestSetPowerSetIterator(unittest.TestCase):
+
+    def test_iter_power_set_bitmask_order(self):
+        subsets = [list(subset) for subset in Set([1, 2]).iter_power_set()]
+        self.assertEqual(subsets, [[], [1], [2], [1, 2]])
+
+    def test_iter_power_set_gray_order(self):
+        subsets = [list(subset) for subset in Set([1, 2]).iter_power_set(order="gray")]
+        self.assertEqual(subsets, [[], [1], [1, 2], [2]])
+
+    def test_iter_power_set_unknown_order(self):
+        with self.assertRaises(ValueError):
+            list(Set([1]).iter_power_set(order="random"))
+        with self.assertRaises(ValueError):
+            list(Set([1]).iter_power_set(k=1, order="random"))
+
+    def test_iter_power_set_k_subsets(self):
+        subsets = list(Set([1, 2, 3, 4]).iter_power_set(k=2))
+        self.assertEqual(len(subsets), 6)
+        self.assertTrue(all(subset.get_cardinality() == 2 for subset in subsets))
+        self.assertEqual(list(Set([1]).iter_power_set(k=3)), [])
+
+    def test_iter_power_set_is_lazy(self):
+        iterator = Set(range(60)).iter_power_set()
+        next(iterator)
+        self.assertEqual(list(next(iterator)), [0])
+
+    def test_get_subset(self):
+        test_set = Set(["a", "b", "c"])
+        self.assertEqual(list(test_set.get_subset(5)), ["a", "c"])
+        self.assertTrue(Set(range(100)).get_subset(1 << 99).get_cardinality() == 1)
+        with self.assertRaises(IndexError):
+            test_set.get_subset(8)
+
+    def test_power_sets_do_not_share_subset_ids(self):
+        combined = Set([1]).get_power_set() + Set([9]).get_power_set()
+        self.assertEqual(combined.get_cardinality(), 4)
+        self.assertEqual(str(combined), "{{}, {1}, {}, {9}}")
+
+    def test_get_power_set_guard(self):
+        with self.assertRaises(ValueError):
+            Set(range(Set.MAX_POWER_SET_ELEMENTS + 1)).get_power_set()
+
+class TestSetParser(unittest.TestCase):
+
+    def test_nested_elements(self):
+        result = set_from_string(" { a , {b, {c}}, 'x y', -5, {} } ")
+        self.assertEqual(str(result), "{'a', {'b', {'c'}}, 'x y', -5, {}}")
+
+    def test_empty_elements_skipped(self):
+        self.assertEqual(list(set_from_string("{1,,2, }")), [1, 2])
+
+    def test_bytes_and_file_sources(self):
+        self.assertEqual(list(set_from_string(b"{1, 2}")), [1, 2])
+        self.assertEqual(list(set_from_string(io.StringIO("{a}"))), ["a"])
+        self.assertEqual(list(set_from_string(io.BytesIO(b"{3}"))), [3])
+
+    def test_deep_nesting(self):
+        depth = 10000
+        result = set_from_string("{" * depth + "}" * depth)
+        for _ in range(depth - 1):
+            self.assertEqual(result.get_cardinality(), 1)
+            result = next(iter(result))
+        self.assertTrue(result.is_empty())
+
+    def test_deeply_nested_str_and_equality(self):
+        depth = 5000
+        text = "{" * depth + "}" * depth
+        self.assertEqual(str(set_from_string(text)), text)
+        frozen = Set().from_string(text, frozen=True)
+        self.assertEqual(frozen, Set().from_string(text, frozen=True))
+        self.assertNotEqual(frozen, Set().from_string("{" + text + "}", frozen=True))
+
+    def test_invalid_strings(self):
+        for string_repr in ["1, 2", "{1", "{1}}", "{a {b}}", "{{1} x}", "}"]:
+            with self.assertRaises(ValueError):
+                set_from_string(string_repr)
+
+class TestFrozenSet(unittest.TestCase):
+
+    def test_structural_equality_and_hash(self):
+        frozen1 = FrozenSet([1, 2, FrozenSet(["a"])])
+        frozen2 = FrozenSet([FrozenSet(["a"]), 2, 1])
+        self.assertEqual(frozen1, frozen2)
+        self.assertEqual(hash(frozen1), hash(frozen2))
+        self.assertNotEqual(frozen1, FrozenSet([1, 2]))
+
+    def test_equal_to_mutable_set(self):
+        self.assertEqual(FrozenSet([1, 2]), Set([2, 1]))
+        self.assertEqual(Set([2, 1]), FrozenSet([1, 2]))
+
+    def test_dict_key_and_set_element(self):
+        counts = {FrozenSet([1, 2]): 1}
+        self.assertEqual(counts[FrozenSet([2, 1])], 1)
+        family = Set([FrozenSet([1]), FrozenSet([1]), FrozenSet([2])])
+        self.assertEqual(family.get_cardinality(), 2)
+        self.assertIn(FrozenSet([2]), family)
+
+    def test_immutable(self):
+        frozen = FrozenSet([1])
+        with self.assertRaises(TypeError):
+            frozen.add_element(2)
+        with self.assertRaises(TypeError):
+            frozen.remove_element(1)
+        original = frozen
+        frozen += Set([2])
+        self.assertIsNot(frozen, original)
+        self.assertEqual(original.get_cardinality(), 1)
+        self.assertIsInstance(frozen, FrozenSet)
+        self.assertIs(original.copy(), original)
+
+    def test_operators_return_frozen_sets(self):
+        frozen = FrozenSet([1, 2, 3])
+        self.assertIsInstance(frozen + Set([4]), FrozenSet)
+        self.assertEqual(frozen * Set([2, 5]), FrozenSet([2]))
+        self.assertEqual(frozen - Set([1]), FrozenSet([2, 3]))
+
+    def test_unhashable_elements(self):
+        with self.assertRaises(TypeError):
+            hash(FrozenSet([[1]]))
+        family = Set([FrozenSet([[1]]), FrozenSet([[2]]), FrozenSet([[1]])])
+        self.assertEqual(family.get_cardinality(), 2)
+        self.assertEqual(FrozenSet([[1], 2]), FrozenSet([2, [1]]))
+        self.assertNotEqual(FrozenSet([[1]]), FrozenSet([1]))
+
+    def test_freeze(self):
+        mutable = Set([1, 2])
+        frozen = mutable.freeze()
+        mutable.add_element(3)
+        self.assertEqual(frozen, FrozenSet([1, 2]))
+
+    def test_frozen_power_set(self):
+        power_set = Set([1, 2]).get_power_set(frozen=True)
+        self.assertIn(FrozenSet([2, 1]), power_set)
+        self.assertIn(FrozenSet(), power_set)
+        subsets = Set([1, 2, 3]).iter_power_set(k=2, frozen=True)
+        self.assertEqual(Set(subsets).get_cardinality(), 3)
+        self.assertEqual(Set([1, 2]).get_subset(3, frozen=True), FrozenSet([1, 2]))
+
+    def test_frozen_parsing(self):
+        result = Set().from_string("{{1, 2}, {2, 1}, 3}", frozen=True)
+        self.assertIsInstance(result, FrozenSet)
+        self.assertEqual(result.get_cardinality(), 2)
+        self.assertIn(FrozenSet([1, 2]), result)
+
+class TestBitSet(unittest.TestCase):
+
+    def test_from_elements_chooses_backend(self):
+        self.assertIsInstance(Set.from_elements([1, 2, 3]), BitSet)
+        self.assertNotIsInstance(Set.from_elements([1, "a"]), BitSet)
+        self.assertNotIsInstance(Set.from_elements([1, -1]), BitSet)
+        self.assertNotIsInstance(Set.from_elements([1, 100], bound=50), BitSet)
+        self.assertNotIsInstance(Set.from_elements([True]), BitSet)
+        self.assertNotIsInstance(Set.from_elements([3, 1]), BitSet)
+        with self.assertRaises(ValueError):
+            Set.from_elements([1], bound=0)
+        with self.assertRaises(ValueError):
+            BitSet(bound=-5)
+
+    def test_interchangeable_with_set(self):
+        bit_set = BitSet([1, 3, 5, 1])
+        plain_set = Set([1, 3, 5])
+        self.assertEqual(bit_set, plain_set)
+        self.assertEqual(plain_set, bit_set)
+        self.assertEqual(list(bit_set), [1, 3, 5])
+        self.assertEqual(str(bit_set), str(plain_set))
+        self.assertEqual(list(BitSet([5, 1, 3, 1])), [5, 1, 3])
+        self.assertEqual(str(BitSet([5, 1, 3])), str(Set([5, 1, 3])))
+        self.assertEqual(str(BitSet()), "{}")
+        self.assertEqual(len(bit_set), 3)
+        self.assertIn(3, bit_set)
+        self.assertNotIn(4, bit_set)
+        self.assertNotIn("a", bit_set)
+
+    def test_numeric_lookup_matches_set(self):
+        bit_set = BitSet([0, 1, 3])
+        plain_set = Set([0, 1, 3])
+        for probe in (1.0, True, False, 3.0, 1.5, -1.0, "1", float("nan")):
+            self.assertEqual(probe in bit_set, probe in plain_set, probe)
+        bit_set.add_element(3.0)
+        self.assertEqual(list(bit_set), [0, 1, 3])
+        bit_set.remove_element(1.0)
+        self.assertEqual(list(bit_set), [0, 3])
+
+    def test_add_and_remove(self):
+        bit_set = BitSet(bound=100)
+        bit_set.add_element(64)
+        bit_set.add_element(64)
+        self.assertEqual(bit_set.get_cardinality(), 1)
+        bit_set.remove_element(64)
+        bit_set.remove_element(7)
+        self.assertTrue(bit_set.is_empty())
+
+    def test_unstorable_elements_fall_back_to_list_storage(self):
+        bit_set = BitSet([1, 2], bound=100)
+        bit_set.add_element(100)
+        bit_set.add_element("x")
+        bit_set.add_element(-1)
+        bit_set.add_element(0)
+        self.assertEqual(list(bit_set), [1, 2, 100, "x", -1, 0])
+        self.assertEqual(bit_set, Set([1, 2, 100, "x", -1, 0]))
+        bit_set.remove_element("x")
+        self.assertNotIn("x", bit_set)
+        self.assertEqual(len(bit_set), 5)
+        self.assertEqual(str(bit_set * Set([0, 2])), "{2, 0}")
+        self.assertEqual(BitSet.union_all([BitSet([1]), Set(["a"])]), Set([1, "a"]))
+        removed = BitSet([1, 2, 3])
+        removed.remove_element(2)
+        removed.add_element(2)
+        self.assertEqual(list(removed), [1, 3, 2])
+
+    def test_bitwise_algebra(self):
+        set1 = BitSet(range(0, 100, 2))
+        set2 = BitSet(range(0, 100, 3))
+        self.assertEqual(set1 + set2, Set(range(0, 100, 2)) + Set(range(0, 100, 3)))
+        self.assertEqual(list(set1 * set2), list(range(0, 100, 6)))
+        self.assertEqual((set1 - set2).get_cardinality(), 50 - 17)
+        set1 -= set2
+        self.assertEqual(set1.get_cardinality(), 33)
+        set1 *= BitSet([2, 3, 4])
+        self.assertEqual(list(set1), [2, 4])
+        set1 += BitSet([9])
+        self.assertEqual(list(set1), [2, 4, 9])
+
+    def test_mixed_algebra(self):
+        bit_set = BitSet([1, 2, 3])
+        self.assertIsInstance(bit_set + Set([4]), BitSet)
+        self.assertEqual(bit_set + Set(["a"]), Set([1, 2, 3, "a"]))
+        self.assertEqual(bit_set * Set([2, "a"]), Set([2]))
+        self.assertEqual(bit_set - Set([2, "a"]), Set([1, 3]))
+        self.assertEqual(Set([2, "a"]) * bit_set, Set([2]))
+        self.assertEqual(Set(["a"]) + bit_set, Set(["a", 1, 2, 3]))
+        bit_set *= Set([1, 3])
+        bit_set -= Set([3])
+        self.assertEqual(list(bit_set), [1])
+        bit_set += Set(["a"])
+        self.assertEqual(list(bit_set), [1, "a"])
+        self.assertEqual(list(BitSet([5]) + BitSet([1, 9])), [5, 1, 9])
+
+    def test_copy_is_independent(self):
+        bit_set = BitSet([1])
+        copied = bit_set.copy()
+        copied.add_element(2)
+        self.assertEqual(list(bit_set), [1])
+
+class TestSetIdentity(unittest.TestCase):
+
+    def test_ids_not_reused_after_deletion(self):
+        first = Set()
+        first_id = first._id
+        del first
+        ids = set(Set()._id for _ in range(100))
+        self.assertNotIn(first_id, ids)
+        self.assertEqual(len(ids), 100)
+
+    def test_deleted_set_does_not_alias_element(self):
+        outer = Set([Set()])
+        temporary = Set()
+        del temporary
+        self.assertNotIn(Set(), outer)
+
+    def test_slots(self):
+        for test_set in (Set(), FrozenSet(), BitSet()):
+            self.assertFalse(hasattr(test_set, "__dict__"))
+        self.assertFalse(hasattr(iter(Set()), "__dict__"))
+
+class TestSetCopyOnWrite(unittest.TestCase):
+
+    def test_copy_shares_storage_until_mutation(self):
+        original = Set([1, 2, 3])
+        snapshot = original.copy()
+        self.assertIs(snapshot._elements, original._elements)
+        original.add_element(4)
+        self.assertEqual(list(snapshot), [1, 2, 3])
+        self.assertEqual(list(original), [1, 2, 3, 4])
+
+    def test_mutating_copy_leaves_source(self):
+        original = Set([1, 2, 3])
+        snapshot = original.copy()
+        snapshot.remove_element(1)
+        snapshot -= Set([2])
+        self.assertEqual(list(original), [1, 2, 3])
+        self.assertEqual(list(snapshot), [3])
+
+    def test_in_place_operators_unshare(self):
+        original = Set([1, 2, 3])
+        snapshot = original.copy()
+        snapshot += Set([9])
+        self.assertEqual(list(original), [1, 2, 3])
+        snapshot = original.copy()
+        snapshot *= Set([2])
+        self.assertEqual(list(original), [1, 2, 3])
+        snapshot = original.copy()
+        snapshot -= Set([2])
+        self.assertEqual(list(original), [1, 2, 3])
+        self.assertEqual(list(snapshot), [1, 3])
+
+    def test_copy_module_functions(self):
+        original = Set([1, Set([2])])
+        self.assertEqual(copy.copy(original), original)
+        self.assertEqual(copy.deepcopy(original), original)
+
+    def test_deepcopy_copies_nested_sets(self):
+        inner = Set([1])
+        original = Set([inner, [2], FrozenSet([Set([3])])])
+        cloned = copy.deepcopy(original)
+        self.assertEqual(cloned, original)
+        cloned_inner, cloned_list, cloned_frozen = list(cloned)
+        cloned_inner.add_element(5)
+        cloned_list.append(6)
+        next(iter(cloned_frozen)).add_element(7)
+        self.assertEqual(list(inner), [1])
+        self.assertEqual(str(original), "{{1}, [2], {{3}}}")
+        self.assertIsInstance(cloned_frozen, FrozenSet)
+        bit_set = BitSet([1, 2])
+        cloned_bits = copy.deepcopy(bit_set)
+        cloned_bits.add_element(3)
+        self.assertEqual(list(bit_set), [1, 2])
+        self.assertEqual(cloned_bits._id, bit_set._id)
+
+    def test_freeze_snapshot(self):
+        original = Set([1])
+        frozen = original.freeze()
+        original.add_element(2)
+        self.assertEqual(list(frozen), [1])
+
+    def test_bitset_copy_on_write(self):
+        original = BitSet([1, 2])
+        snapshot = original.copy()
+        snapshot.add_element(3)
+        original.remove_element(1)
+        self.assertEqual(list(original), [2])
+        self.assertEqual(list(snapshot), [1, 2, 3])
+
+class TestSetRemoval(unittest.TestCase):
+
+    def test_remove_keeps_order(self):
+        test_set = Set(range(10))
+        test_set.remove_element(3)
+        test_set.remove_element(7)
+        self.assertEqual(list(test_set), [0, 1, 2, 4, 5, 6, 8, 9])
+        self.assertEqual(str(Set([1, 2, 3]) - Set([2])), "{1, 3}")
+        self.assertEqual(test_set.get_cardinality(), 8)
+        self.assertNotIn(3, test_set)
+
+    def test_add_after_remove(self):
+        test_set = Set([1, 2, 3])
+        test_set.remove_element(1)
+        test_set.add_element(1)
+        self.assertEqual(list(test_set), [2, 3, 1])
+        self.assertEqual(test_set * Set([1]), Set([1]))
+        self.assertEqual(list(test_set * Set([3, 1])), [3, 1])
+
+    def test_remove_many(self):
+        test_set = Set(range(1000))
+        test_set.remove_many(range(0, 1000, 2))
+        self.assertEqual(test_set.get_cardinality(), 500)
+        self.assertEqual(list(test_set)[:3], [1, 3, 5])
+        test_set.remove_many([1, 1, "missing"])
+        self.assertEqual(len(test_set), 499)
+
+    def test_discard_if(self):
+        test_set = Set(range(10))
+        test_set.discard_if(lambda element: element % 3 == 0)
+        self.assertEqual(list(test_set), [1, 2, 4, 5, 7, 8])
+
+    def test_remove_all(self):
+        test_set = Set(["a", [1], Set()])
+        for element in list(test_set):
+            test_set.remove_element(element)
+        self.assertTrue(test_set.is_empty())
+        self.assertEqual(str(test_set), "{}")
+
+    def test_remove_while_iterating(self):
+        for test_set in (Set(range(10)), BitSet(range(10))):
+            visited = []
+            for element in test_set:
+                visited.append(element)
+                test_set.remove_element(element)
+            self.assertEqual(visited, list(range(10)))
+            self.assertTrue(test_set.is_empty())
+        test_set = Set(range(6))
+        visited = []
+        for element in test_set:
+            visited.append(element)
+            test_set.remove_many([element, element + 1])
+        self.assertEqual(visited, list(range(6)))
+        self.assertEqual(str(test_set), "{}")
+
+    def test_removal_does_not_affect_snapshot(self):
+        test_set = Set(range(5))
+        test_set.remove_element(0)
+        snapshot = test_set.copy()
+        test_set.remove_many([1, 2, 3])
+        self.assertEqual(list(snapshot), [1, 2, 3, 4])
+        self.assertEqual(list(test_set), [4])
+
+    def test_frozen_and_bitset_removal(self):
+        with self.assertRaises(TypeError):
+            FrozenSet([1]).remove_many([1])
+        with self.assertRaises(TypeError):
+            FrozenSet([1]).discard_if(bool)
+        bit_set = BitSet(range(10))
+        bit_set.remove_many([1, 2])
+        bit_set.discard_if(lambda element: element > 5)
+        self.assertEqual(list(bit_set), [0, 3, 4, 5])
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Dispatch simulation benchmark: technicians take repair orders in rounds.
+Usage: python benchmark_dispatch.py [technicians] [orders]
+"""
+
+import os
+import random
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.models.address import Address
+from src.models.client import Client
+from src.models.repair_order import RepairOrder
+from src.models.service import RepairService
+from src.models.technician import Technician
+from src.services.dispatch_scheduler import DispatchScheduler
+from src.services.repair_service import RepairServiceManager
+
+PRIORITIES = ["LOW", "NORMAL", "HIGH", "URGENT"]
+
+
+def measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def build_technicians(count, address, rng):
+    return [Technician(f"T{i:06d}", "Tech", "Nician", "Technician", 50000.0, "2023-01-01",
+                       "Repair", address, "Electronics", rng.randint(1, 10), [])
+            for i in range(count)]
+
+
+def build_orders(count, client, services, rng):
+    return [RepairOrder(f"RO{i:08d}", client, "Device", "Problem", rng.choice(services), None,
+                        rng.choice(PRIORITIES), f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+            for i in range(count)]
+
+
+def simulate(technicians, orders, max_workload):
+    """Dispatching in rounds; between rounds every working technician completes
+    its oldest order, so technicians with max_workload > 1 are released part-full"""
+    scheduler = DispatchScheduler(technicians, max_workload)
+    submit_time, _ = measure(lambda: [scheduler.submit_order(order) for order in orders])
+    dispatch_time = 0.0
+    release_time = 0.0
+    rounds = 0
+    assigned = 0
+    working = {}
+    while scheduler.pending_count():
+        round_time, assignments = measure(scheduler.dispatch_all)
+        if not assignments:
+            break
+        dispatch_time += round_time
+        rounds += 1
+        assigned += len(assignments)
+        for _, technician in assignments:
+            working[technician.employee_id] = technician
+        released = list(working.values())
+        for technician in released:
+            technician.assigned_orders[0].mark_completed(1.0)
+            if not technician.assigned_orders:
+                del working[technician.employee_id]
+        round_time, _ = measure(lambda: [scheduler.release(technician) for technician in released])
+        release_time += round_time
+    return submit_time, dispatch_time, release_time, rounds, assigned
+
+
+def benchmark_linear_scan(technicians, orders, sample):
+    manager = RepairServiceManager()
+    manager.available_technicians.extend(technicians)
+    scan_time, _ = measure(lambda: [manager.find_available_technician(order.service_required.skill_level_required)
+                                    for order in orders[:sample]])
+    return scan_time / sample
+
+
+def main():
+    technician_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    order_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    rng = random.Random(1)
+    address = Address("Test St", "City", "ST", "12345", "Country", "123")
+    client = Client("CL001", "John Doe", "john@test.com", "+1234567890", address, 1000.0)
+    services = [RepairService(f"S{level:03d}", f"Service {level}", "Description", 100.0, 1.0, [], level, 90)
+                for level in range(1, 11)]
+
+    print("=" * 50)
+    print(f" DISPATCH OF {order_count} ORDERS TO {technician_count} TECHNICIANS")
+    print("=" * 50)
+    build_time, technicians = measure(lambda: build_technicians(technician_count, address, rng))
+    order_time, orders = measure(lambda: build_orders(order_count, client, services, rng))
+    print(f"build technicians:  {build_time:.3f} s")
+    print(f"build orders:       {order_time:.3f} s")
+
+    scan = benchmark_linear_scan(technicians, orders, min(order_count, 1000))
+    print(f"linear scan lookup: {scan * 1e6:.1f} us/order (find_available_technician)")
+
+    for max_workload in (1, 3):
+        for technician in technicians:
+            technician.assigned_orders = []
+            technician.is_available = True
+        submit_time, dispatch_time, release_time, rounds, assigned = simulate(technicians, orders, max_workload)
+        print(f"\nmax_workload={max_workload}")
+        print(f"submit:             {submit_time / order_count * 1e6:.2f} us/order")
+        print(f"dispatch:           {dispatch_time / max(assigned, 1) * 1e6:.2f} us/order "
+              f"({assigned} orders in {rounds} rounds)")
+        print(f"release:            {release_time:.3f} s")
+        print(f"throughput:         {assigned / dispatch_time:,.0f} orders/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,4 +9,5 @@ class ConfigConstants:
     MIN_EMPLOYEE_RATING = 1
     MAX_EMPLOYEE_RATING = 5
     STANDARD_REPAIR_TIME_HOURS = 2
-    URGENT_REPAIR_MULTIPLIER = 1.5
\ No newline at end of file
+    URGENT_REPAIR_MULTIPLIER = 1.5
+    PRIORITY_RANKS = {"URGENT": 0, "HIGH": 1, "MEDIUM": 2, "NORMAL": 2, "LOW": 3}
\ No newline at end of file
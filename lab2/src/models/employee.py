@@ -19,6 +19,7 @@ class Employee:
         self.specialization = specialization
         self.is_available = True
         self.assigned_orders = []
+        self.max_workload = 1
         self.performance_rating = 0.0
 
     def _validate_employee_data(self, employee_id, first_name, last_name, position, salary):
@@ -34,11 +35,13 @@ class Employee:
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}"
 
-    def assign_order(self, repair_order):
+    def assign_order(self, repair_order, max_workload=None):
         if not self.is_available:
             raise TechnicianNotAvailableException(self.employee_id)
+        if max_workload is not None:
+            self.max_workload = max_workload
         self.assigned_orders.append(repair_order)
-        self.is_available = False
+        self.is_available = ManualUtils.manual_len(self.assigned_orders) < self.max_workload
 
     def complete_order(self, repair_order):
         if self._manual_list_contains(self.assigned_orders, repair_order):
@@ -48,7 +51,7 @@ class Employee:
                     new_assigned_orders.append(order)
             self.assigned_orders = new_assigned_orders
             
-        if ManualUtils.manual_len(self.assigned_orders) == 0:
+        if ManualUtils.manual_len(self.assigned_orders) < self.max_workload:
             self.is_available = True
 
     def _manual_list_contains(self, lst, item):
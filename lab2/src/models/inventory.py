@@ -1,9 +1,16 @@
+import threading
+
 from src.utils import manual_utils_instance as ManualUtils
 from src.exceptions.invalid_part_data_exception import InvalidPartDataException
 from src.exceptions.part_not_available_exception import PartNotAvailableException
 from src.constants.config_constants import ConfigConstants
 from src.constants.financial_constants import FinancialConstants
 class InventoryItem:
+    # One lock for every item: a batch touches several parts, and a single lock
+    # cannot deadlock on acquisition order. It is held only while quantities
+    # change and listeners run, so per-item locks would buy little.
+    _stock_lock = threading.RLock()
+
     def __init__(self, part_id, name, description, category, price, quantity_in_stock, min_stock_level, supplier_info, compatibility_list):
         self._validate_inventory_data(part_id, name, price, quantity_in_stock)
         
@@ -16,6 +23,7 @@ class InventoryItem:
         self.min_stock_level = min_stock_level
         self.supplier_info = supplier_info
         self.compatibility_list = compatibility_list
+        self._stock_listeners = []
 
     def _validate_inventory_data(self, part_id, name, price, quantity_in_stock):
        
@@ -33,13 +41,70 @@ class InventoryItem:
         return self.quantity_in_stock >= required_quantity
 
     def reserve_items(self, quantity):
-        if not self.check_availability(quantity):
-            raise PartNotAvailableException(self.part_id)
-        self.quantity_in_stock -= quantity
+        with InventoryItem._stock_lock:
+            if not self.check_availability(quantity):
+                raise PartNotAvailableException(self.part_id)
+            self.quantity_in_stock -= quantity
+            self._notify_stock_change()
 
     def restock_items(self, quantity):
         if quantity > 0:
-            self.quantity_in_stock += quantity
+            with InventoryItem._stock_lock:
+                self.quantity_in_stock += quantity
+                self._notify_stock_change()
+
+    @classmethod
+    def reserve_batch(cls, parts):
+        """Reserving several parts at once, all or nothing
+
+        parts holds {'part': InventoryItem, 'quantity': int} entries; quantities
+        of a repeated part are added up. Every part is validated before any
+        stock is taken, and if a stock listener fails midway the parts already
+        reserved are restocked. Every quantity is restored before listeners are
+        told about the rollback, and errors they raise then are ignored so
+        the rollback always completes. Reservations are serialized on a lock
+        shared by all items, so concurrent batches never oversell a part."""
+        totals = {}
+        for part_data in parts:
+            item = part_data['part']
+            quantity = part_data['quantity']
+            if quantity < 0:
+                raise InvalidPartDataException("quantity", quantity)
+            entry = totals.get(id(item))
+            totals[id(item)] = (item, quantity + (entry[1] if entry else 0))
+
+        with cls._stock_lock:
+            for item, quantity in totals.values():
+                if not item.check_availability(quantity):
+                    raise PartNotAvailableException(item.part_id)
+            reserved = []
+            try:
+                for item, quantity in totals.values():
+                    item.quantity_in_stock -= quantity
+                    reserved.append((item, quantity))
+                    item._notify_stock_change()
+            except Exception:
+                for item, quantity in reserved:
+                    item.quantity_in_stock += quantity
+                for item, _ in reserved:
+                    item._notify_stock_change(raise_errors=False)
+                raise
+
+    def add_stock_listener(self, listener):
+        """Registering a callable invoked with the item after each stock change"""
+        self._stock_listeners.append(listener)
+
+    def remove_stock_listener(self, listener):
+        if listener in self._stock_listeners:
+            self._stock_listeners.remove(listener)
+
+    def _notify_stock_change(self, raise_errors=True):
+        for listener in self._stock_listeners:
+            try:
+                listener(self)
+            except Exception:
+                if raise_errors:
+                    raise
 
     def needs_restocking(self):
         return self.quantity_in_stock <= self.min_stock_level
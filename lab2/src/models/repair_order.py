@@ -1,6 +1,5 @@
 from src.utils import manual_utils_instance as ManualUtils
 from src.exceptions.invalid_order_data_exception import InvalidOrderDataException
-from src.exceptions.part_not_available_exception import PartNotAvailableException
 from src.exceptions.warranty_expired_exception import WarrantyExpiredException
 from src.constants.config_constants import ConfigConstants
 from src.constants.financial_constants import FinancialConstants
@@ -34,16 +33,21 @@ class RepairOrder:
             raise InvalidOrderDataException("problem_description", problem_description)
 
     def add_used_part(self, inventory_item, quantity):
-        if not inventory_item.check_availability(quantity):
-            raise PartNotAvailableException(inventory_item.part_id)
-        
-        inventory_item.reserve_items(quantity)
-        part_usage = {
-            'part': inventory_item,
-            'quantity': quantity,
-            'cost': inventory_item.price * quantity
-        }
-        self.used_parts.append(part_usage)
+        self.add_used_parts([{'part': inventory_item, 'quantity': quantity}])
+
+    def add_used_parts(self, parts):
+        from src.models.inventory import InventoryItem
+        parts = list(parts)
+        InventoryItem.reserve_batch(parts)
+        for part_data in parts:
+            inventory_item = part_data['part']
+            quantity = part_data['quantity']
+            part_usage = {
+                'part': inventory_item,
+                'quantity': quantity,
+                'cost': inventory_item.price * quantity
+            }
+            self.used_parts.append(part_usage)
 
     def calculate_total_cost(self):
         service_cost = self.service_required.base_cost
@@ -61,10 +65,10 @@ class RepairOrder:
         self.total_cost = total_without_tax + tax_amount
         return self.total_cost
 
-    def mark_in_progress(self):
+    def mark_in_progress(self, max_workload=None):
         self.status = "IN_PROGRESS"
         if self.technician_assigned:
-            self.technician_assigned.assign_order(self)
+            self.technician_assigned.assign_order(self, max_workload)
 
     def mark_completed(self, actual_hours):
        
@@ -0,0 +1,159 @@
+import heapq
+from itertools import count
+
+from src.constants.config_constants import ConfigConstants
+
+
+class DispatchScheduler:
+    """Priority-queue dispatcher assigning technicians to pending repair orders
+
+    Pending orders wait in one queue per required skill level and are served
+    by priority_level (ConfigConstants.PRIORITY_RANKS) and then creation_date.
+    Technicians sit in one heap per skill_level keyed on their workload (the
+    number of assigned orders). An order goes to the least loaded technician
+    whose skill covers service_required.skill_level_required, preferring the
+    lowest sufficient skill on ties so senior technicians stay free for harder
+    repairs. Technicians whose is_available is false are skipped. The heads of
+    the order queues sit in one more heap. Heap entries are invalidated
+    lazily, so submitting and assigning an order cost O(log n) for a fixed
+    number of skill levels."""
+
+    def __init__(self, technicians=None, max_workload=1):
+        if max_workload < 1:
+            raise ValueError("max_workload must be at least 1")
+        self.max_workload = max_workload
+        self._sequence = count()
+        self._technicians = {}
+        self._workloads = {}
+        self._skill_heaps = {}
+        self._skill_levels = []
+        self._pending = {}
+        self._heads = []
+        self._pending_count = 0
+        if technicians is not None:
+            for technician in technicians:
+                self.add_technician(technician)
+
+    def _priority_rank(self, order):
+        return ConfigConstants.PRIORITY_RANKS.get(order.priority_level, len(ConfigConstants.PRIORITY_RANKS))
+
+    def _required_skill(self, order):
+        service = order.service_required
+        return service.skill_level_required if service is not None else 0
+
+    def _push_technician(self, technician):
+        workload = len(technician.assigned_orders)
+        self._workloads[technician.employee_id] = workload
+        if workload >= self.max_workload or not technician.is_available:
+            return
+        heap = self._skill_heaps.get(technician.skill_level)
+        if heap is None:
+            heap = self._skill_heaps[technician.skill_level] = []
+            self._skill_levels = sorted(self._skill_heaps)
+        heapq.heappush(heap, (workload, next(self._sequence), technician))
+
+    def add_technician(self, technician):
+        if technician.employee_id in self._technicians:
+            return
+        self._technicians[technician.employee_id] = technician
+        self._push_technician(technician)
+
+    def remove_technician(self, technician):
+        self._technicians.pop(technician.employee_id, None)
+        self._workloads.pop(technician.employee_id, None)
+
+    def release(self, technician):
+        """Re-queueing a technician whose assigned orders or availability changed,
+        e.g. after completing one"""
+        if technician.employee_id in self._technicians:
+            self._push_technician(technician)
+
+    def submit_order(self, order):
+        required_skill = self._required_skill(order)
+        queue = self._pending.get(required_skill)
+        if queue is None:
+            queue = self._pending[required_skill] = []
+        entry = (self._priority_rank(order), order.creation_date, next(self._sequence), order)
+        heapq.heappush(queue, entry)
+        if queue[0] is entry:
+            heapq.heappush(self._heads, (entry, required_skill))
+        self._pending_count += 1
+
+    def pending_count(self):
+        return self._pending_count
+
+    def _peek_technician(self, heap):
+        """Top valid entry of a skill heap, dropping stale ones"""
+        while heap:
+            workload, _, technician = heap[0]
+            if (technician.is_available and
+                    self._technicians.get(technician.employee_id) is technician and
+                    self._workloads.get(technician.employee_id) == workload):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def find_technician(self, required_skill_level):
+        """Least loaded technician with enough skill, or None"""
+        best = None
+        best_heap = None
+        for skill_level in self._skill_levels:
+            if skill_level < required_skill_level:
+                continue
+            entry = self._peek_technician(self._skill_heaps[skill_level])
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+                best_heap = self._skill_heaps[skill_level]
+                if best[0] == 0:
+                    break
+        if best is None:
+            return None, None
+        return best[2], best_heap
+
+    def _assign(self, order, technician, heap):
+        heapq.heappop(heap)
+        order.technician_assigned = technician
+        order.mark_in_progress(self.max_workload)
+        technician.current_workload = len(technician.assigned_orders)
+        self._push_technician(technician)
+
+    def dispatch_next(self):
+        """Assigning the most urgent pending order that some technician can take
+
+        Returns (order, technician), or None when nothing can be assigned."""
+        blocked = []
+        assignment = None
+        while self._heads:
+            head = heapq.heappop(self._heads)
+            entry, required_skill = head
+            queue = self._pending.get(required_skill)
+            if not queue or queue[0] is not entry:
+                continue
+            technician, heap = self.find_technician(required_skill)
+            if technician is None:
+                blocked.append(head)
+                continue
+            heapq.heappop(queue)
+            if queue:
+                heapq.heappush(self._heads, (queue[0], required_skill))
+            else:
+                del self._pending[required_skill]
+            self._pending_count -= 1
+            order = entry[3]
+            self._assign(order, technician, heap)
+            assignment = order, technician
+            break
+        for head in blocked:
+            heapq.heappush(self._heads, head)
+        return assignment
+
+    def dispatch_all(self):
+        """Draining the queue until no pending order can be assigned
+
+        Returns the (order, technician) assignments in dispatch order."""
+        assignments = []
+        assignment = self.dispatch_next()
+        while assignment is not None:
+            assignments.append(assignment)
+            assignment = self.dispatch_next()
+        return assignments
@@ -1,22 +1,190 @@
+import math
+
 from src.utils import manual_utils_instance as ManualUtils
+from src.exceptions.invalid_part_data_exception import InvalidPartDataException
+from src.exceptions.part_not_available_exception import PartNotAvailableException
+from src.models.purchase_order import PurchaseOrder
+
+
+class InventoryItemListView:
+    """List-like view of the items of an InventoryManager, in insertion order"""
+
+    def __init__(self, manager):
+        self._manager = manager
+
+    def append(self, item):
+        self._manager._add_item(item)
+
+    def remove(self, item):
+        if self._manager._items.get(getattr(item, 'part_id', None)) is not item:
+            raise ValueError(f"Part {item.part_id} is not in the inventory")
+        self._manager.remove_inventory_item(item.part_id)
+
+    def __contains__(self, item):
+        return self._manager._items.get(getattr(item, 'part_id', None)) is item
+
+    def __iter__(self):
+        return iter(self._manager._item_list())
+
+    def __len__(self):
+        return len(self._manager._items)
+
+    def __getitem__(self, index):
+        return self._manager._item_list()[index]
+
+    def __repr__(self):
+        return f"InventoryItemListView(items={len(self)})"
+
 
 class InventoryManager:
+    """Parts keyed by part_id with category, supplier and compatibility indexes
+
+    The manager listens to stock changes of its items, keeping the set of
+    parts that need restocking and the total inventory value up to date, so
+    restocking and valuation only touch the items that changed. The value is
+    kept as exact partial sums (as in math.fsum), so it does not drift over
+    many stock changes."""
+
+    RESTOCK_ORDER_PREFIX = "PO-RS"
+
     def __init__(self):
-        self.inventory_items = []
+        self._items = {}
+        self._ordered_items = []
+        self._index_keys = {}
+        self._by_category = {}
+        self._by_supplier = {}
+        self._by_compatibility = {}
+        self._item_values = {}
+        self._value_partials = []
+        self._low_stock = {}
+        self._on_order = set()
+        self._restock_order_count = 0
+        self.inventory_items = InventoryItemListView(self)
         self.suppliers = []
         self.restock_requests = []
 
+    def _item_list(self):
+        """Items in insertion order; the list is rebuilt only after a removal"""
+        if self._ordered_items is None:
+            self._ordered_items = list(self._items.values())
+        return self._ordered_items
+
+    def _supplier_key(self, supplier_info):
+        return getattr(supplier_info, 'supplier_id', supplier_info)
+
+    def _item_keys(self, item):
+        tags = []
+        for tag in item.compatibility_list or []:
+            if tag not in tags:
+                tags.append(tag)
+        return item.category, self._supplier_key(item.supplier_info), tuple(tags)
+
+    def _link(self, item, keys):
+        category, supplier, tags = keys
+        self._by_category.setdefault(category, {})[item.part_id] = item
+        self._by_supplier.setdefault(supplier, {})[item.part_id] = item
+        for tag in tags:
+            self._by_compatibility.setdefault(tag, {})[item.part_id] = item
+
+    def _unlink_from(self, index, key, part_id):
+        bucket = index[key]
+        del bucket[part_id]
+        if not bucket:
+            del index[key]
+
+    def _unlink(self, part_id, keys):
+        category, supplier, tags = keys
+        self._unlink_from(self._by_category, category, part_id)
+        self._unlink_from(self._by_supplier, supplier, part_id)
+        for tag in tags:
+            self._unlink_from(self._by_compatibility, tag, part_id)
+
+    def _add_item(self, item):
+        if item.part_id in self._items:
+            raise InvalidPartDataException("part_id", item.part_id)
+        self._items[item.part_id] = item
+        if self._ordered_items is not None:
+            self._ordered_items.append(item)
+        keys = self._item_keys(item)
+        self._index_keys[item.part_id] = keys
+        self._link(item, keys)
+        self._item_values[item.part_id] = 0
+        self._on_stock_change(item)
+        item.add_stock_listener(self._on_stock_change)
+
+    def _add_value(self, value):
+        """Adding value to the partial sums without rounding"""
+        partials = self._value_partials
+        i = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            high = value + partial
+            low = partial - (high - value)
+            if low:
+                partials[i] = low
+                i += 1
+            value = high
+        partials[i:] = [value]
+
+    def _on_stock_change(self, item):
+        part_id = item.part_id
+        value = item.calculate_total_value()
+        self._add_value(-self._item_values[part_id])
+        self._add_value(value)
+        self._item_values[part_id] = value
+        if item.needs_restocking():
+            self._low_stock[part_id] = item
+        else:
+            self._low_stock.pop(part_id, None)
+            self._on_order.discard(part_id)
+
     def add_inventory_item(self, part_id, name, description, category, price, quantity, min_stock, supplier, compatibility):
         from src.models.inventory import InventoryItem
+        if part_id in self._items:
+            raise InvalidPartDataException("part_id", part_id)
         new_item = InventoryItem(part_id, name, description, category, price, quantity, min_stock, supplier, compatibility)
-        self.inventory_items.append(new_item)
+        self._add_item(new_item)
         return new_item
 
+    def remove_inventory_item(self, part_id):
+        item = self._items.pop(part_id, None)
+        if item is None:
+            return None
+        self._ordered_items = None
+        self._unlink(part_id, self._index_keys.pop(part_id))
+        item.remove_stock_listener(self._on_stock_change)
+        self._add_value(-self._item_values.pop(part_id))
+        if not self._items:
+            self._value_partials = []
+        self._low_stock.pop(part_id, None)
+        self._on_order.discard(part_id)
+        return item
+
+    def refresh_item(self, item):
+        """Re-indexing an item after its category, supplier, compatibility list,
+        price or minimum stock level changed"""
+        old_keys = self._index_keys.get(item.part_id)
+        if old_keys is None:
+            return
+        self._on_stock_change(item)
+        new_keys = self._item_keys(item)
+        if new_keys != old_keys:
+            self._unlink(item.part_id, old_keys)
+            self._index_keys[item.part_id] = new_keys
+            self._link(item, new_keys)
+
     def find_item_by_id(self, part_id):
-        for item in self.inventory_items:
-            if item.part_id == part_id:
-                return item
-        return None
+        return self._items.get(part_id)
+
+    def find_items_by_category(self, category):
+        return list(self._by_category.get(category, {}).values())
+
+    def find_items_by_supplier(self, supplier):
+        return list(self._by_supplier.get(self._supplier_key(supplier), {}).values())
+
+    def find_compatible_parts(self, device):
+        return list(self._by_compatibility.get(device, {}).values())
 
     def check_part_availability(self, part_id, required_quantity):
         target_item = self.find_item_by_id(part_id)
@@ -24,21 +192,73 @@ class InventoryManager:
             return False
         return target_item.check_availability(required_quantity)
 
+    def reserve_batch(self, parts):
+        """Reserving {'part_id', 'quantity'} entries all or nothing
+
+        Returns the matching {'part', 'quantity'} entries."""
+        from src.models.inventory import InventoryItem
+        resolved = []
+        for part_data in parts:
+            item = self._items.get(part_data['part_id'])
+            if item is None:
+                raise PartNotAvailableException(part_data['part_id'])
+            resolved.append({'part': item, 'quantity': part_data['quantity']})
+        InventoryItem.reserve_batch(resolved)
+        return resolved
+
+    def get_low_stock_items(self):
+        return list(self._low_stock.values())
+
+    def _restock_quantity(self, item):
+        return item.min_stock_level * 3 - item.quantity_in_stock
+
     def process_restock_requests(self):
         restocked_items = []
-        for item in self.inventory_items:
-            if item.needs_restocking():
-                restock_quantity = item.min_stock_level * 3 - item.quantity_in_stock
-                item.restock_items(restock_quantity)
-                restocked_items.append({
+        for item in list(self._low_stock.values()):
+            restock_quantity = self._restock_quantity(item)
+            item.restock_items(restock_quantity)
+            restocked_items.append({
+                'part_id': item.part_id,
+                'name': item.name,
+                'restocked_quantity': restock_quantity
+            })
+        return restocked_items
+
+    def create_restock_purchase_orders(self, order_date, expected_delivery):
+        """Grouping low-stock parts by supplier into one PurchaseOrder per supplier
+
+        Parts already on an open restock order are skipped until their stock
+        is back above min_stock_level. The requested quantities are recorded
+        in restock_requests."""
+        groups = {}
+        for item in self._low_stock.values():
+            restock_quantity = self._restock_quantity(item)
+            if item.part_id in self._on_order or restock_quantity <= 0:
+                continue
+            key = self._supplier_key(item.supplier_info)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (item.supplier_info, [])
+            group[1].append((item, restock_quantity))
+
+        purchase_orders = []
+        for supplier, entries in groups.values():
+            self._restock_order_count += 1
+            order_id = f"{self.RESTOCK_ORDER_PREFIX}{self._restock_order_count:04d}"
+            total_amount = sum(item.price * quantity for item, quantity in entries)
+            purchase_order = PurchaseOrder(order_id, supplier, [item for item, _ in entries],
+                                           order_date, expected_delivery, total_amount)
+            for item, quantity in entries:
+                self._on_order.add(item.part_id)
+                self.restock_requests.append({
+                    'order_id': order_id,
                     'part_id': item.part_id,
-                    'name': item.name,
-                    'restocked_quantity': restock_quantity
+                    'quantity': quantity
                 })
-        return restocked_items
+            purchase_orders.append(purchase_order)
+        return purchase_orders
 
     def calculate_total_inventory_value(self):
-        total_value = 0
-        for item in self.inventory_items:
-            total_value += item.calculate_total_value()
-        return total_value
\ No newline at end of file
+        if not self._value_partials:
+            return 0
+        return math.fsum(self._value_partials)
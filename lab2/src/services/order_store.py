@@ -0,0 +1,185 @@
+from src.exceptions.invalid_order_data_exception import InvalidOrderDataException
+
+ACTIVE_SECTION = "ACTIVE"
+COMPLETED_SECTION = "COMPLETED"
+
+
+class OrderListView:
+    """List-like view of one section (active or completed) of an OrderStore"""
+
+    def __init__(self, store, section):
+        self._store = store
+        self._section = section
+
+    def _orders(self):
+        return self._store._sections[self._section]
+
+    def append(self, order):
+        self._store.add(order, self._section)
+
+    def remove(self, order):
+        if not self._contains_order(order):
+            raise ValueError(f"Order {order.order_id} is not in the list")
+        self._store.remove(order.order_id)
+
+    def _contains_order(self, order):
+        return self._orders().get(getattr(order, 'order_id', None)) is order
+
+    def __contains__(self, order):
+        return self._contains_order(order)
+
+    def __iter__(self):
+        return iter(self._store._section_list(self._section))
+
+    def __len__(self):
+        return len(self._orders())
+
+    def __getitem__(self, index):
+        return self._store._section_list(self._section)[index]
+
+    def __repr__(self):
+        return f"OrderListView({self._section}, orders={len(self)})"
+
+
+class OrderStore:
+    """Repair orders keyed by order_id with secondary indexes
+
+    Orders are indexed by status, technician employee_id, client_id and
+    priority_level. Changes made on an order directly (status transitions,
+    technician assignment) are picked up by refresh(). Each section keeps an
+    ordered list next to its dict for positional access; appends extend it
+    and removals drop it until it is next needed."""
+
+    def __init__(self):
+        self._orders = {}
+        self._sections = {ACTIVE_SECTION: {}, COMPLETED_SECTION: {}}
+        self._section_lists = {ACTIVE_SECTION: [], COMPLETED_SECTION: []}
+        self._order_sections = {}
+        self._keys = {}
+        self._by_status = {}
+        self._by_technician = {}
+        self._by_client = {}
+        self._by_priority = {}
+        self._active_workload = {}
+        self.active_orders = OrderListView(self, ACTIVE_SECTION)
+        self.completed_orders = OrderListView(self, COMPLETED_SECTION)
+
+    def _index_keys(self, order):
+        technician = order.technician_assigned
+        client = order.client
+        return (order.status,
+                technician.employee_id if technician else None,
+                client.client_id if client else None,
+                order.priority_level)
+
+    def _indexes(self):
+        return (self._by_status, self._by_technician, self._by_client, self._by_priority)
+
+    def _link(self, order, keys):
+        for index, key in zip(self._indexes(), keys):
+            index.setdefault(key, {})[order.order_id] = order
+        technician_id = keys[1]
+        if technician_id is not None and self._order_sections[order.order_id] == ACTIVE_SECTION:
+            self._active_workload[technician_id] = self._active_workload.get(technician_id, 0) + 1
+
+    def _unlink(self, order_id, keys):
+        for index, key in zip(self._indexes(), keys):
+            bucket = index[key]
+            del bucket[order_id]
+            if not bucket:
+                del index[key]
+        technician_id = keys[1]
+        if technician_id is not None and self._order_sections[order_id] == ACTIVE_SECTION:
+            remaining = self._active_workload[technician_id] - 1
+            if remaining:
+                self._active_workload[technician_id] = remaining
+            else:
+                del self._active_workload[technician_id]
+
+    def _section_list(self, section):
+        """Orders of a section in insertion order, rebuilt after removals"""
+        orders = self._section_lists[section]
+        if orders is None:
+            orders = self._section_lists[section] = list(self._sections[section].values())
+        return orders
+
+    def _section_add(self, section, order):
+        self._sections[section][order.order_id] = order
+        orders = self._section_lists[section]
+        if orders is not None:
+            orders.append(order)
+
+    def _section_remove(self, section, order_id):
+        del self._sections[section][order_id]
+        self._section_lists[section] = None
+
+    def add(self, order, section=ACTIVE_SECTION):
+        if order.order_id in self._orders:
+            raise InvalidOrderDataException("order_id", order.order_id)
+        self._orders[order.order_id] = order
+        self._section_add(section, order)
+        self._order_sections[order.order_id] = section
+        keys = self._index_keys(order)
+        self._keys[order.order_id] = keys
+        self._link(order, keys)
+
+    def remove(self, order_id):
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return None
+        self._unlink(order_id, self._keys.pop(order_id))
+        self._section_remove(self._order_sections.pop(order_id), order_id)
+        return order
+
+    def refresh(self, order):
+        """Re-indexing an order after its status, technician, client or priority changed"""
+        old_keys = self._keys.get(order.order_id)
+        if old_keys is None:
+            return
+        new_keys = self._index_keys(order)
+        if new_keys != old_keys:
+            self._unlink(order.order_id, old_keys)
+            self._keys[order.order_id] = new_keys
+            self._link(order, new_keys)
+
+    def complete(self, order):
+        """Moving an order to the completed section and re-indexing it"""
+        order_id = order.order_id
+        keys = self._keys[order_id]
+        self._unlink(order_id, keys)
+        self._section_remove(self._order_sections[order_id], order_id)
+        self._section_add(COMPLETED_SECTION, order)
+        self._order_sections[order_id] = COMPLETED_SECTION
+        keys = self._index_keys(order)
+        self._keys[order_id] = keys
+        self._link(order, keys)
+
+    def get(self, order_id):
+        return self._orders.get(order_id)
+
+    def is_active(self, order_id):
+        return self._order_sections.get(order_id) == ACTIVE_SECTION
+
+    def find_by_status(self, status):
+        return list(self._by_status.get(status, {}).values())
+
+    def find_by_technician(self, technician_id):
+        return list(self._by_technician.get(technician_id, {}).values())
+
+    def find_by_client(self, client_id):
+        return list(self._by_client.get(client_id, {}).values())
+
+    def find_by_priority(self, priority_level):
+        return list(self._by_priority.get(priority_level, {}).values())
+
+    def count_active_by_technician(self, technician_id):
+        return self._active_workload.get(technician_id, 0)
+
+    def __contains__(self, order_id):
+        return order_id in self._orders
+
+    def __len__(self):
+        return len(self._orders)
+
+    def __iter__(self):
+        return iter(list(self._orders.values()))
@@ -1,22 +1,25 @@
 from src.utils import manual_utils_instance as ManualUtils
 from src.exceptions.order_not_found_exception import OrderNotFoundException
 from src.exceptions.technician_not_available_exception import TechnicianNotAvailableException
+from src.services.order_store import OrderStore
+from src.services.dispatch_scheduler import DispatchScheduler
 
 class RepairServiceManager:
     def __init__(self):
-        self.active_orders = []
-        self.completed_orders = []
+        self.order_store = OrderStore()
         self.available_technicians = []
         self.repair_services = []
 
+    @property
+    def active_orders(self):
+        return self.order_store.active_orders
+
+    @property
+    def completed_orders(self):
+        return self.order_store.completed_orders
+
     def _find_order_by_id(self, order_id):
-        for order in self.active_orders:
-            if order.order_id == order_id:
-                return order
-        for order in self.completed_orders:
-            if order.order_id == order_id:
-                return order
-        return None
+        return self.order_store.get(order_id)
 
     def assign_technician_to_order(self, order_id, technician):
         target_order = self._find_order_by_id(order_id)
@@ -28,6 +31,7 @@ class RepairServiceManager:
         
         target_order.technician_assigned = technician
         target_order.mark_in_progress()
+        self.order_store.refresh(target_order)
 
     def _manual_list_contains(self, lst, item):
         for element in lst:
@@ -40,27 +44,15 @@ class RepairServiceManager:
         if not target_order:
             raise OrderNotFoundException(order_id)
         
-        for part_data in used_parts:
-            target_order.add_used_part(part_data['part'], part_data['quantity'])
+        target_order.add_used_parts(used_parts)
         
         target_order.mark_completed(actual_hours)
-        
-        new_active_orders = []
-        for order in self.active_orders:
-            if order.order_id != order_id:
-                new_active_orders.append(order)
-        self.active_orders = new_active_orders
-        
-        self.completed_orders.append(target_order)
+        self.order_store.complete(target_order)
         
         return target_order.calculate_total_cost()
 
     def calculate_technician_workload(self, technician_id):
-        workload_count = 0
-        for order in self.active_orders:
-            if order.technician_assigned and order.technician_assigned.employee_id == technician_id:
-                workload_count += 1
-        return workload_count
+        return self.order_store.count_active_by_technician(technician_id)
 
     def find_available_technician(self, required_skill_level):
         available_techs = []
@@ -74,4 +66,14 @@ class RepairServiceManager:
                 if tech.skill_level > best_tech.skill_level:
                     best_tech = tech
             return best_tech
-        return None
\ No newline at end of file
+        return None
+
+    def dispatch_pending_orders(self, max_workload=1):
+        dispatcher = DispatchScheduler(self.available_technicians, max_workload)
+        for order in self.order_store.find_by_status("CREATED"):
+            if order.technician_assigned is None and self.order_store.is_active(order.order_id):
+                dispatcher.submit_order(order)
+        assignments = dispatcher.dispatch_all()
+        for order, _ in assignments:
+            self.order_store.refresh(order)
+        return assignments
\ No newline at end of file
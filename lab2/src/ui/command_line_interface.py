@@ -373,13 +373,13 @@ class CommandLineInterface:
             print(f"❌ Error creating repair order: {e}")
 
     def view_all_orders(self):
-        manager = self.repair_company.repair_service_manager
+        order_store = self.repair_company.repair_service_manager.order_store
         print("\n--- ACTIVE REPAIR ORDERS ---")
         
-        if not manager.active_orders:
+        if not order_store.active_orders:
             print("No active orders.")
         else:
-            for i, order in enumerate(manager.active_orders, 1):
+            for i, order in enumerate(order_store.active_orders, 1):
                 technician_name = order.technician_assigned.get_full_name() if order.technician_assigned else "Unassigned"
                 print(f"{i}. 📋 Order {order.order_id}")
                 print(f"   Client: {order.client.name}")
@@ -389,10 +389,10 @@ class CommandLineInterface:
                 print()
         
         print("\n--- COMPLETED ORDERS ---")
-        if not manager.completed_orders:
+        if not order_store.completed_orders:
             print("No completed orders.")
         else:
-            for i, order in enumerate(manager.completed_orders, 1):
+            for i, order in enumerate(order_store.completed_orders, 1):
                 print(f"{i}. ✅ Order {order.order_id} - {order.device_description}")
                 print(f"   Completed: {order.completion_date} - Cost: ${order.total_cost:.2f}")
                 print()
@@ -401,7 +401,7 @@ class CommandLineInterface:
         order_id = InputHandler.get_string_input("Enter Order ID to search")
         
         manager = self.repair_company.repair_service_manager
-        found_order = manager._find_order_by_id(order_id)
+        found_order = manager.order_store.get(order_id)
         
         if found_order:
             self.display_order_details(found_order)
@@ -454,6 +454,7 @@ class CommandLineInterface:
         elif new_status == "COMPLETED":
             actual_hours = InputHandler.get_float_input("Enter actual hours worked", 0.5, 100)
             order.mark_completed(actual_hours)
+        manager.order_store.refresh(order)
         
         print(f"✅ Order status updated to: {order.status}")
 
@@ -707,9 +708,13 @@ class CommandLineInterface:
         problem = InputHandler.get_string_input("Enter problem description")
         
         service = RepairService("DEMO001", "Demo Repair", "Demo service", 150.0, 1.5, [], 5, 90)
-        order = RepairOrder(order_id, client, device, problem, service, None, "NORMAL", "2024-01-01")
+        try:
+            order = RepairOrder(order_id, client, device, problem, service, None, "NORMAL", "2024-01-01")
+            self.repair_company.repair_service_manager.active_orders.append(order)
+        except Exception as e:
+            print(f"❌ Error creating demo repair order: {e}")
+            return
         
-        self.repair_company.repair_service_manager.active_orders.append(order)
         client.repair_history.append(order)
         print(f"✅ Demo repair order {order_id} created!")
         print(f"Added to {client.name}'s repair history")
@@ -774,7 +779,11 @@ class CommandLineInterface:
         quantity = InputHandler.get_integer_input("Enter quantity", 1, 1000)
         
         item = InventoryItem(part_id, name, "Demo part", "Demo Category", price, quantity, 5, "Demo Supplier", [])
-        self.repair_company.inventory_manager.inventory_items.append(item)
+        try:
+            self.repair_company.inventory_manager.inventory_items.append(item)
+        except Exception as e:
+            print(f"❌ Error creating demo inventory item: {e}")
+            return
         
         print(f"✅ Demo inventory item {name} created!")
         print(f"Stock: {quantity} - Value: ${item.calculate_total_value():.2f}")
@@ -811,13 +820,21 @@ class CommandLineInterface:
         # Create inventory item
         inventory_item = InventoryItem("PWF001", "Workflow Part", "Demo part for workflow", 
                                      "Components", 75.0, 50, 10, "Workflow Supplier", [])
-        self.repair_company.inventory_manager.inventory_items.append(inventory_item)
+        try:
+            self.repair_company.inventory_manager.inventory_items.append(inventory_item)
+        except Exception as e:
+            print(f"❌ Step 4 failed: {e}")
+            return
         print("✅ Step 4: Inventory item created")
         
         # Create repair order
         order = RepairOrder("OWF001", client, "Workflow Device", "Complete workflow test", 
                           service, None, "HIGH", "2024-01-01")
-        self.repair_company.repair_service_manager.active_orders.append(order)
+        try:
+            self.repair_company.repair_service_manager.active_orders.append(order)
+        except Exception as e:
+            print(f"❌ Step 5 failed: {e}")
+            return
         client.repair_history.append(order)
         print("✅ Step 5: Repair order created")
         
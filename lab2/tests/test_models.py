@@ -107,6 +107,19 @@ class TestEmployee(unittest.TestCase):
         self.assertNotIn(order, self.employee.assigned_orders)
         self.assertTrue(self.employee.is_available)
 
+    def test_assign_order_up_to_max_workload(self):
+        client = Client("CL001", "John Doe", "john@test.com", "+1234567890", self.address, 1000.0)
+        service = RepairService("S001", "Test Service", "Description", 100.0, 1.0, [], 5, 90)
+        first = RepairOrder("RO001", client, "Device", "Problem", service, None, "NORMAL", "2024-01-01")
+        second = RepairOrder("RO002", client, "Device", "Problem", service, None, "NORMAL", "2024-01-01")
+
+        self.employee.assign_order(first, max_workload=2)
+        self.assertTrue(self.employee.is_available)
+        self.employee.assign_order(second, max_workload=2)
+        self.assertFalse(self.employee.is_available)
+        with self.assertRaises(TechnicianNotAvailableException):
+            self.employee.assign_order(first, max_workload=2)
+
 class TestTechnician(unittest.TestCase):
     def setUp(self):
         self.address = Address("Tech St", "Seattle", "WA", "98101", "USA", "789")
@@ -186,6 +199,75 @@ class TestInventoryItem(unittest.TestCase):
                                      45.99, 3, 5, "Supplier Co", [])
         self.assertTrue(low_stock_item.needs_restocking())
 
+    def test_reserve_batch_is_all_or_nothing(self):
+        battery = InventoryItem("P002", "Battery", "Li-ion", "Power", 45.99, 3, 5, "Supplier Co", [])
+        with self.assertRaises(PartNotAvailableException):
+            InventoryItem.reserve_batch([{'part': self.item, 'quantity': 5},
+                                         {'part': battery, 'quantity': 2},
+                                         {'part': battery, 'quantity': 2}])
+        self.assertEqual(self.item.quantity_in_stock, 25)
+        self.assertEqual(battery.quantity_in_stock, 3)
+
+        InventoryItem.reserve_batch([{'part': self.item, 'quantity': 5},
+                                     {'part': battery, 'quantity': 3}])
+        self.assertEqual(self.item.quantity_in_stock, 20)
+        self.assertEqual(battery.quantity_in_stock, 0)
+
+    def test_reserve_batch_rolls_back_on_listener_failure(self):
+        battery = InventoryItem("P002", "Battery", "Li-ion", "Power", 45.99, 3, 5, "Supplier Co", [])
+
+        def failing_listener(item):
+            if item.quantity_in_stock < 3:
+                raise RuntimeError("listener failed")
+
+        battery.add_stock_listener(failing_listener)
+        with self.assertRaises(RuntimeError):
+            InventoryItem.reserve_batch([{'part': self.item, 'quantity': 5},
+                                         {'part': battery, 'quantity': 1}])
+        self.assertEqual(self.item.quantity_in_stock, 25)
+        self.assertEqual(battery.quantity_in_stock, 3)
+
+    def test_reserve_batch_rollback_survives_failing_listeners(self):
+        battery = InventoryItem("P002", "Battery", "Li-ion", "Power", 45.99, 3, 5, "Supplier Co", [])
+        cable = InventoryItem("P003", "Cable", "USB-C", "Power", 5.0, 10, 2, "Supplier Co", [])
+        seen = []
+
+        def broken_listener(item):
+            raise RuntimeError("listener failed")
+
+        self.item.add_stock_listener(lambda item: seen.append(item.quantity_in_stock))
+        cable.add_stock_listener(broken_listener)
+        with self.assertRaises(RuntimeError):
+            InventoryItem.reserve_batch([{'part': self.item, 'quantity': 5},
+                                         {'part': battery, 'quantity': 1},
+                                         {'part': cable, 'quantity': 4}])
+        self.assertEqual(self.item.quantity_in_stock, 25)
+        self.assertEqual(battery.quantity_in_stock, 3)
+        self.assertEqual(cable.quantity_in_stock, 10)
+        self.assertEqual(seen, [20, 25])
+
+    def test_concurrent_reservations_do_not_oversell(self):
+        import threading
+        battery = InventoryItem("P002", "Battery", "Li-ion", "Power", 45.99, 500, 5, "Supplier Co", [])
+        succeeded = []
+
+        def worker():
+            for _ in range(200):
+                try:
+                    InventoryItem.reserve_batch([{'part': self.item, 'quantity': 0},
+                                                 {'part': battery, 'quantity': 1}])
+                    succeeded.append(1)
+                except PartNotAvailableException:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(succeeded), 500)
+        self.assertEqual(battery.quantity_in_stock, 0)
+
 class TestRepairOrder(unittest.TestCase):
     def setUp(self):
         self.address = Address("Client St", "Chicago", "IL", "60601", "USA", "111")
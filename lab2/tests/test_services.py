@@ -6,6 +6,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.services.repair_service import RepairServiceManager
 from src.services.inventory_service import InventoryManager
 from src.services.quality_control import QualityControlManager
+from src.services.order_store import OrderStore
+from src.services.dispatch_scheduler import DispatchScheduler
 from src.models.client import Client
 from src.models.address import Address
 from src.models.technician import Technician
@@ -15,6 +17,9 @@ from src.models.inventory import InventoryItem
 from src.exceptions import OrderNotFoundException, TechnicianNotAvailableException
 from src.exceptions.order_not_found_exception import OrderNotFoundException
 from src.exceptions.technician_not_available_exception import TechnicianNotAvailableException
+from src.exceptions.invalid_order_data_exception import InvalidOrderDataException
+from src.exceptions.invalid_part_data_exception import InvalidPartDataException
+from src.exceptions.part_not_available_exception import PartNotAvailableException
 class TestRepairServiceManager(unittest.TestCase):
     def setUp(self):
         self.manager = RepairServiceManager()
@@ -56,6 +61,19 @@ class TestRepairServiceManager(unittest.TestCase):
         self.assertIn(order, self.manager.completed_orders)
         self.assertNotIn(order, self.manager.active_orders)
 
+    def test_complete_repair_order_reserves_parts_atomically(self):
+        order = RepairOrder("RO001", self.client, "Device", "Problem", self.service, self.technician, "NORMAL", "2024-01-01")
+        self.manager.active_orders.append(order)
+        screen = InventoryItem("P001", "Screen", "Description", "Category", 50.0, 10, 2, "Supplier", [])
+        battery = InventoryItem("P002", "Battery", "Description", "Category", 20.0, 1, 2, "Supplier", [])
+        used_parts = [{'part': screen, 'quantity': 2}, {'part': battery, 'quantity': 2}]
+
+        with self.assertRaises(PartNotAvailableException):
+            self.manager.complete_repair_order("RO001", 2.0, used_parts)
+        self.assertEqual(screen.quantity_in_stock, 10)
+        self.assertEqual(order.used_parts, [])
+        self.assertIn(order, self.manager.active_orders)
+
     def test_technician_workload(self):
         order = RepairOrder("RO001", self.client, "Device", "Problem", self.service, self.technician, "NORMAL", "2024-01-01")
         self.manager.active_orders.append(order)
@@ -72,6 +90,207 @@ class TestRepairServiceManager(unittest.TestCase):
         not_found = self.manager.find_available_technician(9)
         self.assertIsNone(not_found)
 
+class TestOrderStore(unittest.TestCase):
+    def setUp(self):
+        self.store = OrderStore()
+        self.address = Address("Test St", "City", "ST", "12345", "Country", "123")
+        self.client = Client("CL001", "John Doe", "john@test.com", "+1234567890", self.address, 1000.0)
+        self.technician = Technician("T001", "Tech", "Nician", "Technician", 50000.0,
+                                   "2023-01-01", "Repair", self.address, "Electronics", 7, [])
+        self.service = RepairService("S001", "Test Service", "Description", 100.0, 1.0, [], 5, 90)
+
+    def _order(self, order_id, technician=None, priority="NORMAL"):
+        return RepairOrder(order_id, self.client, "Device", "Problem", self.service, technician, priority, "2024-01-01")
+
+    def test_lookup_and_indexes(self):
+        first = self._order("RO001", self.technician, "HIGH")
+        second = self._order("RO002")
+        self.store.active_orders.append(first)
+        self.store.active_orders.append(second)
+
+        self.assertIs(self.store.get("RO001"), first)
+        self.assertIsNone(self.store.get("RO999"))
+        self.assertEqual(self.store.find_by_technician("T001"), [first])
+        self.assertEqual(self.store.find_by_client("CL001"), [first, second])
+        self.assertEqual(self.store.find_by_priority("HIGH"), [first])
+        self.assertEqual(self.store.find_by_status("CREATED"), [first, second])
+        self.assertEqual(self.store.count_active_by_technician("T001"), 1)
+        self.assertEqual(list(self.store.active_orders), [first, second])
+
+    def test_duplicate_order_id(self):
+        self.store.add(self._order("RO001"))
+        with self.assertRaises(InvalidOrderDataException):
+            self.store.active_orders.append(self._order("RO001"))
+
+    def test_refresh_and_complete(self):
+        order = self._order("RO001")
+        self.store.add(order)
+        order.technician_assigned = self.technician
+        order.mark_in_progress()
+        self.store.refresh(order)
+        self.assertEqual(self.store.find_by_status("IN_PROGRESS"), [order])
+        self.assertEqual(self.store.find_by_status("CREATED"), [])
+        self.assertEqual(self.store.count_active_by_technician("T001"), 1)
+
+        order.mark_completed(1.0)
+        self.store.complete(order)
+        self.assertNotIn(order, self.store.active_orders)
+        self.assertIn(order, self.store.completed_orders)
+        self.assertEqual(self.store.find_by_status("COMPLETED"), [order])
+        self.assertEqual(self.store.count_active_by_technician("T001"), 0)
+        self.assertIs(self.store.get("RO001"), order)
+
+    def test_remove(self):
+        order = self._order("RO001", self.technician)
+        self.store.active_orders.append(order)
+        self.store.active_orders.remove(order)
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.find_by_technician("T001"), [])
+        self.assertEqual(self.store.count_active_by_technician("T001"), 0)
+        with self.assertRaises(ValueError):
+            self.store.active_orders.remove(order)
+
+    def test_positional_access_follows_changes(self):
+        orders = [self._order(f"RO00{i}") for i in range(4)]
+        for order in orders:
+            self.store.active_orders.append(order)
+        self.assertIs(self.store.active_orders[2], orders[2])
+        self.store.active_orders.remove(orders[1])
+        self.store.complete(orders[0])
+        self.assertEqual(list(self.store.active_orders), [orders[2], orders[3]])
+        self.assertIs(self.store.active_orders[-1], orders[3])
+        self.assertIs(self.store.completed_orders[0], orders[0])
+        late = self._order("RO009")
+        self.store.active_orders.append(late)
+        self.assertIs(self.store.active_orders[2], late)
+        with self.assertRaises(IndexError):
+            self.store.active_orders[3]
+
+class TestDispatchScheduler(unittest.TestCase):
+    def setUp(self):
+        self.address = Address("Test St", "City", "ST", "12345", "Country", "123")
+        self.client = Client("CL001", "John Doe", "john@test.com", "+1234567890", self.address, 1000.0)
+        self.basic_service = RepairService("S001", "Basic Service", "Description", 100.0, 1.0, [], 3, 90)
+        self.expert_service = RepairService("S002", "Expert Service", "Description", 300.0, 3.0, [], 8, 90)
+
+    def _technician(self, employee_id, skill_level):
+        return Technician(employee_id, "Tech", "Nician", "Technician", 50000.0,
+                          "2023-01-01", "Repair", self.address, "Electronics", skill_level, [])
+
+    def _order(self, order_id, service, priority="NORMAL", creation_date="2024-01-01"):
+        return RepairOrder(order_id, self.client, "Device", "Problem", service, None, priority, creation_date)
+
+    def test_orders_are_served_by_priority_and_date(self):
+        scheduler = DispatchScheduler([self._technician("T001", 5)], max_workload=3)
+        late = self._order("RO001", self.basic_service, "NORMAL", "2024-02-01")
+        early = self._order("RO002", self.basic_service, "NORMAL", "2024-01-01")
+        urgent = self._order("RO003", self.basic_service, "URGENT", "2024-03-01")
+        low = self._order("RO004", self.basic_service, "LOW", "2023-01-01")
+        for order in (late, early, urgent, low):
+            scheduler.submit_order(order)
+
+        assignments = scheduler.dispatch_all()
+        self.assertEqual([order for order, _ in assignments], [urgent, early, late])
+        self.assertEqual(scheduler.pending_count(), 1)
+        self.assertEqual(urgent.status, "IN_PROGRESS")
+        self.assertEqual(len(assignments[0][1].assigned_orders), 3)
+        self.assertFalse(assignments[0][1].is_available)
+
+    def test_least_loaded_sufficiently_skilled_technician(self):
+        junior = self._technician("T001", 4)
+        senior = self._technician("T002", 9)
+        scheduler = DispatchScheduler([senior, junior], max_workload=2)
+        expert_order = self._order("RO001", self.expert_service)
+        basic_orders = [self._order(f"RO1{i}", self.basic_service) for i in range(3)]
+        scheduler.submit_order(expert_order)
+        for order in basic_orders:
+            scheduler.submit_order(order)
+
+        scheduler.dispatch_all()
+        self.assertIs(expert_order.technician_assigned, senior)
+        self.assertIs(basic_orders[0].technician_assigned, junior)
+        self.assertIs(basic_orders[1].technician_assigned, junior)
+        self.assertIs(basic_orders[2].technician_assigned, senior)
+        self.assertEqual(scheduler.pending_count(), 0)
+
+    def test_release_after_completion(self):
+        technician = self._technician("T001", 9)
+        scheduler = DispatchScheduler([technician])
+        first = self._order("RO001", self.expert_service)
+        second = self._order("RO002", self.basic_service)
+        scheduler.submit_order(first)
+        scheduler.submit_order(second)
+        self.assertEqual(len(scheduler.dispatch_all()), 1)
+        self.assertIsNone(scheduler.dispatch_next())
+
+        first.mark_completed(1.0)
+        scheduler.release(technician)
+        self.assertEqual(scheduler.dispatch_next(), (second, technician))
+
+    def test_release_after_partial_completion(self):
+        technician = self._technician("T001", 9)
+        scheduler = DispatchScheduler([technician], max_workload=2)
+        orders = [self._order(f"RO00{i}", self.basic_service) for i in range(3)]
+        for order in orders:
+            scheduler.submit_order(order)
+        self.assertEqual(len(scheduler.dispatch_all()), 2)
+        self.assertFalse(technician.is_available)
+
+        orders[0].mark_completed(1.0)
+        self.assertTrue(technician.is_available)
+        scheduler.release(technician)
+        self.assertEqual(scheduler.dispatch_next(), (orders[2], technician))
+        self.assertEqual(technician.assigned_orders, [orders[1], orders[2]])
+
+    def test_unavailable_technicians_are_skipped(self):
+        busy = self._technician("T001", 9)
+        free = self._technician("T002", 9)
+        busy.is_available = False
+        scheduler = DispatchScheduler([busy, free], max_workload=2)
+        first = self._order("RO001", self.basic_service)
+        second = self._order("RO002", self.basic_service)
+        scheduler.submit_order(first)
+        scheduler.submit_order(second)
+
+        self.assertEqual(scheduler.dispatch_next(), (first, free))
+        self.assertTrue(free.is_available)
+        free.is_available = False
+        self.assertIsNone(scheduler.dispatch_next())
+
+        busy.is_available = True
+        scheduler.release(busy)
+        self.assertEqual(scheduler.dispatch_next(), (second, busy))
+        self.assertEqual(busy.assigned_orders, [second])
+
+    def test_unskilled_technicians_are_not_used(self):
+        junior = self._technician("T001", 4)
+        scheduler = DispatchScheduler([junior])
+        expert_order = self._order("RO001", self.expert_service, "URGENT")
+        basic_order = self._order("RO002", self.basic_service, "LOW")
+        scheduler.submit_order(expert_order)
+        self.assertEqual(scheduler.dispatch_all(), [])
+        scheduler.submit_order(basic_order)
+        self.assertEqual(scheduler.dispatch_all(), [(basic_order, junior)])
+        self.assertEqual(scheduler.pending_count(), 1)
+
+        senior = self._technician("T002", 9)
+        scheduler.add_technician(senior)
+        self.assertEqual(scheduler.dispatch_next(), (expert_order, senior))
+        with self.assertRaises(ValueError):
+            DispatchScheduler(max_workload=0)
+
+    def test_manager_dispatch_pending_orders(self):
+        manager = RepairServiceManager()
+        technician = self._technician("T001", 5)
+        manager.available_technicians.append(technician)
+        order = self._order("RO001", self.basic_service)
+        manager.active_orders.append(order)
+
+        assignments = manager.dispatch_pending_orders()
+        self.assertEqual(assignments, [(order, technician)])
+        self.assertEqual(manager.order_store.find_by_status("IN_PROGRESS"), [order])
+        self.assertEqual(manager.calculate_technician_workload("T001"), 1)
+
 class TestInventoryManager(unittest.TestCase):
     def setUp(self):
         self.manager = InventoryManager()
@@ -110,6 +329,117 @@ class TestInventoryManager(unittest.TestCase):
         total_value = self.manager.calculate_total_inventory_value()
         self.assertEqual(total_value, 250.0)
 
+    def test_duplicate_part_id_rejected(self):
+        self.manager.inventory_items.append(self.item)
+        with self.assertRaises(InvalidPartDataException):
+            self.manager.add_inventory_item("P001", "Copy", "Desc", "Cat", 1.0, 1, 1, "Sup", [])
+        with self.assertRaises(InvalidPartDataException):
+            self.manager.inventory_items.append(InventoryItem("P001", "Copy", "Desc", "Cat", 1.0, 1, 1, "Sup", []))
+        self.assertEqual(len(self.manager.inventory_items), 1)
+
+    def test_indexed_queries(self):
+        screen = self.manager.add_inventory_item("P010", "Screen", "Desc", "Displays", 80.0, 4, 1, "Acme", ["iPhone 12", "iPhone 13"])
+        battery = self.manager.add_inventory_item("P011", "Battery", "Desc", "Power", 30.0, 9, 2, "Acme", ["iPhone 13"])
+        self.manager.add_inventory_item("P012", "Cable", "Desc", "Power", 5.0, 50, 10, "Volt", [])
+
+        self.assertEqual(self.manager.find_compatible_parts("iPhone 13"), [screen, battery])
+        self.assertEqual(self.manager.find_compatible_parts("Pixel 7"), [])
+        self.assertEqual(len(self.manager.find_items_by_category("Power")), 2)
+        self.assertEqual(self.manager.find_items_by_supplier("Acme"), [screen, battery])
+
+        screen.compatibility_list.append("Pixel 7")
+        screen.category = "Power"
+        self.manager.refresh_item(screen)
+        self.assertEqual(self.manager.find_compatible_parts("Pixel 7"), [screen])
+        self.assertEqual(self.manager.find_items_by_category("Displays"), [])
+
+        self.manager.remove_inventory_item("P011")
+        self.assertIsNone(self.manager.find_item_by_id("P011"))
+        self.assertEqual(self.manager.find_compatible_parts("iPhone 13"), [screen])
+        self.assertEqual(self.manager.inventory_items[-1].part_id, "P012")
+
+    def test_item_positions_follow_changes(self):
+        items = [self.manager.add_inventory_item(f"P2{i}", "Part", "Desc", "Category", 1.0, 5, 1, "Acme", [])
+                 for i in range(4)]
+        self.assertIs(self.manager.inventory_items[1], items[1])
+        self.manager.inventory_items.remove(items[1])
+        self.assertIs(self.manager.inventory_items[1], items[2])
+        self.manager.inventory_items.append(self.item)
+        self.assertEqual(list(self.manager.inventory_items), [items[0], items[2], items[3], self.item])
+        self.assertIs(self.manager.inventory_items[-1], self.item)
+
+    def test_low_stock_and_value_follow_stock_changes(self):
+        self.manager.inventory_items.append(self.item)
+        self.assertEqual(self.manager.get_low_stock_items(), [])
+
+        self.item.reserve_items(8)
+        self.assertEqual(self.manager.get_low_stock_items(), [self.item])
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 50.0)
+
+        restocked = self.manager.process_restock_requests()
+        self.assertEqual(restocked[0]['restocked_quantity'], 4)
+        self.assertEqual(self.manager.get_low_stock_items(), [])
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 150.0)
+
+        self.item.price = 10.0
+        self.manager.refresh_item(self.item)
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 60.0)
+
+        self.manager.remove_inventory_item("P001")
+        self.item.reserve_items(1)
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 0)
+
+    def test_total_value_does_not_drift(self):
+        items = [self.manager.add_inventory_item(f"P1{i}", "Part", "Desc", "Category", 0.1,
+                                                 1, 0, "Supplier", [])
+                 for i in range(10)]
+        for _ in range(100):
+            for item in items:
+                item.reserve_items(1)
+                item.restock_items(1)
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 1.0)
+
+        for item in items[1:]:
+            self.manager.remove_inventory_item(item.part_id)
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 0.1)
+        self.manager.remove_inventory_item(items[0].part_id)
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 0)
+
+    def test_create_restock_purchase_orders(self):
+        self.manager.add_inventory_item("P020", "Screen", "Desc", "Displays", 80.0, 1, 2, "Acme", [])
+        self.manager.add_inventory_item("P021", "Battery", "Desc", "Power", 30.0, 0, 1, "Acme", [])
+        self.manager.add_inventory_item("P022", "Cable", "Desc", "Power", 5.0, 3, 4, "Volt", [])
+        self.manager.add_inventory_item("P023", "Fan", "Desc", "Cooling", 15.0, 40, 4, "Volt", [])
+
+        orders = self.manager.create_restock_purchase_orders("2024-01-15", "2024-01-22")
+        self.assertEqual([order.supplier for order in orders], ["Acme", "Volt"])
+        self.assertEqual([item.part_id for item in orders[0].items], ["P020", "P021"])
+        self.assertEqual(orders[0].total_amount, 5 * 80.0 + 3 * 30.0)
+        self.assertEqual(orders[1].total_amount, 9 * 5.0)
+        self.assertEqual(len(self.manager.restock_requests), 3)
+
+        self.assertEqual(self.manager.create_restock_purchase_orders("2024-01-16", "2024-01-23"), [])
+        self.manager.find_item_by_id("P022").restock_items(9)
+        self.manager.find_item_by_id("P022").reserve_items(10)
+        reordered = self.manager.create_restock_purchase_orders("2024-01-17", "2024-01-24")
+        self.assertEqual([item.part_id for item in reordered[0].items], ["P022"])
+        self.assertNotEqual(reordered[0].order_id, orders[1].order_id)
+
+    def test_reserve_batch(self):
+        self.manager.inventory_items.append(self.item)
+        self.manager.add_inventory_item("P002", "Battery", "Desc", "Cat", 30.0, 2, 1, "Sup", [])
+
+        with self.assertRaises(PartNotAvailableException):
+            self.manager.reserve_batch([{'part_id': "P001", 'quantity': 4}, {'part_id': "P999", 'quantity': 1}])
+        with self.assertRaises(PartNotAvailableException):
+            self.manager.reserve_batch([{'part_id': "P001", 'quantity': 4}, {'part_id': "P002", 'quantity': 3}])
+        self.assertEqual(self.item.quantity_in_stock, 10)
+
+        reserved = self.manager.reserve_batch([{'part_id': "P001", 'quantity': 4}, {'part_id': "P002", 'quantity': 2}])
+        self.assertEqual([entry['part'].part_id for entry in reserved], ["P001", "P002"])
+        self.assertEqual(self.manager.calculate_total_inventory_value(), 150.0)
+        self.assertEqual([item.part_id for item in self.manager.get_low_stock_items()], ["P002"])
+
 class TestQualityControlManager(unittest.TestCase):
     def setUp(self):
         self.manager = QualityControlManager()